@@ -480,6 +480,9 @@ class Model:
         log_file = None,
         num_workers: Optional[int] = None,
         initial_solution: Optional[Solution] = None,
+        symmetry_breaking: bool = False,
+        redundant_constraints: bool = False,
+        objective_bound: Optional[float] = None,
         **kwargs,
     ) -> Result:
         """
@@ -501,6 +504,15 @@ class Model:
         initial_solution
             An initial solution to start the solver from. Default is no
             solution.
+        symmetry_breaking
+            Whether to add symmetry breaking constraints for interchangeable
+            machines and identical jobs. Default ``False``.
+        redundant_constraints
+            Whether to add redundant constraints over machine pools and job
+            chains. Default ``False``.
+        objective_bound
+            Lower bound on the objective value, e.g., proven by another
+            solver, which is added as a constraint. Default no bound.
         kwargs
             Additional parameters passed to the solver.
 
@@ -518,5 +530,8 @@ class Model:
             log_file,
             num_workers,
             initial_solution,
+            symmetry_breaking,
+            redundant_constraints,
+            objective_bound,
             **kwargs,
         )
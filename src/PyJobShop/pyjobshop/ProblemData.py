@@ -1,6 +1,7 @@
 from collections import Counter
 from copy import deepcopy
 from dataclasses import dataclass
+from pathlib import Path
 from typing import NamedTuple, Optional, Sequence, TypeVar, Union
 
 from pyjobshop.constants import MAX_VALUE
@@ -857,6 +858,43 @@ class ProblemData:
             objective=objective,
         )
 
+    def save(self, loc: Union[str, Path]):
+        """
+        Saves this problem data instance to the given file, in a versioned
+        binary format of flat arrays. See :meth:`load` to load it again.
+
+        Parameters
+        ----------
+        loc
+            Location of the file to write.
+        """
+        from pyjobshop.serialization import save
+
+        save(self, loc)
+
+    @classmethod
+    def load(cls, loc: Union[str, Path], mmap: bool = True) -> "ProblemData":
+        """
+        Loads a problem data instance that was saved with :meth:`save`.
+
+        Parameters
+        ----------
+        loc
+            Location of the file to read.
+        mmap
+            Whether to memory-map the file, so that the arrays are read
+            directly from the file without copying. If ``False``, the file
+            is read into memory first. Default ``True``.
+
+        Returns
+        -------
+        ProblemData
+            The loaded problem data instance.
+        """
+        from pyjobshop.serialization import load
+
+        return load(loc, mmap)
+
     @property
     def jobs(self) -> list[Job]:
         """
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from .Solution import Solution
@@ -11,6 +11,11 @@ class SolveStatus(str, Enum):
     TIME_LIMIT = "Time-limit"
     UNKNOWN = "Unknown"
 
+    # Runs that did not finish, e.g., because a supervising process stopped
+    # them after exceeding their time or memory limit.
+    KILLED = "Killed"
+    OUT_OF_MEMORY = "Out-of-memory"
+
 
 @dataclass
 class Result:
@@ -31,6 +36,10 @@ class Result:
     best
         The best found solution. If no solution was found, this should be a
         dummy solution.
+    trace
+        The progress of the solver run, as a list of (runtime, objective,
+        lower bound) tuples, one for each improving solution or bound found
+        during the run. Default is an empty trace.
     """
 
     objective: float
@@ -38,6 +47,7 @@ class Result:
     status: SolveStatus
     runtime: float
     best: Solution
+    trace: list[tuple[float, float, float]] = field(default_factory=list)
 
     def __str__(self):
         content = [
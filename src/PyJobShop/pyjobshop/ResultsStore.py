@@ -0,0 +1,154 @@
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Union
+
+from .Result import Result, SolveStatus
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    instance_hash TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    instance TEXT NOT NULL,
+    config TEXT NOT NULL,
+    status TEXT NOT NULL,
+    objective REAL,
+    lower_bound REAL,
+    runtime REAL,
+    trace TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (instance_hash, config_hash)
+)
+"""
+
+
+def instance_hash(loc: Union[str, Path]) -> str:
+    """
+    Returns the hash of the contents of the given instance file. Unlike the
+    file location, the hash does not change when the file is moved.
+    """
+    with open(loc, "rb") as fh:
+        return hashlib.sha1(fh.read()).hexdigest()
+
+
+def config_hash(config: dict[str, Any]) -> str:
+    """
+    Returns the hash of the given configuration dictionary, which must be
+    JSON serializable.
+    """
+    encoded = json.dumps(config, sort_keys=True, default=str).encode()
+    return hashlib.sha1(encoded).hexdigest()
+
+
+class ResultsStore:
+    """
+    Persistent store of benchmark results, backed by an SQLite database.
+    Results are keyed by the instance file contents and the configuration
+    used to solve it, so that interrupted benchmark runs can be resumed by
+    skipping the (instance, configuration) pairs that were already solved.
+
+    Parameters
+    ----------
+    loc
+        Location of the SQLite database file. The database is created if it
+        does not yet exist.
+    """
+
+    def __init__(self, loc: Union[str, Path]):
+        self._conn = sqlite3.connect(loc)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def completed(self, config: dict[str, Any]) -> set[str]:
+        """
+        Returns the hashes of the instances that have a result for the given
+        configuration. Runs that were killed or ran out of memory are not
+        completed, so that they are retried when a benchmark is resumed.
+        """
+        rows = self._conn.execute(
+            "SELECT instance_hash FROM results WHERE config_hash = ?"
+            " AND status NOT IN (?, ?)",
+            (
+                config_hash(config),
+                SolveStatus.KILLED.value,
+                SolveStatus.OUT_OF_MEMORY.value,
+            ),
+        )
+        return {row[0] for row in rows}
+
+    def add(
+        self,
+        instance: str,
+        inst_hash: str,
+        config: dict[str, Any],
+        result: Result,
+    ):
+        """
+        Adds the result of solving the given instance with the given
+        configuration, replacing any existing result. The result is written
+        to disk immediately.
+
+        Parameters
+        ----------
+        instance
+            Name of the instance.
+        inst_hash
+            Hash of the instance file, see :func:`instance_hash`.
+        config
+            The configuration used to solve the instance.
+        result
+            The result of the solver run.
+        """
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO results VALUES ({', '.join('?' * 10)})",
+            (
+                inst_hash,
+                config_hash(config),
+                instance,
+                json.dumps(config, sort_keys=True, default=str),
+                result.status.value,
+                result.objective,
+                result.lower_bound,
+                result.runtime,
+                json.dumps(result.trace),
+                time.time(),
+            ),
+        )
+        self._conn.commit()
+
+    def results(self, config: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Returns the stored results for the given configuration, ordered by
+        instance name. Each result is a dictionary with the instance name and
+        hash, status, objective, lower bound, runtime and trace.
+        """
+        rows = self._conn.execute(
+            "SELECT instance, instance_hash, status, objective, lower_bound,"
+            " runtime, trace FROM results WHERE config_hash = ?"
+            " ORDER BY instance",
+            (config_hash(config),),
+        )
+        keys = ["instance", "instance_hash", "status", "objective"]
+        keys += ["lower_bound", "runtime", "trace"]
+
+        results = []
+        for row in rows:
+            result = dict(zip(keys, row))
+            result["trace"] = [tuple(x) for x in json.loads(result["trace"])]
+            results.append(result)
+
+        return results
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self._conn.close()
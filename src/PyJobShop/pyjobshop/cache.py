@@ -0,0 +1,99 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from pyjobshop.ProblemData import ProblemData
+from pyjobshop.serialization import FORMAT_VERSION
+
+CACHE_DIR_ENV = "PYJOBSHOP_CACHE_DIR"
+"""str: Environment variable with the default cache directory.
+"""
+
+
+def cache_key(loc: Union[str, Path], *args) -> str:
+    """
+    Returns the cache key of the given instance file. The key depends on the
+    resolved file location, its modification time and size, and the given
+    arguments (e.g., the problem variant and parser options), so that the
+    cache entry is invalidated whenever the file is modified.
+
+    Parameters
+    ----------
+    loc
+        Location of the instance file.
+    args
+        Additional arguments that determine how the file is parsed.
+
+    Returns
+    -------
+    str
+        The hexadecimal cache key.
+    """
+    path = Path(loc).resolve()
+    stat = path.stat()
+    parts = [FORMAT_VERSION, path, stat.st_mtime_ns, stat.st_size, *args]
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def cached_read(
+    loc: Union[str, Path],
+    parse: Callable[[], ProblemData],
+    *args,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> ProblemData:
+    """
+    Returns the problem data of the given instance file from the cache, or
+    parses the file and stores the result in the cache if there is no valid
+    cache entry.
+
+    Parameters
+    ----------
+    loc
+        Location of the instance file.
+    parse
+        Function that parses the instance file into problem data.
+    args
+        Additional arguments that determine how the file is parsed. These are
+        part of the cache key.
+    cache_dir
+        Directory of the cache. If ``None``, the directory from the
+        ``PYJOBSHOP_CACHE_DIR`` environment variable is used. If that is not
+        set either, the file is parsed without caching.
+
+    Returns
+    -------
+    ProblemData
+        The problem data instance.
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_DIR_ENV)
+
+    if not cache_dir:
+        return parse()
+
+    cache_dir = Path(cache_dir)
+    entry = cache_dir / f"{cache_key(loc, *args)}.pjs"
+
+    if entry.is_file():
+        try:
+            return ProblemData.load(entry)
+        except (OSError, ValueError, KeyError):
+            pass  # corrupt or outdated entry; parse and overwrite below
+
+    data = parse()
+
+    # Write to a temporary file first and then move it into place, so that
+    # concurrent readers never observe a partially written entry.
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    os.close(fd)
+    try:
+        data.save(tmp)
+        os.replace(tmp, entry)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+    return data
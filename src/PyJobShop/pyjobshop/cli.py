@@ -1,5 +1,6 @@
 import argparse
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from functools import partial
 from multiprocessing import cpu_count
 from pathlib import Path
@@ -7,16 +8,20 @@ from typing import Optional
 
 import numpy as np
 import tomli
-from tqdm.contrib.concurrent import process_map
+from tqdm import tqdm
 
-from pyjobshop import Result, read, solve
+from pyjobshop import ProblemData, Result, read, solve
 from pyjobshop.read import InstanceFormat
+from pyjobshop.ResultsStore import ResultsStore, instance_hash
 
 
 def parse_args():
     parser = argparse.ArgumentParser()
 
-    msg = "Location of the instance file."
+    msg = """
+    Location of the instance file. Files with the .pjs extension are loaded
+    as problem data saved with ProblemData.save().
+    """
     parser.add_argument("instances", nargs="+", type=Path, help=msg)
 
     msg = "File format of the instance."
@@ -65,6 +70,14 @@ def parse_args():
     """
     parser.add_argument("--config_loc", type=Path, help=msg)
 
+    msg = """
+    SQLite database to store the results in. Each result is written as soon
+    as its instance is solved, and instances that already have a result for
+    the same configuration are skipped, so that interrupted runs can be
+    resumed.
+    """
+    parser.add_argument("--results_db", type=Path, help=msg)
+
     return parser.parse_args()
 
 
@@ -117,17 +130,18 @@ def _solve(
     num_workers_per_instance: int,
     config_loc: Optional[Path],
     sol_dir: Optional[Path],
-) -> tuple[str, str, float, float, float]:
+) -> Result:
     """
     Solves a single instance.
     """
-    if config_loc is not None:
-        with open(config_loc, "rb") as fh:
-            params = tomli.load(fh)
+    params = _load_params(config_loc)
+
+    if instance_loc.suffix == ".pjs":
+        # Problem data saved with ``ProblemData.save()``.
+        data = ProblemData.load(instance_loc)
     else:
-        params = {}
+        data = read(instance_loc, instance_format=instance_format)
 
-    data = read(instance_loc, instance_format=instance_format)
     result = solve(
         data=data,
         solver=solver,
@@ -140,13 +154,28 @@ def _solve(
         sol_dir.mkdir(parents=True, exist_ok=True)  # just in case
         write_solution(instance_loc, sol_dir, result)
 
-    return (
-        instance_loc.name,
-        result.status.value,
-        result.objective,
-        result.lower_bound,
-        round(result.runtime, 2),
-    )
+    return result
+
+
+def _load_params(config_loc: Optional[Path]) -> dict:
+    if config_loc is None:
+        return {}
+
+    with open(config_loc, "rb") as fh:
+        return tomli.load(fh)
+
+
+def _config(**kwargs) -> dict:
+    """
+    Returns the settings that determine the results of a benchmark run.
+    """
+    return {
+        "instance_format": kwargs["instance_format"].value,
+        "solver": kwargs["solver"],
+        "time_limit": kwargs["time_limit"],
+        "num_workers_per_instance": kwargs["num_workers_per_instance"],
+        "params": _load_params(kwargs["config_loc"]),
+    }
 
 
 def _check_cpu_usage(
@@ -182,15 +211,55 @@ def benchmark(instances: list[Path], num_parallel_instances: int, **kwargs):
     )
 
     args = sorted(instances)
+    results_db = kwargs.pop("results_db", None)
     func = partial(_solve, **kwargs)
-
-    if len(instances) == 1:
-        results = [func(args[0])]
-    else:
-        results = process_map(
-            func, args, max_workers=num_parallel_instances, unit="instance"
-        )
-
+    results = []
+
+    store = ResultsStore(results_db) if results_db is not None else None
+    if store is not None:
+        # Skip the instances that were already solved with this configuration
+        # in an earlier (possibly interrupted) run, and reuse their results.
+        config = _config(**kwargs)
+        hashes = {loc: instance_hash(loc) for loc in args}
+        completed = store.completed(config) & set(hashes.values())
+        args = [loc for loc in args if hashes[loc] not in completed]
+        results += [
+            (
+                res["instance"],
+                res["status"],
+                res["objective"],
+                res["lower_bound"],
+                round(res["runtime"], 2),
+            )
+            for res in store.results(config)
+            if res["instance_hash"] in completed
+        ]
+
+    try:
+        with ProcessPoolExecutor(num_parallel_instances) as executor:
+            futures = {executor.submit(func, loc): loc for loc in args}
+            done = as_completed(futures)
+
+            for future in tqdm(done, total=len(futures), unit="instance"):
+                loc, result = futures[future], future.result()
+
+                if store is not None:
+                    store.add(loc.name, hashes[loc], config, result)
+
+                results.append(
+                    (
+                        loc.name,
+                        result.status.value,
+                        result.objective,
+                        result.lower_bound,
+                        round(result.runtime, 2),
+                    )
+                )
+    finally:
+        if store is not None:
+            store.close()
+
+    results.sort()
     dtypes = [
         ("inst", "U37"),
         ("status", "U37"),
@@ -1,10 +1,11 @@
 from enum import Enum
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import fjsplib
 import psplib
 
+from .cache import cached_read
 from .Model import Model
 from .ProblemData import ProblemData
 
@@ -25,10 +26,28 @@ def read(
     loc: Union[str, Path],
     instance_format: InstanceFormat = InstanceFormat.FJSPLIB,
     setup: bool = False,
+    cache_dir: Optional[Union[str, Path]] = None,
 ) -> ProblemData:
     """
     Reads an FJSPLIB instance and returns a ProblemData object.
+
+    Parsed instances are cached in ``cache_dir`` (or the directory set by the
+    ``PYJOBSHOP_CACHE_DIR`` environment variable), so that repeated reads of
+    the same unmodified file skip parsing. See
+    :func:`~pyjobshop.cache.cached_read`.
     """
+    return cached_read(
+        loc,
+        lambda: _read(loc, instance_format, setup),
+        InstanceFormat(instance_format).value,
+        setup,
+        cache_dir=cache_dir,
+    )
+
+
+def _read(
+    loc: Union[str, Path], instance_format: InstanceFormat, setup: bool
+) -> ProblemData:
     if instance_format == InstanceFormat.FJSPLIB:
         return _read_fjslib(loc, setup)
     elif instance_format in [
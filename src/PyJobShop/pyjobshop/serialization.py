@@ -0,0 +1,372 @@
+import json
+import math
+import mmap as _mmap
+from pathlib import Path
+from typing import Any, Callable, Iterable, Union
+
+import numpy as np
+
+from pyjobshop.ProblemData import (
+    Consecutive,
+    Constraints,
+    DifferentResources,
+    EndBeforeEnd,
+    EndBeforeStart,
+    IdenticalResources,
+    Job,
+    Machine,
+    Mode,
+    NonRenewable,
+    Objective,
+    ProblemData,
+    Renewable,
+    SetupTime,
+    StartBeforeEnd,
+    StartBeforeStart,
+    Task,
+)
+
+FORMAT_VERSION = 1
+"""int: Version of the array layout written by :func:`save`. Files with a
+different version cannot be loaded.
+"""
+
+_MAGIC = b"PYJOBSHOP"
+_ALIGN = 64
+
+_RESOURCE_KINDS = [Machine, Renewable, NonRenewable]
+_CONSTRAINTS: dict[str, tuple[Callable[[Iterable[int]], Any], int]] = {
+    "start_before_start": (StartBeforeStart._make, 3),
+    "start_before_end": (StartBeforeEnd._make, 3),
+    "end_before_start": (EndBeforeStart._make, 3),
+    "end_before_end": (EndBeforeEnd._make, 3),
+    "identical_resources": (IdenticalResources._make, 2),
+    "different_resources": (DifferentResources._make, 2),
+    "consecutive": (Consecutive._make, 2),
+    "setup_times": (SetupTime._make, 4),
+}
+_OBJECTIVE_WEIGHTS = [
+    "weight_makespan",
+    "weight_tardy_jobs",
+    "weight_total_flow_time",
+    "weight_total_tardiness",
+    "weight_total_earliness",
+    "weight_max_tardiness",
+    "weight_max_lateness",
+]
+
+
+def _offsets(lists: list[list[int]]) -> np.ndarray:
+    return np.cumsum([0] + [len(values) for values in lists], dtype=np.int64)
+
+
+def _flatten(lists: list[list[int]]) -> np.ndarray:
+    return np.fromiter(
+        (value for values in lists for value in values), dtype=np.int64
+    )
+
+
+def _split(offsets: np.ndarray, values: np.ndarray) -> list[list[int]]:
+    flat, bounds = values.tolist(), offsets.tolist()
+    return [flat[frm:to] for frm, to in zip(bounds[:-1], bounds[1:])]
+
+
+def to_arrays(data: ProblemData) -> dict[str, np.ndarray]:
+    """
+    Converts the given problem data into a flat dictionary of arrays.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Dictionary of named arrays, from which :func:`from_arrays` rebuilds
+        the problem data.
+    """
+    jobs, resources, tasks, modes = (
+        data.jobs,
+        data.resources,
+        data.tasks,
+        data.modes,
+    )
+
+    def ints(values) -> np.ndarray:
+        return np.array(list(values), dtype=np.int64)
+
+    def names(items) -> np.ndarray:
+        return np.array([item.name for item in items], dtype=str)
+
+    arrays = {
+        "job_weights": ints(job.weight for job in jobs),
+        "job_release_dates": ints(job.release_date for job in jobs),
+        "job_deadlines": ints(job.deadline for job in jobs),
+        "job_due_dates": ints(
+            -1 if job.due_date is None else job.due_date for job in jobs
+        ),
+        "job_task_offsets": _offsets([job.tasks for job in jobs]),
+        "job_tasks": _flatten([job.tasks for job in jobs]),
+        "job_names": names(jobs),
+        "resource_kinds": ints(
+            _RESOURCE_KINDS.index(type(res)) for res in resources
+        ),
+        "resource_capacities": ints(
+            getattr(res, "capacity", 0) for res in resources
+        ),
+        "resource_names": names(resources),
+        "task_jobs": ints(
+            -1 if task.job is None else task.job for task in tasks
+        ),
+        "task_earliest_starts": ints(task.earliest_start for task in tasks),
+        "task_latest_starts": ints(task.latest_start for task in tasks),
+        "task_earliest_ends": ints(task.earliest_end for task in tasks),
+        "task_latest_ends": ints(task.latest_end for task in tasks),
+        "task_fixed_durations": ints(task.fixed_duration for task in tasks),
+        "task_optionals": ints(task.optional for task in tasks),
+        "task_names": names(tasks),
+        "mode_tasks": ints(mode.task for mode in modes),
+        "mode_durations": ints(mode.duration for mode in modes),
+        "mode_resource_offsets": _offsets([mode.resources for mode in modes]),
+        "mode_resources": _flatten([mode.resources for mode in modes]),
+        "mode_demands": _flatten([mode.demands for mode in modes]),
+        "objective": ints(
+            getattr(data.objective, weight) for weight in _OBJECTIVE_WEIGHTS
+        ),
+    }
+
+    for name, (_, num_fields) in _CONSTRAINTS.items():
+        values = getattr(data.constraints, name)
+        arrays[name] = ints(values).reshape(-1, num_fields)
+
+    if data.flows is not None:
+        arrays["flow_tasks"] = ints(data.flows.keys())
+        arrays["flow_roles"] = np.array(list(data.flows.values()), dtype=str)
+
+    return arrays
+
+
+def from_arrays(arrays, validate: bool = True) -> ProblemData:
+    """
+    Rebuilds the problem data from arrays created by :func:`to_arrays`.
+
+    Parameters
+    ----------
+    arrays
+        Mapping of array names to arrays.
+    validate
+        Whether to validate the problem data. Default ``True``.
+
+    Returns
+    -------
+    ProblemData
+        The problem data instance.
+    """
+    job_tasks = _split(arrays["job_task_offsets"], arrays["job_tasks"])
+    jobs = [
+        Job(weight, release, deadline, None if due < 0 else due, tasks, name)
+        for weight, release, deadline, due, tasks, name in zip(
+            arrays["job_weights"].tolist(),
+            arrays["job_release_dates"].tolist(),
+            arrays["job_deadlines"].tolist(),
+            arrays["job_due_dates"].tolist(),
+            job_tasks,
+            arrays["job_names"].tolist(),
+        )
+    ]
+
+    resources = []
+    for kind, capacity, name in zip(
+        arrays["resource_kinds"].tolist(),
+        arrays["resource_capacities"].tolist(),
+        arrays["resource_names"].tolist(),
+    ):
+        cls = _RESOURCE_KINDS[kind]
+        resource = cls(name) if cls is Machine else cls(capacity, name)
+        resources.append(resource)
+
+    tasks = [
+        Task(
+            None if job < 0 else job,
+            earliest_start,
+            latest_start,
+            earliest_end,
+            latest_end,
+            bool(fixed),
+            bool(opt),
+            name,
+        )
+        for (
+            job,
+            earliest_start,
+            latest_start,
+            earliest_end,
+            latest_end,
+            fixed,
+            opt,
+            name,
+        ) in zip(
+            arrays["task_jobs"].tolist(),
+            arrays["task_earliest_starts"].tolist(),
+            arrays["task_latest_starts"].tolist(),
+            arrays["task_earliest_ends"].tolist(),
+            arrays["task_latest_ends"].tolist(),
+            arrays["task_fixed_durations"].tolist(),
+            arrays["task_optionals"].tolist(),
+            arrays["task_names"].tolist(),
+        )
+    ]
+
+    offsets = arrays["mode_resource_offsets"]
+    modes = [
+        Mode(task, resources_, duration, demands)
+        for task, duration, resources_, demands in zip(
+            arrays["mode_tasks"].tolist(),
+            arrays["mode_durations"].tolist(),
+            _split(offsets, arrays["mode_resources"]),
+            _split(offsets, arrays["mode_demands"]),
+        )
+    ]
+
+    constraints = Constraints(
+        **{
+            name: list(map(make, arrays[name].tolist()))
+            for name, (make, _) in _CONSTRAINTS.items()
+        }
+    )
+
+    flows = None
+    if "flow_tasks" in arrays:
+        flows = dict(
+            zip(arrays["flow_tasks"].tolist(), arrays["flow_roles"].tolist())
+        )
+
+    weights = arrays["objective"].tolist()
+    objective = Objective(**dict(zip(_OBJECTIVE_WEIGHTS, weights)))
+
+    if validate:
+        return ProblemData(
+            jobs, resources, tasks, modes, constraints, flows, objective
+        )
+
+    # Bypass ``ProblemData.__init__``, which validates the (possibly large)
+    # data again. This is only safe for data that was validated before.
+    data = ProblemData.__new__(ProblemData)
+    data._jobs = jobs
+    data._resources = resources
+    data._tasks = tasks
+    data._modes = modes
+    data._constraints = constraints
+    data._flows = flows
+    data._objective = objective
+    return data
+
+
+def save_arrays(loc: Union[str, Path], arrays: dict[str, np.ndarray]):
+    """
+    Saves the arrays to the given file. The file consists of a magic string,
+    the length of the JSON header, the header with the format version and
+    each array's dtype, shape and offset, and then the raw array data. Each
+    array is aligned to 64 bytes, so that it can be memory-mapped.
+
+    Parameters
+    ----------
+    loc
+        Location of the file to write.
+    arrays
+        Dictionary of named arrays.
+    """
+    arrays = {name: np.ascontiguousarray(arr) for name, arr in arrays.items()}
+    layout = {}
+    offset = 0
+
+    for name, arr in arrays.items():
+        layout[name] = [arr.dtype.str, arr.shape, offset]
+        offset += -(-arr.nbytes // _ALIGN) * _ALIGN
+
+    header = {"version": FORMAT_VERSION, "arrays": layout}
+    encoded = json.dumps(header).encode()
+    padding = -(len(_MAGIC) + 8 + len(encoded)) % _ALIGN
+
+    with open(loc, "wb") as fh:
+        fh.write(_MAGIC)
+        fh.write(len(encoded).to_bytes(8, "little"))
+        fh.write(encoded + b" " * padding)
+
+        for arr in arrays.values():
+            fh.write(arr.tobytes())
+            fh.write(b"\0" * (-arr.nbytes % _ALIGN))
+
+
+def load_arrays(
+    loc: Union[str, Path], mmap: bool = True
+) -> dict[str, np.ndarray]:
+    """
+    Loads the arrays saved with :func:`save_arrays`. The returned arrays are
+    read-only views into the file's contents; no data is copied.
+
+    Parameters
+    ----------
+    loc
+        Location of the file to read.
+    mmap
+        Whether to memory-map the file. If ``False``, the file is read into
+        memory instead. Default ``True``.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Dictionary of named arrays.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a problem data file, or was written with another
+        format version.
+    """
+    buffer: Union[bytes, _mmap.mmap]
+
+    with open(loc, "rb") as fh:
+        if mmap:
+            buffer = _mmap.mmap(fh.fileno(), 0, access=_mmap.ACCESS_READ)
+        else:
+            buffer = fh.read()
+
+    pos = len(_MAGIC)
+    if buffer[:pos] != _MAGIC:
+        raise ValueError(f"{loc} is not a problem data file.")
+
+    size = int.from_bytes(buffer[pos : pos + 8], "little")
+    header = json.loads(buffer[pos + 8 : pos + 8 + size])
+
+    if header["version"] != FORMAT_VERSION:
+        msg = f"Unsupported format version {header['version']} in {loc}."
+        raise ValueError(msg)
+
+    start = pos + 8 + size
+    start += -start % _ALIGN
+    arrays = {}
+
+    for name, (dtype, shape, offset) in header["arrays"].items():
+        shape = tuple(shape)
+        arr = np.frombuffer(buffer, dtype, math.prod(shape), start + offset)
+        arrays[name] = arr.reshape(shape)
+
+    return arrays
+
+
+def save(data: ProblemData, loc: Union[str, Path]):
+    """
+    Saves the problem data to the given file. See :meth:`ProblemData.save`.
+    """
+    save_arrays(loc, to_arrays(data))
+
+
+def load(loc: Union[str, Path], mmap: bool = True) -> ProblemData:
+    """
+    Loads problem data from the given file. See :meth:`ProblemData.load`.
+    """
+    # Saved data was validated when it was created, so it is not validated
+    # again here.
+    return from_arrays(load_arrays(loc, mmap), validate=False)
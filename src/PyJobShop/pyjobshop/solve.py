@@ -14,6 +14,9 @@ def solve(
     log_file = None,
     num_workers: Optional[int] = None,
     initial_solution: Optional[Solution] = None,
+    symmetry_breaking: bool = False,
+    redundant_constraints: bool = False,
+    objective_bound: Optional[float] = None,
     **kwargs,
 ) -> Result:
     """
@@ -35,6 +38,15 @@ def solve(
         number of available CPU cores.
     initial_solution
         An initial solution to start the solver from. Default is no solution.
+    symmetry_breaking
+        Whether to add symmetry breaking constraints for interchangeable
+        machines and identical jobs. Default ``False``.
+    redundant_constraints
+        Whether to add redundant constraints over machine pools and job
+        chains. Default ``False``.
+    objective_bound
+        Lower bound on the objective value, e.g., proven by another solver,
+        which is added as a constraint. Default no bound.
     kwargs
         Additional parameters passed to the solver.
 
@@ -53,7 +65,9 @@ def solve(
         raise ValueError(f"Unknown solver choice: {solver}.")
 
     if solver == "ortools":
-        ortools = ORToolsSolver(data)
+        ortools = ORToolsSolver(
+            data, symmetry_breaking, redundant_constraints, objective_bound
+        )
         return ortools.solve(
             time_limit,
             display,
@@ -67,7 +81,9 @@ def solve(
             Solver as CPOptimizerSolver,
         )
 
-        cpoptimizer = CPOptimizerSolver(data)
+        cpoptimizer = CPOptimizerSolver(
+            data, symmetry_breaking, redundant_constraints, objective_bound
+        )
         return cpoptimizer.solve(
             time_limit,
             display,
@@ -230,6 +230,52 @@ class Constraints:
                     model.add(flow_in == cpo.presence_of(self._task_vars[t]))
                     model.add(flow_out == cpo.presence_of(self._task_vars[t]))
 
+    def _symmetry_breaking_constraints(self):
+        """
+        Creates symmetry breaking constraints. Interchangeable machines are
+        ordered by non-increasing workload, and identical jobs are ordered by
+        non-decreasing start time.
+        """
+        model, data = self._model, self._data
+        res2modes = utils.resource2modes(data)
+
+        for machines in utils.identical_machines(data):
+            workloads = [
+                cpo.sum(
+                    cpo.presence_of(self._mode_vars[mode])
+                    * data.modes[mode].duration
+                    for mode in res2modes[machine]
+                )
+                for machine in machines
+            ]
+
+            for workload1, workload2 in zip(workloads[:-1], workloads[1:]):
+                model.add(workload1 >= workload2)
+
+        for jobs in utils.identical_jobs(data):
+            for job1, job2 in zip(jobs[:-1], jobs[1:]):
+                start1 = cpo.start_of(self._job_vars[job1])
+                start2 = cpo.start_of(self._job_vars[job2])
+                model.add(start1 <= start2)
+
+    def _redundant_constraints(self):
+        """
+        Creates redundant constraints that strengthen propagation. For each
+        machine pool, a cumulative constraint limits the number of pool tasks
+        processed at the same time to the number of machines in the pool. For
+        each job, the job duration is at least the length of its longest
+        chain of mandatory tasks.
+        """
+        model, data = self._model, self._data
+
+        for machines, tasks in utils.machine_pools(data):
+            pulses = [cpo.pulse(self._task_vars[task], 1) for task in tasks]
+            model.add(model.sum(pulses) <= len(machines))
+
+        for idx, length in enumerate(utils.job_chain_lengths(data)):
+            if length > 0:
+                model.add(cpo.length_of(self._job_vars[idx]) >= length)
+
     def add_constraints(self):
         """
         Adds all the constraints to the CP model.
@@ -243,3 +289,15 @@ class Constraints:
         self._identical_and_different_resource_constraints()
         self._consecutive_constraints()
         self._flow_constraints()
+
+    def add_symmetry_breaking_constraints(self):
+        """
+        Adds the symmetry breaking constraints to the CP model.
+        """
+        self._symmetry_breaking_constraints()
+
+    def add_redundant_constraints(self):
+        """
+        Adds the redundant constraints to the CP model.
+        """
+        self._redundant_constraints()
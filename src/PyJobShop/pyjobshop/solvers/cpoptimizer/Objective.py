@@ -1,3 +1,5 @@
+from typing import Optional
+
 import docplex.cp.modeler as cpo
 from docplex.cp.model import CpoExpr, CpoModel
 
@@ -19,6 +21,7 @@ class Objective:
         self._data = data
         self._task_vars = variables.task_vars
         self._job_vars = variables.job_vars
+        self._expr: Optional[CpoExpr] = None
 
     def _makespan_expr(self) -> CpoExpr:
         """
@@ -104,11 +107,18 @@ class Objective:
             (objective.weight_max_lateness, self._max_lateness_expr),
         ]
         exprs = [weight * expr() for weight, expr in items if weight > 0]
-        return cpo.minimize(cpo.sum(exprs))
+        return cpo.sum(exprs)
 
     def add_objective(self):
         """
         Adds the objective expression to the CP model.
         """
-        obj_expr = self._objective_expr(self._data.objective)
-        self._model.add(obj_expr)
+        self._expr = self._objective_expr(self._data.objective)
+        self._model.add(cpo.minimize(self._expr))
+
+    def add_objective_bound(self, bound: float):
+        """
+        Adds a lower bound on the objective expression to the CP model.
+        """
+        assert self._expr is not None, "Objective must be added first."
+        self._model.add(self._expr >= bound)
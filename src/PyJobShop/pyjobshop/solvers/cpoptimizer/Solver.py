@@ -1,7 +1,15 @@
-from typing import Optional
+import sys
+import time
+from typing import TYPE_CHECKING, Optional
 
 from docplex.cp.model import CpoModel
 from docplex.cp.solution import CpoSolveResult
+from docplex.cp.solver.cpo_callback import (
+    EVENT_OBJ_BOUND,
+    EVENT_SOLUTION,
+    CpoCallback,
+)
+from docplex.cp.solver.solver import CpoSolver
 
 from pyjobshop.ProblemData import ProblemData
 from pyjobshop.Result import Result, SolveStatus
@@ -11,6 +19,36 @@ from .Constraints import Constraints
 from .Objective import Objective
 from .Variables import Variables
 
+if TYPE_CHECKING:
+    from .SolverPool import SolverPool
+
+
+class _TraceCallback(CpoCallback):
+    """
+    Records the objective value and bound of each improving solution, and
+    each improving bound, found during the solver run.
+    """
+
+    def __init__(self):
+        self.trace: list[tuple[float, float, float]] = []
+        self._start = time.perf_counter()
+        self._objective = float("inf")
+        self._bound = -float("inf")
+
+    def invoke(self, solver, event, sres):
+        if event not in (EVENT_SOLUTION, EVENT_OBJ_BOUND):
+            return
+
+        objectives = sres.get_objective_values()
+        bounds = sres.get_objective_bounds()
+        objective = objectives[0] if objectives else self._objective
+        bound = bounds[0] if bounds else self._bound
+
+        if (objective, bound) != (self._objective, self._bound):
+            self._objective, self._bound = objective, bound
+            runtime = time.perf_counter() - self._start
+            self.trace.append((runtime, objective, bound))
+
 
 class Solver:
     """
@@ -20,12 +58,29 @@ class Solver:
     ----------
     data
         The problem data instance.
+    symmetry_breaking
+        Whether to add symmetry breaking constraints for interchangeable
+        machines and identical jobs. Default ``False``.
+    redundant_constraints
+        Whether to add redundant constraints over machine pools and job
+        chains. Default ``False``.
+    objective_bound
+        Lower bound on the objective value, e.g., proven by another solver,
+        which is added as a constraint. Default no bound.
     """
 
-    def __init__(self, data: ProblemData):
+    def __init__(
+        self,
+        data: ProblemData,
+        symmetry_breaking: bool = False,
+        redundant_constraints: bool = False,
+        objective_bound: Optional[float] = None,
+    ):
         self._data = data
 
         self._model = CpoModel()
+        self._cp_solver: Optional[CpoSolver] = None
+        self._cp_params: dict = {}
         self._variables = Variables(self._model, data)
         self._constraints = Constraints(self._model, data, self._variables)
         self._objective = Objective(self._model, data, self._variables)
@@ -33,6 +88,15 @@ class Solver:
         self._constraints.add_constraints()
         self._objective.add_objective()
 
+        if symmetry_breaking:
+            self._constraints.add_symmetry_breaking_constraints()
+
+        if redundant_constraints:
+            self._constraints.add_redundant_constraints()
+
+        if objective_bound is not None:
+            self._objective.add_objective_bound(objective_bound)
+
     def _get_solve_status(self, status: str) -> SolveStatus:
         if status == "Optimal":
             return SolveStatus.OPTIMAL
@@ -47,26 +111,58 @@ class Solver:
         """
         Converts an CpoSolveResult object to a solution.
         """
-        tasks = {}
-
-        for var in result.get_all_var_solutions():  # type: ignore
-            name = var.get_name()
-
-            # Scheduled tasks are inferred from present mode variables.
-            if name.startswith("M") and var.is_present():
-                mode, task = map(int, name[1:].split("_"))
-                resources = self._data.modes[mode].resources
-                start = var.start
-                end = var.end
-                tasks[task] = TaskData(
-                    mode, resources, start, end, present=True
+        tasks = [
+            TaskData(idx, [], 0, 0, present=False)
+            for idx in range(self._data.num_tasks)
+        ]
+
+        # Scheduled tasks are inferred from present mode variables, which are
+        # looked up directly by variable rather than by parsing their names.
+        for idx, var in enumerate(self._variables.mode_vars):
+            var_sol = result.get_var_solution(var)
+
+            if var_sol is not None and var_sol.is_present():
+                mode = self._data.modes[idx]
+                start, end = var_sol.start, var_sol.end
+                tasks[mode.task] = TaskData(
+                    idx, mode.resources, start, end, present=True
                 )
 
-        for idx in range(self._data.num_tasks):
-            if idx not in tasks:
-                tasks[idx] = TaskData(idx, [], 0, 0, present=False)
+        return Solution(tasks)
+
+    def _get_cp_solver(
+        self, params: dict, initial_solution: Optional[Solution]
+    ) -> CpoSolver:
+        """
+        Returns the CP Optimizer solver for the given parameters. A solver
+        that was kept alive by the previous solve is reused if the parameters
+        did not change and no new initial solution is given, so that the
+        model is not serialized and sent to the solver process again.
+        """
+        reuse = (
+            self._cp_solver is not None
+            and initial_solution is None
+            and params == self._cp_params
+        )
+
+        if not reuse:
+            if self._cp_solver is not None:
+                self._cp_solver.end()
+
+            self._cp_solver = CpoSolver(self._model, **params)
+            self._cp_params = params
 
-        return Solution([tasks[idx] for idx in range(self._data.num_tasks)])
+        return self._cp_solver  # type: ignore
+
+    def close(self):
+        """
+        Ends the CP Optimizer process that was kept alive for subsequent
+        solves, if any.
+        """
+        if self._cp_solver is not None:
+            self._cp_solver.end()
+            self._cp_solver = None
+            self._cp_params = {}
 
     def solve(
         self,
@@ -75,6 +171,8 @@ class Solver:
         log_file = None,
         num_workers: Optional[int] = None,
         initial_solution: Optional[Solution] = None,
+        pool: Optional["SolverPool"] = None,
+        keep_alive: bool = False,
         **kwargs,
     ) -> Result:
         """
@@ -91,6 +189,13 @@ class Solver:
             available CPU cores are used.
         initial_solution
             Initial solution to start the solver from. Default is no solution.
+        pool
+            Optional pool of CP Optimizer processes to solve on. If not given,
+            the model is solved by a dedicated process.
+        keep_alive
+            Whether to keep the dedicated process alive after solving, so
+            that subsequent solves with the same parameters reuse it. The
+            process must then be ended with :meth:`close`. Default ``False``.
         kwargs
             Additional parameters passed to the solver.
 
@@ -110,14 +215,30 @@ class Solver:
         }
         params.update(kwargs)  # this will override existing parameters!
 
-        from docplex.cp.config import context
-        if log_file:
-            context.solver.log_output = log_file
+        # The log output is set per solver rather than on the global docplex
+        # context, so that concurrent solves can log to different files.
+        params["log_output"] = log_file if log_file else sys.stdout
+
+        # Callbacks are registered with the solver process when the model is
+        # sent to it, so the callback must be added before solving.
+        callback = _TraceCallback()
+
+        if pool is not None:
+            with pool.cpo_solver(self._model, **params) as cp_solver:
+                cp_solver.add_callback(callback)
+                cp_result: CpoSolveResult = cp_solver.solve()  # type: ignore
         else:
-            import sys
-            context.solver.log_output = sys.stdout
+            cp_solver = self._get_cp_solver(params, initial_solution)
+            cp_solver.add_callback(callback)
+
+            try:
+                cp_result = cp_solver.solve()
+            finally:
+                cp_solver.remove_callback(callback)
+
+                if not keep_alive:
+                    self.close()
 
-        cp_result: CpoSolveResult = self._model.solve(**params)  # type: ignore
         status = cp_result.get_solve_status()
 
         if status in ["Optimal", "Feasible"]:
@@ -134,4 +255,5 @@ class Solver:
             status=self._get_solve_status(status),
             runtime=cp_result.get_solve_time(),
             best=solution,
+            trace=callback.trace,
         )
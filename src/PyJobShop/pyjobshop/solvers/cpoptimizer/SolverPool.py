@@ -0,0 +1,230 @@
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from docplex.cp.config import context
+from docplex.cp.model import CpoModel
+from docplex.cp.solver.solver import CpoSolver, CpoSolverAgent
+from docplex.cp.solver.solver_local import CpoSolverLocal
+from docplex.cp.utils import Context
+from docplex.version import docplex_version_major, docplex_version_minor
+
+from pyjobshop.ProblemData import ProblemData
+from pyjobshop.Result import Result
+from pyjobshop.Solution import Solution
+
+# Solver agent that does not start a CP Optimizer process. Solvers created
+# with this agent are attached to one of the pooled processes instead.
+_DETACHED_AGENT = "pyjobshop_detached"
+context.solver[_DETACHED_AGENT] = Context(
+    class_name="docplex.cp.solver.solver.CpoSolverAgent"
+)
+
+
+# The docplex versions whose solver agent internals _PooledAgent relies on.
+_DOCPLEX_VERSIONS = ((2, 28), (2, 32))
+
+
+def _check_docplex_version(version: tuple[int, int]):
+    """
+    Raises a RuntimeError if the pooled agent was not written against the
+    given docplex (major, minor) version.
+    """
+    low, high = _DOCPLEX_VERSIONS
+
+    if not low <= version <= high:
+        supported = f"{low[0]}.{low[1]} to {high[0]}.{high[1]}"
+        found = f"{version[0]}.{version[1]}"
+        msg = f"SolverPool supports docplex {supported}, found {found}."
+        raise RuntimeError(msg)
+
+
+class _PooledAgent(CpoSolverLocal):
+    """
+    Local CP Optimizer agent whose process is kept alive when the solver it
+    is attached to ends, so that the process can be reused by other solvers.
+    """
+
+    # Slot of the docplex agent base class, set when the process starts.
+    version_info: dict
+
+    def attach(self, solver: CpoSolver):
+        """
+        Attaches this agent to the given solver. The solver's model is sent
+        to the running process on the first solve.
+
+        Only the state of the base agent is reset, by its constructor; the
+        state of the running process is kept. Written against docplex
+        2.28-2.32, see the version bounds in ``pyproject.toml``.
+        """
+        version_info = self.version_info
+        CpoSolverAgent.__init__(self, solver, solver.context.solver.local)
+
+        self.version_info = version_info
+        self.process_infos.update(version_info)
+
+        solver.agent = self
+        solver.abort_supported = self._is_abort_search_supported()
+
+    def end(self):
+        # Called when the attached solver ends. Only detach from the solver;
+        # the process is terminated by ``terminate()``.
+        self.solver = None
+
+    def terminate(self):
+        """
+        Terminates the CP Optimizer process.
+        """
+        super().end()
+
+
+class SolverPool:
+    """
+    Pool of long-lived CP Optimizer processes. Solving many (small) instances
+    through a pool avoids starting a new CP Optimizer process for every
+    instance. The pool is thread-safe: up to ``num_processes`` instances can
+    be solved concurrently from different threads.
+
+    Parameters
+    ----------
+    num_processes
+        The maximum number of CP Optimizer processes. Processes are started
+        when they are first needed. Default 1.
+    """
+
+    def __init__(self, num_processes: int = 1):
+        if num_processes < 1:
+            raise ValueError("Number of processes must be at least 1.")
+
+        _check_docplex_version((docplex_version_major, docplex_version_minor))
+
+        self._num_processes = num_processes
+        self._agents: list[_PooledAgent] = []
+        self._idle: queue.SimpleQueue[_PooledAgent] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "SolverPool":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        if hasattr(self, "_lock"):
+            self.close()
+
+    @property
+    def num_processes(self) -> int:
+        """
+        Returns the maximum number of CP Optimizer processes.
+        """
+        return self._num_processes
+
+    def _acquire(self, solver: CpoSolver) -> _PooledAgent:
+        """
+        Returns an idle agent, starting a new process if the pool is not yet
+        full. Blocks until an agent is available otherwise.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Solver pool is closed.")
+
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            if len(self._agents) < self._num_processes:
+                agent = _PooledAgent(solver, solver.context.solver.local)
+                self._agents.append(agent)
+                return agent
+
+        return self._idle.get()
+
+    @contextmanager
+    def cpo_solver(self, model: CpoModel, **kwargs) -> Iterator[CpoSolver]:
+        """
+        Creates a CP Optimizer solver for the given model that runs on one of
+        the pooled processes. The process is returned to the pool when the
+        context exits. Repeated solves on the returned solver reuse the model
+        that was already sent to the process.
+
+        Parameters
+        ----------
+        model
+            The CP Optimizer model to solve.
+        kwargs
+            Solver parameters and context attributes, as accepted by
+            ``docplex.cp.solver.solver.CpoSolver``.
+        """
+        solver = CpoSolver(model, agent=_DETACHED_AGENT, **kwargs)
+        agent = self._acquire(solver)
+        agent.attach(solver)
+
+        try:
+            yield solver
+        finally:
+            solver.end()
+            crashed = agent.process is None or agent.process.poll() is not None
+
+            if self._closed or crashed:
+                agent.terminate()
+
+                with self._lock:
+                    self._agents.remove(agent)
+            else:
+                self._idle.put(agent)
+
+    def solve(
+        self,
+        data: ProblemData,
+        time_limit: float = float("inf"),
+        display: bool = False,
+        log_file=None,
+        num_workers: Optional[int] = None,
+        initial_solution: Optional[Solution] = None,
+        symmetry_breaking: bool = False,
+        redundant_constraints: bool = False,
+        objective_bound: Optional[float] = None,
+        **kwargs,
+    ) -> Result:
+        """
+        Solves the given problem data instance on one of the pooled
+        processes. See :func:`pyjobshop.solve` for the parameters.
+
+        Returns
+        -------
+        Result
+            A Result object containing the best found solution and additional
+            information about the solver run.
+        """
+        from .Solver import Solver
+
+        solver = Solver(
+            data, symmetry_breaking, redundant_constraints, objective_bound
+        )
+        return solver.solve(
+            time_limit,
+            display,
+            log_file,
+            num_workers,
+            initial_solution,
+            pool=self,
+            **kwargs,
+        )
+
+    def close(self):
+        """
+        Terminates all idle CP Optimizer processes. Processes that are still
+        in use are terminated when they are returned to the pool.
+        """
+        with self._lock:
+            self._closed = True
+
+        while True:
+            try:
+                self._idle.get_nowait().terminate()
+            except queue.Empty:
+                break
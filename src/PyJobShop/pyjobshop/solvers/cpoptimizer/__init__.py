@@ -1,5 +1,6 @@
 try:
     from .Solver import Solver as Solver
+    from .SolverPool import SolverPool as SolverPool
 except ModuleNotFoundError:
     msg = (
         "CP Optimizer solver requires the 'docplex' package. "
@@ -329,6 +329,50 @@ class Constraints:
                     expr = var1.end + setup <= var2.start
                     model.add(expr).only_enforce_if(arcs[idx1, idx2])
 
+    def _symmetry_breaking_constraints(self):
+        """
+        Creates symmetry breaking constraints. Interchangeable machines are
+        ordered by non-increasing workload, and identical jobs are ordered by
+        non-decreasing start time.
+        """
+        model, data = self._model, self._data
+        res2modes = utils.resource2modes(data)
+
+        for machines in utils.identical_machines(data):
+            workloads = []
+            for machine in machines:
+                modes = res2modes[machine]
+                presences = [self._mode_vars[mode].present for mode in modes]
+                durations = [data.modes[mode].duration for mode in modes]
+                workloads.append(LinearExpr.weighted_sum(presences, durations))
+
+            for workload1, workload2 in zip(workloads[:-1], workloads[1:]):
+                model.add(workload1 >= workload2)
+
+        for jobs in utils.identical_jobs(data):
+            for job1, job2 in zip(jobs[:-1], jobs[1:]):
+                job_var1 = self._job_vars[job1]
+                job_var2 = self._job_vars[job2]
+                model.add(job_var1.start <= job_var2.start)
+
+    def _redundant_constraints(self):
+        """
+        Creates redundant constraints that strengthen propagation. For each
+        machine pool, a cumulative constraint limits the number of pool tasks
+        processed at the same time to the number of machines in the pool. For
+        each job, the job duration is at least the length of its longest
+        chain of mandatory tasks.
+        """
+        model, data = self._model, self._data
+
+        for machines, tasks in utils.machine_pools(data):
+            intervals = [self._task_vars[task].interval for task in tasks]
+            model.add_cumulative(intervals, [1] * len(tasks), len(machines))
+
+        for idx, length in enumerate(utils.job_chain_lengths(data)):
+            if length > 0:
+                model.add(self._job_vars[idx].duration >= length)
+
     def add_constraints(self):
         """
         Adds all the constraints to the CP model.
@@ -346,3 +390,15 @@ class Constraints:
 
         # From here onwards we know which sequence constraints are active.
         self._circuit_constraints()
+
+    def add_symmetry_breaking_constraints(self):
+        """
+        Adds the symmetry breaking constraints to the CP model.
+        """
+        self._symmetry_breaking_constraints()
+
+    def add_redundant_constraints(self):
+        """
+        Adds the redundant constraints to the CP model.
+        """
+        self._redundant_constraints()
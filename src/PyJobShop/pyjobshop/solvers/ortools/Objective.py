@@ -1,3 +1,6 @@
+import math
+from typing import Optional
+
 from ortools.sat.python.cp_model import (
     CpModel,
     LinearExpr,
@@ -23,6 +26,7 @@ class Objective:
         self._data = data
         self._task_vars = variables.task_vars
         self._job_vars = variables.job_vars
+        self._expr: Optional[LinearExprT] = None
 
     def _makespan_expr(self) -> LinearExprT:
         """
@@ -165,5 +169,13 @@ class Objective:
         """
         Adds the objective expression to the CP model.
         """
-        obj_expr = self._objective_expr(self._data.objective)
-        self._model.minimize(obj_expr)
+        self._expr = self._objective_expr(self._data.objective)
+        self._model.minimize(self._expr)
+
+    def add_objective_bound(self, bound: float):
+        """
+        Adds a lower bound on the objective expression to the CP model. The
+        objective is integral, so the bound is rounded up.
+        """
+        assert self._expr is not None, "Objective must be added first."
+        self._model.add(self._expr >= math.ceil(bound))
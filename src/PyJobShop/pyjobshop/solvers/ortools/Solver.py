@@ -1,8 +1,11 @@
+import time
 from typing import Optional
 
+import numpy as np
 from ortools.sat.python.cp_model import (
     CpModel,
     CpSolver,
+    CpSolverSolutionCallback,
 )
 
 from pyjobshop.ProblemData import ProblemData
@@ -14,6 +17,33 @@ from .Objective import Objective
 from .Variables import Variables
 
 
+class _TraceCallback(CpSolverSolutionCallback):
+    """
+    Records the objective value and bound of each improving solution, and
+    each improving bound, found during the solver run.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.trace: list[tuple[float, float, float]] = []
+        self._start = time.perf_counter()
+        self._objective = float("inf")
+        self._bound = -float("inf")
+
+    def on_solution_callback(self):
+        self._objective = self.objective_value
+        self._bound = self.best_objective_bound
+        self._record()
+
+    def on_bound(self, bound: float):
+        self._bound = bound
+        self._record()
+
+    def _record(self):
+        runtime = time.perf_counter() - self._start
+        self.trace.append((runtime, self._objective, self._bound))
+
+
 class Solver:
     """
     Wrapper around the OR-Tools CP model.
@@ -22,9 +52,24 @@ class Solver:
     ----------
     data
         The problem data instance.
+    symmetry_breaking
+        Whether to add symmetry breaking constraints for interchangeable
+        machines and identical jobs. Default ``False``.
+    redundant_constraints
+        Whether to add redundant constraints over machine pools and job
+        chains. Default ``False``.
+    objective_bound
+        Lower bound on the objective value, e.g., proven by another solver,
+        which is added as a constraint. Default no bound.
     """
 
-    def __init__(self, data: ProblemData):
+    def __init__(
+        self,
+        data: ProblemData,
+        symmetry_breaking: bool = False,
+        redundant_constraints: bool = False,
+        objective_bound: Optional[float] = None,
+    ):
         self._data = data
 
         self._model = CpModel()
@@ -35,6 +80,23 @@ class Solver:
         self._constraints.add_constraints()
         self._objective.add_objective()
 
+        if symmetry_breaking:
+            self._constraints.add_symmetry_breaking_constraints()
+
+        if redundant_constraints:
+            self._constraints.add_redundant_constraints()
+
+        if objective_bound is not None:
+            self._objective.add_objective_bound(objective_bound)
+
+        # Indices of the start, end and presence variables of each mode in
+        # the CP-SAT model, used to extract solutions in bulk.
+        indices = [
+            (var.start.index, var.end.index, var.present.index)
+            for var in self._variables.mode_vars
+        ]
+        self._mode_indices = np.array(indices, dtype=int).reshape(-1, 3)
+
     def _get_solve_status(self, status: str):
         if status == "OPTIMAL":
             return SolveStatus.OPTIMAL
@@ -51,22 +113,25 @@ class Solver:
         """
         Converts a result from the OR-Tools CP solver to a Solution object.
         """
-        tasks = {}
-
-        for idx, var in enumerate(self._variables.mode_vars):
-            if cp_solver.value(var.present):
-                start = cp_solver.value(var.start)
-                end = cp_solver.value(var.end)
-                mode = self._data.modes[idx]
-                tasks[mode.task] = TaskData(
-                    idx, mode.resources, start, end, present=True
-                )
-
-        for idx in range(self._data.num_tasks):
-            if idx not in tasks:
-                tasks[idx] = TaskData(idx, [], 0, 0, present=False)
-
-        return Solution([tasks[idx] for idx in range(self._data.num_tasks)])
+        values = np.asarray(cp_solver.response_proto.solution, dtype=int)
+        starts, ends, presents = values[self._mode_indices].T
+
+        tasks = [
+            TaskData(idx, [], 0, 0, present=False)
+            for idx in range(self._data.num_tasks)
+        ]
+
+        for idx in np.flatnonzero(presents).tolist():
+            mode = self._data.modes[idx]
+            tasks[mode.task] = TaskData(
+                idx,
+                mode.resources,
+                int(starts[idx]),
+                int(ends[idx]),
+                present=True,
+            )
+
+        return Solution(tasks)
 
     def solve(
         self,
@@ -113,6 +178,17 @@ class Solver:
 
         cp_solver = CpSolver()
         for key, value in params.items():
+            enum = type(getattr(cp_solver.parameters, key))
+
+            if hasattr(enum, "__members__") and not isinstance(value, enum):
+                # Enum parameters such as ``search_branching`` only accept
+                # enum values, which cannot be written in parameter files,
+                # so their names and integer values are converted here.
+                if isinstance(value, str):
+                    value = enum.__members__[value]
+                else:
+                    value = enum(value)
+
             setattr(cp_solver.parameters, key, value)
 
         if log_file:
@@ -127,7 +203,9 @@ class Solver:
             cp_solver.parameters.log_search_progress = display
             cp_solver.parameters.log_to_stdout = display
 
-        status_code = cp_solver.solve(self._model)
+        callback = _TraceCallback()
+        cp_solver.best_bound_callback = callback.on_bound
+        status_code = cp_solver.solve(self._model, callback)
         status = cp_solver.status_name(status_code)
         objective_value = cp_solver.objective_value
 
@@ -144,4 +222,5 @@ class Solver:
             status=self._get_solve_status(status),
             runtime=cp_solver.wall_time,
             best=solution,
+            trace=callback.trace,
         )
@@ -1,9 +1,9 @@
 from itertools import product
-from typing import Optional
+from typing import Optional, Sequence
 
 import numpy as np
 
-from pyjobshop.ProblemData import ProblemData
+from pyjobshop.ProblemData import Machine, ProblemData
 
 
 def compute_task_durations(data: ProblemData) -> list[list[int]]:
@@ -231,3 +231,261 @@ def setup_times_matrix(data: ProblemData) -> Optional[np.ndarray]:
         setup[res, task1, task2] = duration
 
     return setup
+
+
+# --- Symmetry utilities ---
+
+
+def identical_machines(data: ProblemData) -> list[list[int]]:
+    """
+    Returns the groups of interchangeable machines. Two machines are
+    interchangeable if every task has a mode on either machine with the same
+    duration and demand, and if both machines have the same setup times. Such
+    machines can be swapped in any solution without changing its feasibility
+    or objective value.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+
+    Returns
+    -------
+    list[list[int]]
+        The groups of interchangeable machine indices. Each group contains at
+        least two machines, sorted by index. Machines that are used in modes
+        requiring multiple resources, or that are not used at all, are never
+        part of a group.
+    """
+    signatures: dict[int, list[tuple[int, int, int]]] = {
+        idx: []
+        for idx, resource in enumerate(data.resources)
+        if isinstance(resource, Machine)
+    }
+    excluded: set[int] = set()
+
+    for mode in data.modes:
+        if len(mode.resources) == 1 and mode.resources[0] in signatures:
+            entry = (mode.task, mode.duration, mode.demands[0])
+            signatures[mode.resources[0]].append(entry)
+        else:
+            excluded.update(mode.resources)
+
+    setup_times = setup_times_matrix(data)
+    groups: dict[tuple, list[int]] = {}
+
+    for idx, entries in signatures.items():
+        if idx in excluded or not entries:
+            continue
+
+        setups = setup_times[idx].tobytes() if setup_times is not None else b""
+        key = (tuple(sorted(entries)), setups)
+        groups.setdefault(key, []).append(idx)
+
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def identical_jobs(data: ProblemData) -> list[list[int]]:
+    """
+    Returns the groups of identical jobs. Two jobs are identical if they have
+    the same job data, and if their tasks (in job order) have the same task
+    data, modes, flow roles and constraints among each other. Jobs with tasks
+    that are constrained to tasks of other jobs, or that have setup times,
+    are never identical to another job.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+
+    Returns
+    -------
+    list[list[int]]
+        The groups of identical job indices. Each group contains at least two
+        jobs, sorted by index.
+    """
+    task2job = [task.job for task in data.tasks]
+    task2pos = [0] * data.num_tasks
+    for job in data.jobs:
+        for pos, task in enumerate(job.tasks):
+            task2pos[task] = pos
+
+    task2sig: list[list] = [[] for _ in range(data.num_tasks)]
+    for mode in data.modes:
+        entry = (tuple(mode.resources), mode.duration, tuple(mode.demands))
+        task2sig[mode.task].append(entry)
+
+    job2cons: list[list] = [[] for _ in range(data.num_jobs)]
+    excluded: set[int] = set()
+    constraints = data.constraints
+    pairs: list[tuple[str, Sequence[tuple]]] = [
+        ("start_before_start", constraints.start_before_start),
+        ("start_before_end", constraints.start_before_end),
+        ("end_before_start", constraints.end_before_start),
+        ("end_before_end", constraints.end_before_end),
+        ("identical_resources", constraints.identical_resources),
+        ("different_resources", constraints.different_resources),
+        ("consecutive", constraints.consecutive),
+    ]
+
+    for name, constraint_list in pairs:
+        for task1, task2, *rest in constraint_list:
+            job1, job2 = task2job[task1], task2job[task2]
+
+            if job1 != job2:
+                excluded.update(job for job in (job1, job2) if job is not None)
+            elif job1 is not None:
+                entry = (name, task2pos[task1], task2pos[task2], *rest)
+                job2cons[job1].append(entry)
+
+    for _, task1, task2, duration in constraints.setup_times:
+        if duration > 0:
+            jobs = (task2job[task1], task2job[task2])
+            excluded.update(job for job in jobs if job is not None)
+
+    flows = data.flows or {}
+    groups: dict[tuple, list[int]] = {}
+
+    for idx, job in enumerate(data.jobs):
+        if idx in excluded:
+            continue
+
+        tasks = tuple(
+            (
+                data.tasks[task].earliest_start,
+                data.tasks[task].latest_start,
+                data.tasks[task].earliest_end,
+                data.tasks[task].latest_end,
+                data.tasks[task].fixed_duration,
+                data.tasks[task].optional,
+                flows.get(task),
+                tuple(sorted(task2sig[task])),
+            )
+            for task in job.tasks
+        )
+        key = (
+            job.weight,
+            job.release_date,
+            job.deadline,
+            job.due_date,
+            tasks,
+            tuple(sorted(job2cons[idx])),
+        )
+        groups.setdefault(key, []).append(idx)
+
+    return [group for group in groups.values() if len(group) > 1]
+
+
+# --- Redundant constraint utilities ---
+
+
+def machine_pools(data: ProblemData) -> list[tuple[list[int], list[int]]]:
+    """
+    Returns the machine pools of the problem instance. A machine pool is a set
+    of at least two machines that is the eligible machine set of some task,
+    together with all tasks whose eligible machines are a subset of that set.
+    Since each of these tasks occupies exactly one machine of the pool while
+    it is processed, at most as many tasks as there are machines in the pool
+    can be processed at the same time.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+
+    Returns
+    -------
+    list[tuple[list[int], list[int]]]
+        The pools as (machines, tasks) pairs, both sorted by index. Pools with
+        no more tasks than machines are omitted, since the corresponding
+        capacity constraint is trivially satisfied. Tasks with a mode that
+        requires a non-machine resource or multiple resources are never part
+        of a pool.
+    """
+    is_machine = [isinstance(res, Machine) for res in data.resources]
+    eligible: list[set[int]] = [set() for _ in range(data.num_tasks)]
+    excluded: set[int] = set()
+
+    for mode in data.modes:
+        if len(mode.resources) == 1 and is_machine[mode.resources[0]]:
+            eligible[mode.task].add(mode.resources[0])
+        else:
+            excluded.add(mode.task)
+
+    task2machines = {
+        task: frozenset(machines)
+        for task, machines in enumerate(eligible)
+        if task not in excluded and machines
+    }
+    candidates = {
+        machines for machines in task2machines.values() if len(machines) > 1
+    }
+
+    pools = []
+    for machines in sorted(candidates, key=sorted):
+        tasks = [
+            task
+            for task, eligible in task2machines.items()
+            if eligible <= machines
+        ]
+
+        if len(tasks) > len(machines):
+            pools.append((sorted(machines), tasks))
+
+    return pools
+
+
+def job_chain_lengths(data: ProblemData) -> list[int]:
+    """
+    Computes, for each job, the length of the longest chain of mandatory
+    tasks linked by end-before-start constraints within the job, using the
+    minimum duration of each task. This is a lower bound on the time between
+    the start and end of the job.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+
+    Returns
+    -------
+    list[int]
+        The chain length for each job.
+    """
+    durations = compute_task_durations(data)
+    min_durations = [min(durs, default=0) for durs in durations]
+    task2job = [task.job for task in data.tasks]
+    mandatory = [not task.optional for task in data.tasks]
+
+    succs: list[list[tuple[int, int]]] = [[] for _ in range(data.num_tasks)]
+    num_preds = [0] * data.num_tasks
+
+    for task1, task2, delay in data.constraints.end_before_start:
+        job1, job2 = task2job[task1], task2job[task2]
+
+        same_job = job1 is not None and job1 == job2
+
+        if same_job and mandatory[task1] and mandatory[task2]:
+            succs[task1].append((task2, min_durations[task1] + delay))
+            num_preds[task2] += 1
+
+    lengths = [0] * data.num_jobs
+
+    for idx, job in enumerate(data.jobs):
+        tasks = [task for task in job.tasks if mandatory[task]]
+        heads = {task: 0 for task in tasks}
+        queue = [task for task in tasks if num_preds[task] == 0]
+
+        # Longest path in the precedence DAG of the job, in topological order.
+        while queue:
+            task = queue.pop()
+            lengths[idx] = max(lengths[idx], heads[task] + min_durations[task])
+
+            for succ, length in succs[task]:
+                heads[succ] = max(heads[succ], heads[task] + length)
+                num_preds[succ] -= 1
+
+                if num_preds[succ] == 0:
+                    queue.append(succ)
+
+    return lengths
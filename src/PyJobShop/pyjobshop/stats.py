@@ -0,0 +1,212 @@
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from math import ceil
+
+from pyjobshop.ProblemData import Machine, ProblemData
+from pyjobshop.solvers.utils import compute_task_durations, job_chain_lengths
+
+
+@dataclass
+class InstanceStats:
+    """
+    Summary statistics of a problem instance, used to estimate its size and
+    difficulty.
+
+    Parameters
+    ----------
+    num_jobs
+        The number of jobs.
+    num_machines
+        The number of machines that process at least one task with a
+        positive duration.
+    num_tasks
+        The number of tasks.
+    num_modes
+        The number of processing modes.
+    modes_per_task
+        The average number of modes per task.
+    flexibility
+        The average fraction of machines that can process a task.
+    workload
+        The minimum total processing time of all jobs. For jobs with flow
+        roles (e.g., And/Or and process plan instances), this is the shortest
+        source-sink path; otherwise the sum of minimum task durations of all
+        mandatory tasks.
+    setup_density
+        The fraction of ordered pairs of tasks eligible on the same machine
+        that have a positive setup time on that machine.
+    num_or_branches
+        The number of alternative branches of jobs with flow roles. The
+        branches of an OR split are the flow tasks with the same (non-empty)
+        set of end-before-start predecessors; splits with a single branch
+        are not counted.
+    lower_bound
+        Trivial lower bound on the makespan: the maximum of the longest job
+        chain and, if all modes require only machines, the workload divided
+        over the machines.
+    """
+
+    num_jobs: int
+    num_machines: int
+    num_tasks: int
+    num_modes: int
+    modes_per_task: float
+    flexibility: float
+    workload: int
+    setup_density: float
+    num_or_branches: int
+    lower_bound: int
+
+
+def _flow_path_lengths(
+    data: ProblemData, min_durations: list[int]
+) -> dict[int, int]:
+    """
+    Computes, for each job with a flow source task, the length of the
+    shortest path from its source to its sink in the precedence DAG, using
+    the minimum duration of each task. Exactly one such path is processed.
+    """
+    flows = data.flows or {}
+    sources: dict[int, int] = {}
+
+    for task, role in flows.items():
+        job = data.tasks[task].job
+        if role == "source" and job is not None:
+            sources[job] = task
+
+    succs: list[list[tuple[int, int]]] = [[] for _ in range(data.num_tasks)]
+    num_preds = [0] * data.num_tasks
+
+    for task1, task2, delay in data.constraints.end_before_start:
+        succs[task1].append((task2, delay))
+        num_preds[task2] += 1
+
+    lengths = {}
+    for job, source in sources.items():
+        tasks = data.jobs[job].tasks
+        dist = {source: min_durations[source]}  # only reachable tasks
+        queue = [task for task in tasks if num_preds[task] == 0]
+        sinks = []
+
+        # Shortest path in the precedence DAG of the job, in topological order.
+        while queue:
+            task = queue.pop()
+
+            if flows.get(task) == "sink":
+                sinks.append(task)
+
+            for succ, delay in succs[task]:
+                if task in dist:
+                    length = dist[task] + delay + min_durations[succ]
+                    dist[succ] = min(dist.get(succ, length), length)
+
+                num_preds[succ] -= 1
+
+                if num_preds[succ] == 0:
+                    queue.append(succ)
+
+        reached = [dist[sink] for sink in sinks if sink in dist]
+        lengths[job] = min(reached, default=0)
+
+    return lengths
+
+
+def _num_or_branches(data: ProblemData) -> int:
+    """
+    Counts the alternative branches of the jobs with flow roles, see
+    :attr:`InstanceStats.num_or_branches`. Grouping the branches by their
+    predecessors gives the same count whether consecutive OR splits are
+    linked directly or through a hub task.
+    """
+    flows = data.flows or {}
+    preds: dict[int, set[int]] = defaultdict(set)
+
+    for task1, task2, _ in data.constraints.end_before_start:
+        if task2 in flows:
+            preds[task2].add(task1)
+
+    splits = Counter(frozenset(tasks) for tasks in preds.values())
+    return sum(num for num in splits.values() if num > 1)
+
+
+def instance_stats(data: ProblemData) -> InstanceStats:
+    """
+    Computes summary statistics of the given problem instance.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+
+    Returns
+    -------
+    InstanceStats
+        The instance statistics.
+    """
+    durations = compute_task_durations(data)
+    min_durations = [min(durs, default=0) for durs in durations]
+
+    machines = {
+        res
+        for mode in data.modes
+        for res in mode.resources
+        if mode.duration > 0 and isinstance(data.resources[res], Machine)
+    }
+    num_machines = len(machines)
+    modes_per_task = data.num_modes / max(data.num_tasks, 1)
+    flexibility = modes_per_task / max(num_machines, 1)
+
+    flow_lengths = _flow_path_lengths(data, min_durations)
+    chain_lengths = job_chain_lengths(data)
+    job_bounds = []
+    workload = 0
+
+    for job_idx, job in enumerate(data.jobs):
+        if job_idx in flow_lengths:
+            job_bounds.append(flow_lengths[job_idx])
+            workload += flow_lengths[job_idx]
+        else:
+            job_bounds.append(chain_lengths[job_idx])
+            workload += sum(
+                min_durations[task]
+                for task in job.tasks
+                if not data.tasks[task].optional
+            )
+
+    pairs = {(res, mode.task) for mode in data.modes for res in mode.resources}
+    eligible = Counter(res for res, _ in pairs)
+    num_pairs = sum(count * (count - 1) for count in eligible.values())
+    num_setups = sum(
+        task1 != task2
+        and duration > 0
+        and (machine, task1) in pairs
+        and (machine, task2) in pairs
+        for machine, task1, task2, duration in data.constraints.setup_times
+    )
+    setup_density = num_setups / num_pairs if num_pairs else 0.0
+
+    num_or_branches = _num_or_branches(data)
+
+    lower_bound = max(job_bounds, default=0)
+
+    if num_machines > 0 and all(
+        isinstance(data.resources[res], Machine)
+        for mode in data.modes
+        for res in mode.resources
+    ):
+        # Each task occupies at least one machine while it is processed, so
+        # the workload must be divided over the machines.
+        lower_bound = max(lower_bound, ceil(workload / num_machines))
+
+    return InstanceStats(
+        num_jobs=data.num_jobs,
+        num_machines=num_machines,
+        num_tasks=data.num_tasks,
+        num_modes=data.num_modes,
+        modes_per_task=modes_per_task,
+        flexibility=flexibility,
+        workload=workload,
+        setup_density=setup_density,
+        num_or_branches=num_or_branches,
+        lower_bound=lower_bound,
+    )
@@ -0,0 +1,96 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from numpy.testing import assert_, assert_equal, assert_raises
+
+from pyjobshop import solve
+from pyjobshop.solvers.cpoptimizer import SolverPool
+from pyjobshop.solvers.cpoptimizer.Solver import Solver
+from pyjobshop.solvers.cpoptimizer.SolverPool import _check_docplex_version
+
+
+@pytest.mark.parametrize("num_processes", [0, -1])
+def test_raises_invalid_num_processes(num_processes: int):
+    """
+    Tests that the pool raises when the number of processes is not positive.
+    """
+    with assert_raises(ValueError):
+        SolverPool(num_processes)
+
+
+@pytest.mark.parametrize("version", [(2, 27), (2, 33), (3, 0)])
+def test_raises_unsupported_docplex_version(version: tuple[int, int]):
+    """
+    Tests that docplex versions that the pool was not written against are
+    rejected.
+    """
+    with assert_raises(RuntimeError):
+        _check_docplex_version(version)
+
+
+def test_pool_solve_same_as_solve(small):
+    """
+    Tests that solving on the pool gives the same result as a regular solve.
+    """
+    with SolverPool() as pool:
+        result = pool.solve(small)
+
+    expected = solve(small, solver="cpoptimizer")
+    assert_equal(result.status, expected.status)
+    assert_equal(result.objective, expected.objective)
+
+
+def test_pool_reuses_processes(small):
+    """
+    Tests that subsequent solves on the pool reuse the solver processes, and
+    that the pool never starts more processes than allowed.
+    """
+    with SolverPool(num_processes=2) as pool:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(pool.solve, [small] * 8))
+
+        assert_(len(pool._agents) <= 2)
+
+    for result in results:
+        assert_equal(result.status.value, "Optimal")
+        assert_equal(result.objective, 3)
+
+
+def test_solve_after_close_raises(small):
+    """
+    Tests that solving on a closed pool raises.
+    """
+    pool = SolverPool()
+    pool.close()
+
+    with assert_raises(RuntimeError):
+        pool.solve(small)
+
+
+def test_solve_ends_solver_process(small):
+    """
+    Tests that a solve ends the CP Optimizer process by default, so that
+    one-shot solves do not leave processes behind.
+    """
+    solver = Solver(small)
+    result = solver.solve()
+
+    assert_equal(result.status.value, "Optimal")
+    assert_(solver._cp_solver is None)
+
+
+def test_keep_alive_reuses_solver_process(small):
+    """
+    Tests that the CP Optimizer process is reused by subsequent solves when
+    it is kept alive, and ended by ``close()``.
+    """
+    solver = Solver(small)
+    solver.solve(keep_alive=True)
+    cp_solver = solver._cp_solver
+
+    result = solver.solve(keep_alive=True)
+    assert_equal(result.status.value, "Optimal")
+    assert_(solver._cp_solver is cp_solver)
+
+    solver.close()
+    assert_(solver._cp_solver is None)
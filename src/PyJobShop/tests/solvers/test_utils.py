@@ -1,11 +1,16 @@
 from numpy.testing import assert_equal
 
+from pyjobshop import Model
 from pyjobshop.ProblemData import Job, Mode, ProblemData, Renewable, Task
 from pyjobshop.solvers.utils import (
     compute_task_durations,
     different_modes,
+    identical_jobs,
+    identical_machines,
     identical_modes,
     intersecting_modes,
+    job_chain_lengths,
+    machine_pools,
     resource2modes,
     task2modes,
 )
@@ -158,3 +163,119 @@ def test_intersecting_modes():
             (1, 3, []),
         ],
     )
+
+
+def test_identical_machines():
+    """
+    Tests that interchangeable machines are correctly grouped.
+    """
+    model = Model()
+    machines = [model.add_machine() for _ in range(4)]
+    tasks = [model.add_task() for _ in range(2)]
+
+    # Machines 0 and 1 process both tasks with the same durations. Machine 2
+    # has a different duration for the second task, and machine 3 is unused.
+    for machine in machines[:2]:
+        model.add_mode(tasks[0], machine, duration=1)
+        model.add_mode(tasks[1], machine, duration=2)
+
+    model.add_mode(tasks[0], machines[2], duration=1)
+    model.add_mode(tasks[1], machines[2], duration=3)
+
+    assert_equal(identical_machines(model.data()), [[0, 1]])
+
+    # Setup times on machine 0 only make machines 0 and 1 distinguishable.
+    model.add_setup_time(machines[0], tasks[0], tasks[1], 1)
+    assert_equal(identical_machines(model.data()), [])
+
+
+def test_identical_jobs():
+    """
+    Tests that identical jobs are correctly grouped.
+    """
+    model = Model()
+    machine = model.add_machine()
+
+    for durations in [[1, 2], [1, 2], [2, 1], [1, 2]]:
+        job = model.add_job()
+        tasks = [model.add_task(job=job) for _ in durations]
+
+        for task, duration in zip(tasks, durations):
+            model.add_mode(task, machine, duration)
+
+        model.add_end_before_start(tasks[0], tasks[1])
+
+    # Job 2 has its durations reversed, the other jobs are identical.
+    assert_equal(identical_jobs(model.data()), [[0, 1, 3]])
+
+    # A precedence constraint between tasks of jobs 0 and 1 makes that these
+    # jobs are no longer interchangeable.
+    model.add_end_before_start(model.tasks[1], model.tasks[2])
+    assert_equal(identical_jobs(model.data()), [])
+
+
+def test_machine_pools():
+    """
+    Tests that machine pools are correctly detected.
+    """
+    model = Model()
+    machines = [model.add_machine() for _ in range(3)]
+    tasks = [model.add_task() for _ in range(5)]
+
+    # Tasks 0-2 are eligible on machines 0 and 1, task 3 only on machine 0,
+    # and task 4 on all machines.
+    for task in tasks[:3]:
+        model.add_mode(task, machines[0], duration=1)
+        model.add_mode(task, machines[1], duration=1)
+
+    model.add_mode(tasks[3], machines[0], duration=1)
+
+    for machine in machines:
+        model.add_mode(tasks[4], machine, duration=1)
+
+    pools = machine_pools(model.data())
+    assert_equal(pools, [([0, 1], [0, 1, 2, 3]), ([0, 1, 2], [0, 1, 2, 3, 4])])
+
+
+def test_machine_pools_skips_trivial_pools():
+    """
+    Tests that pools with no more tasks than machines are omitted.
+    """
+    model = Model()
+    machines = [model.add_machine() for _ in range(2)]
+
+    for task in [model.add_task() for _ in range(2)]:
+        for machine in machines:
+            model.add_mode(task, machine, duration=1)
+
+    assert_equal(machine_pools(model.data()), [])
+
+
+def test_job_chain_lengths():
+    """
+    Tests that the longest chains of mandatory tasks are correctly computed.
+    """
+    model = Model()
+    machines = [model.add_machine() for _ in range(2)]
+    job1, job2 = model.add_job(), model.add_job()
+
+    # Job 1 is a diamond: task 0 precedes tasks 1 and 2, which precede task
+    # 3. The longest chain uses the minimum duration of each task.
+    tasks = [model.add_task(job=job1) for _ in range(4)]
+    for task, durations in zip(tasks, [[2, 3], [4, 5], [1, 1], [3, 4]]):
+        for machine, duration in zip(machines, durations):
+            model.add_mode(task, machine, duration)
+
+    model.add_end_before_start(tasks[0], tasks[1])
+    model.add_end_before_start(tasks[0], tasks[2], delay=2)
+    model.add_end_before_start(tasks[1], tasks[3])
+    model.add_end_before_start(tasks[2], tasks[3])
+
+    # Job 2 has an optional task that is ignored in the chain length.
+    first = model.add_task(job=job2)
+    second = model.add_task(job=job2, optional=True)
+    model.add_mode(first, machines[0], duration=2)
+    model.add_mode(second, machines[0], duration=5)
+    model.add_end_before_start(first, second)
+
+    assert_equal(job_chain_lengths(model.data()), [9, 2])
@@ -21,6 +21,8 @@ from pyjobshop.ProblemData import (
 )
 from pyjobshop.Solution import TaskData as TaskData
 
+from .utils import assert_data_equal
+
 
 def test_job_attributes():
     """
@@ -566,6 +568,88 @@ def test_problem_data_replace_with_changes():
     assert_(new.objective != data.objective)
 
 
+def make_save_load_data() -> ProblemData:
+    """
+    Creates a problem data instance that uses all data attributes.
+    """
+    model = Model()
+
+    job1 = model.add_job(weight=2, release_date=1, deadline=50, name="job1")
+    job2 = model.add_job(due_date=10)
+
+    machine = model.add_machine(name="machine")
+    renewable = model.add_renewable(capacity=2)
+    non_renewable = model.add_non_renewable(capacity=5, name="nr")
+
+    task1 = model.add_task(job=job1, earliest_start=1, name="task1")
+    task2 = model.add_task(job=job2, latest_end=20, optional=True)
+    task3 = model.add_task(fixed_duration=False)
+
+    model.add_mode(task1, machine, 3)
+    model.add_mode(task1, [renewable, non_renewable], 4, demands=[1, 2])
+    model.add_mode(task2, machine, 5)
+    model.add_mode(task3, renewable, 0, demands=2)
+
+    model.add_start_before_start(task1, task2, 1)
+    model.add_start_before_end(task1, task2)
+    model.add_end_before_start(task1, task3, 2)
+    model.add_end_before_end(task2, task3)
+    model.add_identical_resources(task1, task2)
+    model.add_different_resources(task2, task3)
+    model.add_consecutive(task1, task2)
+    model.add_setup_time(machine, task1, task2, 3)
+
+    model.mark_flow_source(task1)
+    model.mark_flow_sink(task2)
+    model.set_objective(weight_makespan=2, weight_total_flow_time=1)
+
+    return model.data()
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_problem_data_save_load(tmp_path, mmap: bool):
+    """
+    Tests that saving and loading problem data results in the same data.
+    """
+    data = make_save_load_data()
+    data.save(tmp_path / "data.pjs")
+
+    loaded = ProblemData.load(tmp_path / "data.pjs", mmap=mmap)
+    assert_data_equal(loaded, data)
+
+
+def test_problem_data_save_load_without_flows(tmp_path):
+    """
+    Tests that problem data without flows is saved and loaded correctly.
+    """
+    data = ProblemData(
+        [Job(tasks=[0])], [Machine()], [Task(0)], [Mode(0, [0], 1)]
+    )
+    data.save(tmp_path / "data.pjs")
+
+    loaded = ProblemData.load(tmp_path / "data.pjs")
+    assert_data_equal(loaded, data)
+
+
+def test_problem_data_load_raises_invalid_file(tmp_path):
+    """
+    Tests that loading a file that is not a saved problem data instance, or
+    that was saved with another format version, raises.
+    """
+    loc = tmp_path / "data.pjs"
+    loc.write_text("1 1\n1 1 1 5\n")
+
+    with assert_raises(ValueError):
+        ProblemData.load(loc)
+
+    make_save_load_data().save(loc)
+    contents = loc.read_bytes().replace(b'"version": 1', b'"version": 0')
+    loc.write_bytes(contents)
+
+    with assert_raises(ValueError):
+        ProblemData.load(loc)
+
+
 # --- Tests that involve checking solver correctness of problem data. ---
 
 
@@ -0,0 +1,105 @@
+from numpy.testing import assert_, assert_equal
+
+from pyjobshop.Result import Result, SolveStatus
+from pyjobshop.ResultsStore import ResultsStore, config_hash, instance_hash
+from pyjobshop.Solution import Solution
+
+
+def make_result(objective: float) -> Result:
+    return Result(
+        objective=objective,
+        lower_bound=objective - 1,
+        status=SolveStatus.FEASIBLE,
+        runtime=1.5,
+        best=Solution([]),
+        trace=[(0.5, objective + 1, 0.0), (1.0, objective, objective - 1)],
+    )
+
+
+def test_instance_hash(tmp_path):
+    """
+    Tests that the instance hash depends on the file contents only.
+    """
+    loc1, loc2, loc3 = tmp_path / "1.txt", tmp_path / "2.txt", tmp_path / "3"
+    loc1.write_text("1 2 3")
+    loc2.write_text("1 2 3")
+    loc3.write_text("1 2 4")
+
+    assert_equal(instance_hash(loc1), instance_hash(loc2))
+    assert_(instance_hash(loc1) != instance_hash(loc3))
+
+
+def test_config_hash():
+    """
+    Tests that the configuration hash does not depend on the key order.
+    """
+    config1 = {"solver": "ortools", "time_limit": 10}
+    config2 = {"time_limit": 10, "solver": "ortools"}
+
+    assert_equal(config_hash(config1), config_hash(config2))
+    assert_(config_hash(config1) != config_hash({"solver": "ortools"}))
+
+
+def test_results_store_add(tmp_path):
+    """
+    Tests that results are stored per configuration, and that adding a
+    result for the same instance and configuration replaces it.
+    """
+    config1 = {"solver": "ortools", "time_limit": 10}
+    config2 = {"solver": "ortools", "time_limit": 20}
+
+    with ResultsStore(tmp_path / "results.db") as store:
+        store.add("inst1", "hash1", config1, make_result(10))
+        store.add("inst2", "hash2", config1, make_result(20))
+        store.add("inst1", "hash1", config2, make_result(30))
+
+        assert_equal(store.completed(config1), {"hash1", "hash2"})
+        assert_equal(store.completed(config2), {"hash1"})
+
+        store.add("inst1", "hash1", config1, make_result(5))
+        results = store.results(config1)
+
+    assert_equal(len(results), 2)
+    assert_equal(results[0]["instance"], "inst1")
+    assert_equal(results[0]["status"], "Feasible")
+    assert_equal(results[0]["objective"], 5)
+    assert_equal(results[0]["lower_bound"], 4)
+    assert_equal(results[0]["runtime"], 1.5)
+    assert_equal(results[0]["trace"], [(0.5, 6, 0.0), (1.0, 5, 4)])
+    assert_equal(results[1]["instance"], "inst2")
+
+
+def test_results_store_persists(tmp_path):
+    """
+    Tests that stored results are available after reopening the store, and
+    that infinite objective values in the trace are stored correctly.
+    """
+    config = {"solver": "ortools"}
+    result = make_result(10)
+    result.trace.insert(0, (0.1, float("inf"), 0.0))
+
+    with ResultsStore(tmp_path / "results.db") as store:
+        store.add("inst", "hash", config, result)
+
+    with ResultsStore(tmp_path / "results.db") as store:
+        assert_equal(store.completed(config), {"hash"})
+        assert_equal(store.results(config)[0]["trace"], result.trace)
+
+
+def test_results_store_failed_runs_not_completed(tmp_path):
+    """
+    Tests that killed and out-of-memory runs are stored, but are not
+    completed, so that resumed benchmarks retry them.
+    """
+    config = {"solver": "ortools"}
+    killed, out_of_memory = make_result(10), make_result(20)
+    killed.status = SolveStatus.KILLED
+    out_of_memory.status = SolveStatus.OUT_OF_MEMORY
+
+    with ResultsStore(tmp_path / "results.db") as store:
+        store.add("inst1", "hash1", config, killed)
+        store.add("inst2", "hash2", config, out_of_memory)
+        store.add("inst3", "hash3", config, make_result(30))
+
+        assert_equal(store.completed(config), {"hash3"})
+        assert_equal(len(store.results(config)), 3)
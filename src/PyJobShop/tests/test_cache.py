@@ -0,0 +1,80 @@
+import os
+
+from numpy.testing import assert_, assert_equal
+
+from pyjobshop import Model
+from pyjobshop.cache import cached_read
+
+from .utils import assert_data_equal, read
+
+
+def test_cached_read(tmp_path):
+    """
+    Tests that an instance is parsed only once, and that the cached problem
+    data is the same as the parsed problem data.
+    """
+    calls = []
+
+    def parse():
+        calls.append(1)
+        return read("data/c154_3.mm", instance_format="psplib")
+
+    loc = os.path.join(os.path.dirname(__file__), "data/c154_3.mm")
+    data = cached_read(loc, parse, cache_dir=tmp_path)
+    cached = cached_read(loc, parse, cache_dir=tmp_path)
+
+    assert_equal(len(calls), 1)
+    assert_equal(len(list(tmp_path.iterdir())), 1)
+    assert_data_equal(cached, data)
+
+    # Different parse arguments should result in a different cache entry.
+    cached_read(loc, parse, "other", cache_dir=tmp_path)
+    assert_equal(len(calls), 2)
+
+
+def test_cached_read_invalidated_when_file_changes(tmp_path):
+    """
+    Tests that the cache entry is invalidated when the instance file is
+    modified.
+    """
+    loc = tmp_path / "instance.txt"
+    cache_dir = tmp_path / "cache"
+
+    def parse():
+        model = Model()
+        task = model.add_task()
+        model.add_mode(task, model.add_machine(), int(loc.read_text()))
+        return model.data()
+
+    loc.write_text("5")
+    data = cached_read(loc, parse, cache_dir=cache_dir)
+    assert_equal(data.modes[0].duration, 5)
+
+    loc.write_text("10")
+    data = cached_read(loc, parse, cache_dir=cache_dir)
+    assert_equal(data.modes[0].duration, 10)
+
+
+def test_no_cache_dir(tmp_path, monkeypatch):
+    """
+    Tests that no cache entries are written if there is no cache directory.
+    """
+    monkeypatch.delenv("PYJOBSHOP_CACHE_DIR", raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    read("data/small.mm", instance_format="psplib")
+    assert_(not any(tmp_path.iterdir()))
+
+
+def test_cache_dir_from_environment(tmp_path, monkeypatch):
+    """
+    Tests that the cache directory is taken from the environment variable
+    when it is not passed explicitly.
+    """
+    monkeypatch.setenv("PYJOBSHOP_CACHE_DIR", str(tmp_path))
+
+    data = read("data/small.mm", instance_format="psplib")
+    assert_equal(len(list(tmp_path.iterdir())), 1)
+
+    cached = read("data/small.mm", instance_format="psplib")
+    assert_data_equal(cached, data)
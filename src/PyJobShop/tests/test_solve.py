@@ -1,7 +1,7 @@
 import pytest
 from numpy.testing import assert_, assert_equal
 
-from pyjobshop import solve
+from pyjobshop import Model, solve
 from pyjobshop.Solution import Solution, TaskData
 
 
@@ -16,6 +16,20 @@ def test_solve(small, solver):
     assert_equal(result.objective, 3)
 
 
+def test_solve_trace(small, solver):
+    """
+    Tests that the result contains a trace of the solver run that ends with
+    the final objective value and lower bound.
+    """
+    result = solve(small, solver)
+
+    assert_(len(result.trace) > 0)
+    assert_equal(result.trace[-1][1:], (3, 3))
+
+    runtimes = [runtime for runtime, *_ in result.trace]
+    assert_equal(runtimes, sorted(runtimes))
+
+
 def test_solve_unknown_solver(small):
     """
     Tests that an unknown solver raises a ValueError.
@@ -100,3 +114,83 @@ def test_solve_additional_params(small, solver, capfd):
     solve(small, solver, display=False, **{param: value})
     printed = capfd.readouterr().out
     assert_(printed != "")
+
+
+@pytest.mark.parametrize("value", ["FIXED_SEARCH", 1])
+def test_solve_ortools_enum_params(small, value, capfd):
+    """
+    Tests that OR-Tools enum parameters can be given by name or by integer
+    value, as is the case in parameter files.
+    """
+    result = solve(small, "ortools", display=True, search_branching=value)
+    printed = capfd.readouterr().out
+
+    assert_equal(result.objective, 3)
+    assert_("search_branching: FIXED_SEARCH" in printed)
+
+
+def test_solve_symmetry_breaking(solver):
+    """
+    Tests that adding symmetry breaking constraints does not change the
+    optimal objective value on an instance with identical machines and jobs.
+    """
+    model = Model()
+    machines = [model.add_machine() for _ in range(3)]
+
+    for durations in [[2, 3], [2, 3], [2, 3], [4, 1]]:
+        job = model.add_job()
+        tasks = [model.add_task(job=job) for _ in durations]
+
+        for task, duration in zip(tasks, durations):
+            for machine in machines:
+                model.add_mode(task, machine, duration)
+
+        model.add_end_before_start(tasks[0], tasks[1])
+
+    result = model.solve(solver, display=False)
+    broken = model.solve(solver, display=False, symmetry_breaking=True)
+
+    assert_equal(broken.status.value, "Optimal")
+    assert_equal(broken.objective, result.objective)
+
+
+def test_solve_redundant_constraints(solver):
+    """
+    Tests that adding redundant constraints does not change the optimal
+    objective value on an instance with machine pools and job chains.
+    """
+    model = Model()
+    machines = [model.add_machine() for _ in range(3)]
+
+    for durations in [[2, 3, 1], [4, 1, 2], [3, 3, 3], [1, 2, 5]]:
+        job = model.add_job()
+        tasks = [model.add_task(job=job) for _ in durations]
+
+        for task, duration in zip(tasks, durations):
+            for machine in machines[:2]:
+                model.add_mode(task, machine, duration)
+
+        for task1, task2 in zip(tasks[:-1], tasks[1:]):
+            model.add_end_before_start(task1, task2)
+
+    result = model.solve(solver, display=False)
+    redundant = model.solve(solver, display=False, redundant_constraints=True)
+
+    assert_equal(redundant.status.value, "Optimal")
+    assert_equal(redundant.objective, result.objective)
+
+
+def test_solve_objective_bound(small, solver):
+    """
+    Tests that an objective bound is added as a constraint: a valid bound
+    does not change the optimal objective value, while a bound that exceeds
+    it makes the solver prove the bound instead.
+    """
+    result = solve(small, solver, objective_bound=2)
+
+    assert_equal(result.status.value, "Optimal")
+    assert_equal(result.objective, 3)
+
+    bounded = solve(small, solver, objective_bound=4)
+    assert_(bounded.objective >= 4)
+    assert_(bounded.lower_bound >= 4)
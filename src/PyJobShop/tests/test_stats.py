@@ -0,0 +1,172 @@
+import pytest
+from numpy.testing import assert_allclose, assert_equal
+
+from pyjobshop import Model
+from pyjobshop.stats import instance_stats
+
+
+def test_instance_stats_flexible_job_shop():
+    """
+    Tests the statistics of a small flexible job shop instance.
+    """
+    model = Model()
+    machines = [model.add_machine() for _ in range(2)]
+
+    # Job 1 has two tasks in sequence, job 2 a single task.
+    job1, job2 = model.add_job(), model.add_job()
+    task1 = model.add_task(job=job1)
+    task2 = model.add_task(job=job1)
+    task3 = model.add_task(job=job2)
+
+    model.add_mode(task1, machines[0], 3)
+    model.add_mode(task1, machines[1], 4)
+    model.add_mode(task2, machines[0], 5)
+    model.add_mode(task3, machines[1], 1)
+    model.add_end_before_start(task1, task2)
+    model.add_setup_time(machines[0], task1, task2, 2)
+    model.add_setup_time(machines[1], task1, task3, 0)
+
+    stats = instance_stats(model.data())
+
+    assert_equal(stats.num_jobs, 2)
+    assert_equal(stats.num_machines, 2)
+    assert_equal(stats.num_tasks, 3)
+    assert_equal(stats.num_modes, 4)
+    assert_allclose(stats.modes_per_task, 4 / 3)
+    assert_allclose(stats.flexibility, 2 / 3)
+    assert_equal(stats.workload, 3 + 5 + 1)
+
+    # Both machines have two eligible tasks, so there are four ordered task
+    # pairs, of which one has a positive setup time.
+    assert_allclose(stats.setup_density, 1 / 4)
+    assert_equal(stats.num_or_branches, 0)
+
+    # The chain of job 1 takes at least 3 + 5 = 8 time units, which is more
+    # than the workload of 9 divided over two machines.
+    assert_equal(stats.lower_bound, 8)
+
+
+def test_instance_stats_flow_job():
+    """
+    Tests that the workload and lower bound of jobs with flow roles are based
+    on the shortest source-sink path, and that the branches are counted.
+    """
+    model = Model()
+    dummy, machine = model.add_machine(), model.add_machine()
+    job = model.add_job()
+
+    source = model.add_task(job=job)
+    sink = model.add_task(job=job, optional=True)
+    model.add_mode(source, dummy, 0)
+    model.add_mode(sink, dummy, 0)
+    model.mark_flow_source(source)
+    model.mark_flow_sink(sink)
+
+    # Two alternative branches: a chain of durations 2 and 3, or a single
+    # task of duration 4.
+    branches = [[2, 3], [4]]
+    for durations in branches:
+        prev = source
+        for duration in durations:
+            task = model.add_task(job=job, optional=True)
+            model.add_mode(task, machine, duration)
+            model.mark_flow_intermediate(task)
+            model.add_end_before_start(prev, task)
+            prev = task
+
+        model.add_end_before_start(prev, sink)
+
+    stats = instance_stats(model.data())
+
+    assert_equal(stats.num_machines, 1)
+    assert_equal(stats.workload, 4)
+    assert_equal(stats.num_or_branches, 2)
+    assert_equal(stats.lower_bound, 4)
+
+
+def test_instance_stats_project_lower_bound():
+    """
+    Tests that the workload is not divided over the machines when tasks
+    require renewable resources, since such tasks may overlap.
+    """
+    model = Model()
+    renewable = model.add_renewable(capacity=2)
+
+    for _ in range(2):
+        task = model.add_task(job=model.add_job())
+        model.add_mode(task, renewable, 5, demands=1)
+
+    stats = instance_stats(model.data())
+
+    assert_equal(stats.num_machines, 0)
+    assert_equal(stats.workload, 10)
+    assert_equal(stats.lower_bound, 5)
+
+
+@pytest.mark.parametrize("hub", [False, True])
+def test_instance_stats_or_branches(hub: bool):
+    """
+    Tests that the branches of consecutive OR splits are counted once each,
+    whether the splits are linked directly or through a hub task, and that
+    tasks without a job are ignored.
+    """
+    model = Model()
+    dummy, machine = model.add_machine(), model.add_machine()
+    job = model.add_job()
+
+    def add_task(role: str, duration: int = 1):
+        task = model.add_task(job=job, optional=role != "source")
+        model.add_mode(task, machine if duration else dummy, duration)
+        getattr(model, f"mark_flow_{role}")(task)
+        return task
+
+    # Two OR splits, with 2 and 3 single-task branches: 5 branches in total.
+    source, sink = add_task("source", 0), add_task("sink", 0)
+    first = [add_task("intermediate") for _ in range(2)]
+    second = [add_task("intermediate") for _ in range(3)]
+
+    for task in first:
+        model.add_end_before_start(source, task)
+
+    ends = first
+    if hub:
+        ends = [add_task("intermediate", 0)]
+        for task in first:
+            model.add_end_before_start(task, ends[0])
+
+    for end in ends:
+        for task in second:
+            model.add_end_before_start(end, task)
+
+    for task in second:
+        model.add_end_before_start(task, sink)
+
+    # A task without a job does not take part in the flows.
+    model.add_mode(model.add_task(), machine, 1)
+
+    stats = instance_stats(model.data())
+
+    assert_equal(stats.num_or_branches, 5)
+    assert_equal(stats.workload, 2)
+
+
+def test_instance_stats_unreachable_sink():
+    """
+    Tests that a flow job whose sink cannot be reached from its source does
+    not give an infinite workload or lower bound.
+    """
+    model = Model()
+    machine = model.add_machine()
+    job = model.add_job()
+
+    source = model.add_task(job=job)
+    sink = model.add_task(job=job, optional=True)
+    model.add_mode(source, machine, 2)
+    model.add_mode(sink, machine, 0)
+    model.mark_flow_source(source)
+    model.mark_flow_sink(sink)
+
+    stats = instance_stats(model.data())
+
+    assert_equal(stats.workload, 0)
+    assert_equal(stats.lower_bound, 0)
@@ -1,5 +1,7 @@
 import pathlib
 
+from numpy.testing import assert_equal
+
 from pyjobshop.read import read as _read
 
 
@@ -10,3 +12,24 @@ def read(where: str, *args, **kwargs):
     """
     this_dir = pathlib.Path(__file__).parent
     return _read(this_dir / where, *args, **kwargs)
+
+
+def assert_data_equal(data1, data2):
+    """
+    Asserts that the two problem data instances are equal.
+    """
+    assert_equal(
+        [vars(job) for job in data1.jobs], [vars(job) for job in data2.jobs]
+    )
+    assert_equal(
+        [(type(res), vars(res)) for res in data1.resources],
+        [(type(res), vars(res)) for res in data2.resources],
+    )
+    assert_equal(
+        [vars(task) for task in data1.tasks],
+        [vars(task) for task in data2.tasks],
+    )
+    assert_equal(data1.modes, data2.modes)
+    assert_equal(data1.constraints, data2.constraints)
+    assert_equal(data1.flows, data2.flows)
+    assert_equal(data1.objective, data2.objective)
@@ -1,36 +1,12 @@
-from and_or_read import parse_instance_file_to_tuple
+from and_or_read import parse_afjsp
 from pyjobshop.Model import Model
 from pyjobshop.plot import plot_machine_gantt
 import matplotlib.pyplot as plt
 import os
 
 def compare(file):
-  instance = parse_instance_file_to_tuple(file)
-
-  m = Model()
-
-  jobs = [m.add_job() for _ in range(instance.num_jobs)]
-  resources = [m.add_machine() for _ in range(instance.num_machines + 1)]
-
-  for job_idx, tasks in enumerate(instance.jobs):
-    for task_idx, (k, alts, opt) in enumerate(tasks):
-      task = m.add_task(job=jobs[job_idx], name=f"{job_idx}_{task_idx}", optional=opt)
-
-      idx = 0
-      for resource_idx, duration in alts:
-        m.add_mode(task, resources[resource_idx], duration)
-        idx += 1
-
-      if resource_idx == 0:
-        if not opt:
-          m.mark_flow_source(task)
-        else:
-          m.mark_flow_sink(task)
-      else:
-        m.mark_flow_intermediate(task)
-
-  for frm, to, rel in instance.precedences:
-    m.add_end_before_start(m.tasks[frm], m.tasks[to])
+  instance = parse_afjsp(file)
+  m = instance.model()
     
   solver = "ortools"
   r = m.solve(solver=solver, display=False, num_workers=1, time_limit=300)
@@ -64,7 +40,7 @@ def compare(file):
   for M in Ms:
     m2.add_mode(m2.tasks[idcs.index(M.task)], [m2.resources[i] for i in M.resources], M.duration)
 
-  for frm, to, rel in instance.precedences:
+  for frm, to in instance.precedences.tolist():
     if frm in idcs and to in idcs:
       m2.add_end_before_start(m2.tasks[idcs.index(frm)], m2.tasks[idcs.index(to)])
 
@@ -0,0 +1,100 @@
+import gzip
+import json
+from pathlib import Path
+from typing import IO, Iterator, Union
+
+RUNS_FILE = "runs.jsonl"
+"""str: Name of the file with one JSON record per solver run, written to
+each run directory."""
+
+NO_SOLUTION = 1_000_000
+"""int: Objective value used in progress entries before the first solution
+is found, as in the log-parsing scripts."""
+
+
+def run_dir(
+    artifact_dir: Path, solver: str, num_workers: int, time_limit: float
+) -> Path:
+    """
+    Returns the directory for the artifacts of a benchmark configuration,
+    ``<artifact_dir>/<solver>_<num_workers>_<time_limit>``. Whole time
+    limits are written without decimals, and no time limit as ``inf``.
+    """
+    return artifact_dir / f"{solver}_{num_workers}_{time_limit:g}"
+
+
+def open_log(loc: Path, compress: bool = False) -> IO[str]:
+    """
+    Opens a raw solver log for writing, gzip-compressed (with a ``.gz``
+    suffix appended to the file name) if ``compress`` is set.
+    """
+    if compress:
+        return gzip.open(loc.with_name(loc.name + ".gz"), "wt")
+
+    return open(loc, "w")
+
+
+def append_record(loc: Path, record: dict):
+    """
+    Appends the record as a single line of JSON to the given file. Records
+    are flushed immediately, so that completed runs survive interruptions.
+    """
+    with open(loc, "a") as fh:
+        fh.write(json.dumps(record) + "\n")
+
+
+def read_records(loc: Union[str, Path]) -> Iterator[dict]:
+    """
+    Reads the run records from the given JSONL file, or from the runs file
+    of the given run directory. A partially written last line, e.g., from an
+    interrupted run, is skipped.
+    """
+    loc = Path(loc)
+    if loc.is_dir():
+        loc = loc / RUNS_FILE
+
+    with open(loc) as fh:
+        for line in fh:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def progress(record: dict) -> list[dict]:
+    """
+    Converts the bounds trace of a run record into the progress entries used
+    by the log-analysis scripts: dictionaries with the time, lower bound,
+    best objective value and optimality gap (in percent). The final result
+    of the run is added as the last entry.
+    """
+    trace = [tuple(entry) for entry in record["trace"]]
+    trace.append((record["runtime"], record["objective"], record["lower_bound"]))
+
+    entries = []
+    for time, best, bound in trace:
+        if best is None or best == float("inf"):
+            best, gap = NO_SOLUTION, 100.0
+        elif bound is None or bound == -float("inf"):
+            gap = 100.0
+        else:
+            gap = (1 - bound / best) * 100 if best != 0 else 0.0
+
+        entries.append({"time": time, "bound": bound, "best": best, "gap": gap})
+
+    return entries
+
+
+def record_stats(record: dict) -> dict:
+    """
+    Returns the statistics of a run record in the format of the log-parsing
+    scripts' ``parse_log`` functions.
+    """
+    return {
+        "file": Path(record["path"]).stem + ".log",
+        "time_limit": record["time_limit"],
+        "workers": record["num_workers"],
+        "status": record["status"],
+        "solve_time": record["runtime"],
+        "progress": progress(record),
+    }
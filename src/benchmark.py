@@ -1,26 +1,41 @@
 import argparse
+import os
+import time
 import warnings
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from functools import partial
 from multiprocessing import cpu_count
 from pathlib import Path
+from time import perf_counter
 from typing import Optional
 
 import numpy as np
 import tomli
-from tqdm.contrib.concurrent import process_map
+from tqdm import tqdm
 
 import pyjobshop
-from pyjobshop import Result, solve
-from pyjobshop.Model import Model, Mode
-from pyjobshop.Solution import Solution, TaskData
+from pyjobshop import ProblemData, Result, solve
+from pyjobshop.ResultsStore import ResultsStore, instance_hash
+from pyjobshop.Solution import Solution
+from pyjobshop.stats import instance_stats
 from pathlib import Path
+from artifacts import RUNS_FILE, append_record, open_log, run_dir
+from ddo_solution import read_solution
+from performance import pad_traces, primal_integrals, time_to_first_feasible
 from read.read import ProblemVariant, read
+from scheduler import estimate_cost, schedule
+from supervisor import Failure, run_supervised
 
 
 def parse_args():
     parser = argparse.ArgumentParser()
 
-    msg = "Location of the instance file."
+    msg = """
+    Location of the instance file. Files with the .pjs extension are loaded
+    as problem data saved with ProblemData.save().
+    """
     parser.add_argument("instances", nargs="+", type=Path, help=msg)
 
     msg = "Scheduling problem variant to read."
@@ -34,6 +49,13 @@ def parse_args():
     msg = "Directory to store best-found solutions (one file per instance)."
     parser.add_argument("--sol_dir", type=Path, help=msg)
 
+    msg = """
+    Directory with initial solutions (one <instance>.sol file per instance),
+    as written by --sol_dir or ddo_solution.py, or DDO solutions written by
+    log_to_sol.py.
+    """
+    parser.add_argument("--initial_solution_dir", type=Path, help=msg)
+
     msg = "Solver to use."
     parser.add_argument(
         "--solver",
@@ -58,6 +80,41 @@ def parse_args():
     msg = "Number of instances to solve in parallel. Default is 1."
     parser.add_argument("--num_parallel_instances", type=int, default=1, help=msg)
 
+    msg = """
+    Total number of cores to use. If given, the instances get a number of
+    worker threads in proportion to their estimated size (at most
+    num_workers_per_instance), and instances are started as soon as enough
+    cores are free, instead of running num_parallel_instances instances with
+    a fixed number of workers each.
+    """
+    parser.add_argument("--core_budget", type=int, help=msg)
+
+    msg = """
+    Whether to pin each instance to its own set of CPUs, disjoint from those
+    of the other instances running in parallel, with one worker thread per
+    CPU. Not supported with --cpo_pool, as the CP Optimizer processes of the
+    pool are shared between instances.
+    """
+    parser.add_argument("--pin_cpus", action="store_true", help=msg)
+
+    msg = """
+    Number of times to solve each instance. With more than one repeat, the
+    table shows the mean and standard deviation of the run-times. Default 1.
+    """
+    parser.add_argument("--num_repeats", type=int, default=1, help=msg)
+
+    msg = """
+    Each instance is solved in a supervised subprocess, which is killed if it
+    is still running this many seconds after the time limit. Default 60.
+    """
+    parser.add_argument("--grace_time", type=float, default=60, help=msg)
+
+    msg = """
+    Memory limit of each supervised subprocess, in megabytes. Runs that
+    exceed it are recorded with the Out-of-memory status. Default no limit.
+    """
+    parser.add_argument("--memory_limit", type=int, help=msg)
+
     msg = """
     Optional parameter configuration file (in TOML format). These parameters
     are passed to the solver as additional solver parameters.
@@ -70,6 +127,52 @@ def parse_args():
     """
     parser.add_argument("--permutation_max_jobs", type=int, help=msg)
 
+    msg = "Whether to add symmetry breaking constraints for identical machines and jobs."
+    parser.add_argument("--symmetry_breaking", action="store_true", help=msg)
+
+    msg = "Whether to add redundant constraints over machine pools and job chains."
+    parser.add_argument("--redundant_constraints", action="store_true", help=msg)
+
+    msg = """
+    Whether to solve the instances on a pool of long-lived CP Optimizer
+    processes (one per parallel instance) instead of starting a new process
+    for each instance. Only used with the CP Optimizer solver.
+    """
+    parser.add_argument("--cpo_pool", action="store_true", help=msg)
+
+    msg = """
+    Whether to connect consecutive OR-subgraphs of And/Or (AFJSP) instances
+    through hub tasks instead of linking all branch pairs.
+    """
+    parser.add_argument("--and_or_hubs", action="store_true", help=msg)
+
+    msg = """
+    Directory to cache parsed instances in. Defaults to the directory set by
+    the PYJOBSHOP_CACHE_DIR environment variable; no caching if neither is
+    set.
+    """
+    parser.add_argument("--cache_dir", type=Path, help=msg)
+
+    msg = """
+    SQLite database to store the results in. Each result is written as soon
+    as its instance is solved, and instances that already have a result for
+    the same configuration are skipped, so that interrupted runs can be
+    resumed.
+    """
+    parser.add_argument("--results_db", type=Path, help=msg)
+
+    msg = """
+    Directory to write run artifacts to. Each benchmark configuration gets a
+    subdirectory <solver>_<workers>_<time limit> with the raw solver log of
+    each instance and a runs.jsonl file with one structured record per run:
+    timings, bounds trace and solver parameters. No artifacts are written if
+    not given.
+    """
+    parser.add_argument("--artifact_dir", type=Path, help=msg)
+
+    msg = "Whether to gzip-compress the raw solver logs."
+    parser.add_argument("--compress_logs", action="store_true", help=msg)
+
     return parser.parse_args()
 
 
@@ -121,87 +224,234 @@ def _solve(
     config_loc: Optional[Path],
     sol_dir: Optional[Path],
     permutation_max_jobs: int,
-) -> Optional[tuple[str, str, float, float, float]]:
+    symmetry_breaking: bool = False,
+    redundant_constraints: bool = False,
+    pool=None,
+    and_or_hubs: bool = False,
+    cache_dir: Optional[Path] = None,
+    num_workers: Optional[int] = None,
+    artifact_dir: Optional[Path] = None,
+    compress_logs: bool = False,
+    cpus: Optional[list[int]] = None,
+    params: Optional[dict] = None,
+    initial_solution_dir: Optional[Path] = None,
+) -> Optional[tuple[Result, dict]]:
     """
-    Solves a single problem instance.
+    Solves a single problem instance. The number of workers defaults to
+    ``num_workers_per_instance``, unless the scheduler assigned ``num_workers``
+    (and, optionally, the ``cpus`` to pin this process to). The solver
+    parameters of ``config_loc`` are updated with ``params``, if given. The
+    instance's solution in ``initial_solution_dir``, if any, is used as
+    initial solution. Returns the result and the structured record of the
+    run.
     """
-    if config_loc is not None:
-        with open(config_loc, "rb") as fh:
-            params = tomli.load(fh)
-    else:
-        params = {}
+    params = {**_load_params(config_loc), **(params or {})}
+    solver_params = dict(params)
 
     if not instance_loc.is_file():
         return
 
-    data = pyjobshop.read(str(instance_loc))
+    if cpus is not None:
+        # The solver's worker threads inherit the affinity of this process.
+        os.sched_setaffinity(0, cpus)
+
+    start = perf_counter()
+    data = _read(instance_loc, problem_variant, and_or_hubs, cache_dir)
+    profile = {"read_time": perf_counter() - start}
     #if data.permutation and data.num_jobs > permutation_max_jobs:
     #    # For permutation problems we skip instances that are too large.
     #    return
 
-    log_dir = Path(f"/home/bns/thesis/Experiments/{sol_dir.name}/{solver}_{num_workers_per_instance}_{int(time_limit)}/")
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = open(f"/home/bns/thesis/Experiments/{sol_dir.name}/{solver}_{num_workers_per_instance}_{int(time_limit)}/{instance_loc.stem}.log", 'w')
+    if pool is not None:
+        params["pool"] = pool
 
-    m = Model().from_data(data)
-    #p = str(instance_loc)
-    #f = p[:p.rfind("/")]
-    #P = Path(f + "/est-job-8-1-60" + p[p.rfind("/"):-3] + "sol")
+    initial_solution = None
+    if initial_solution_dir is not None:
+        sol_loc = initial_solution_dir / f"{instance_loc.stem}.sol"
+        if sol_loc.is_file():
+            initial_solution = read_solution(sol_loc, data, problem_variant)
 
-    #print(str(P))
-    #if not P.is_file():
-    #    return
+    if artifact_dir is not None:
+        log_dir = run_dir(artifact_dir, solver, num_workers_per_instance, time_limit)
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_file = open_log(log_dir / f"{instance_loc.stem}.log", compress_logs)
+    else:
+        log_file = nullcontext()
+
+    if "num_workers" in params:
+        # E.g., a tuned configuration; this takes precedence.
+        num_workers = params.pop("num_workers")
+    elif num_workers is None:
+        num_workers = num_workers_per_instance
+
+    start = perf_counter()
+    with log_file:
+        result = solve(
+            data,
+            solver=solver,
+            time_limit=time_limit,
+            display=display,
+            log_file=log_file if artifact_dir is not None else None,
+            num_workers=num_workers,
+            initial_solution=initial_solution,
+            symmetry_breaking=symmetry_breaking,
+            redundant_constraints=redundant_constraints,
+            **params,
+        )
 
-    #s = eval(open(P).readline())
+    # The solver reports only its own run time, so the remainder of the wall
+    # time is spent building the model and handing it to the solver.
+    profile["solve_wall_time"] = perf_counter() - start
+    profile["build_time"] = max(profile["solve_wall_time"] - result.runtime, 0)
 
-    #J = max(map(lambda d: d[2], s)) + 1
-    #M = max(map(lambda d: d[4], s)) + 1
-    #print((M, J), (len(m.resources), len(m.jobs)))
+    if sol_dir:
+        sol_dir.mkdir(parents=True, exist_ok=True)
+        write_solution(instance_loc, sol_dir, result)
 
-    #fm = [0 for _ in range(M)]
-    #fj = [0 for _ in range(J)]
+    record = {
+        "instance": instance_loc.name,
+        "path": str(instance_loc),
+        "solver": solver,
+        "time_limit": time_limit,
+        "num_workers": num_workers,
+        "params": solver_params,
+        "problem_variant": problem_variant,
+        "symmetry_breaking": symmetry_breaking,
+        "redundant_constraints": redundant_constraints,
+        "cpus": cpus,
+        "status": result.status.value,
+        "objective": result.objective,
+        "lower_bound": result.lower_bound,
+        "runtime": result.runtime,
+        "profile": profile,
+        "trace": result.trace,
+        "finished": time.time(),
+    }
+
+    return result, record
+
+
+def _run(item: tuple[Path, int], **kwargs) -> Optional[tuple[Result, dict]]:
+    """
+    Solves the instance of the given (instance, repeat) pair.
+    """
+    instance_loc, repeat = item
+    output = _solve(instance_loc, **kwargs)
 
-    #sol = []
+    if output is not None:
+        output[1]["repeat"] = repeat
 
-    def find_mode(modes: list[Mode], task: int, resource: int, duration: int) -> Optional[Mode]:
-        return next(
-            (i for i, mode in enumerate(modes)
-             if mode.task == task
-             and mode.duration == duration
-             and mode.resources == [resource]),
-            None  # default value if no match is found
-        )
+    return output
 
-    #for _, dp, dj, dt, dm in s:
-    #    task = m.jobs[dj].tasks[dt]
-    #    mode = find_mode(m.modes, task, dm, dp)
-    #    if mode == None:
-    #        print(f"Error: no mode for task {dj}-{dt} ({task}) on machine {dm} ({dp})")
-    #        return
-    #    start = max(fm[dm], fj[dj])
-    #    end = start + dp
-    #    fm[dm] = end
-    #    fj[dj] = end
-    #    sol.append(TaskData(mode, [dm], start, end))
-        
-    #print(max(fm), max(fj))
-    #sol.sort(key=lambda task: task.mode)
-
-    result = m.solve(
-        solver=solver,
-        time_limit=time_limit,
-        display=display,
-        log_file=log_file,
-        num_workers=num_workers_per_instance,
-    #    initial_solution=Solution(sol),
-        **params,
+
+def _run_supervised(
+    item: tuple[Path, int],
+    timeout: Optional[float],
+    memory_limit: Optional[int],
+    **kwargs,
+) -> Optional[tuple[Result, dict]]:
+    """
+    Solves the instance of the given (instance, repeat) pair in a supervised
+    subprocess. If the subprocess is killed or runs out of memory, a result
+    and record with the corresponding status are returned instead.
+    """
+    output = run_supervised(
+        _run, item, timeout=timeout, memory_limit=memory_limit, **kwargs
     )
-    if sol_dir:
-        sol_dir.mkdir(parents=True, exist_ok=True)
-        write_solution(instance_loc, sol_dir, result)
+    if not isinstance(output, Failure):
+        return output
+
+    instance_loc, repeat = item
+    result = Result(float("inf"), 0, output.status, output.runtime, Solution([]))
+    record = {
+        "instance": instance_loc.name,
+        "path": str(instance_loc),
+        "solver": kwargs["solver"],
+        "time_limit": kwargs["time_limit"],
+        "num_workers": kwargs.get("num_workers"),
+        "cpus": kwargs.get("cpus"),
+        "status": result.status.value,
+        "reason": output.reason,
+        "objective": result.objective,
+        "lower_bound": result.lower_bound,
+        "runtime": result.runtime,
+        "profile": {},
+        "trace": [],
+        "finished": time.time(),
+        "repeat": repeat,
+    }
+
+    return result, record
+
+
+def _read(
+    instance_loc: Path,
+    problem_variant: Optional[ProblemVariant],
+    and_or_hubs: bool = False,
+    cache_dir: Optional[Path] = None,
+) -> ProblemData:
+    if instance_loc.suffix == ".pjs":
+        # Problem data saved with ``ProblemData.save()``, e.g., generated or
+        # presolved instances.
+        return ProblemData.load(instance_loc)
+    elif problem_variant == ProblemVariant.AFJSP:
+        return read(instance_loc, problem_variant, cache_dir, hubs=and_or_hubs)
+    elif problem_variant is not None:
+        return read(instance_loc, problem_variant, cache_dir)
+    else:
+        return pyjobshop.read(str(instance_loc), cache_dir=cache_dir)
+
+
+def _cost(instance_loc: Path, **kwargs) -> float:
+    """
+    Estimates the cost of solving the instance, used to schedule the most
+    expensive instances first.
+    """
+    if not instance_loc.is_file():
+        return 0.0
+
+    return estimate_cost(instance_stats(_read(instance_loc, **kwargs)))
+
+
+def _load_params(config_loc: Optional[Path]) -> dict:
+    if config_loc is None:
+        return {}
+
+    with open(config_loc, "rb") as fh:
+        return tomli.load(fh)
+
+
+def _config(repeat: int = 0, **kwargs) -> dict:
+    """
+    Returns the settings that determine the results of a benchmark run. Two
+    runs with the same configuration are considered interchangeable by the
+    results store. Repeated runs get a configuration of their own.
+    """
+    config = {
+        "solver": kwargs["solver"],
+        "time_limit": kwargs["time_limit"],
+        "num_workers_per_instance": kwargs["num_workers_per_instance"],
+        "params": _load_params(kwargs["config_loc"]),
+        "problem_variant": kwargs["problem_variant"],
+        "symmetry_breaking": kwargs.get("symmetry_breaking", False),
+        "redundant_constraints": kwargs.get("redundant_constraints", False),
+        "and_or_hubs": kwargs.get("and_or_hubs", False),
+        "core_budget": kwargs.get("core_budget"),
+        "pin_cpus": kwargs.get("pin_cpus", False),
+    }
+
+    if kwargs.get("initial_solution_dir") is not None:
+        config["initial_solution_dir"] = str(kwargs["initial_solution_dir"])
+
+    if repeat > 0:
+        config["repeat"] = repeat
+
+    return config
+
 
+def _row(name: str, result: Result) -> tuple[str, str, float, float, float]:
     return (
-        instance_loc.name,
+        name,
         result.status.value,
         result.objective,
         result.lower_bound,
@@ -209,6 +459,63 @@ def _solve(
     )
 
 
+def _aggregate_repeats(results: list[tuple]) -> list[tuple]:
+    """
+    Aggregates the results of repeated runs of the same instance into their
+    mean objective, bound and run-time, and the run-time's standard
+    deviation. The status is "Mixed" if the repeats ended differently.
+    """
+    by_instance = defaultdict(list)
+    for row in results:
+        by_instance[row[0]].append(row)
+
+    aggregated = []
+    for name, rows in by_instance.items():
+        statuses = {row[1] for row in rows}
+        status = statuses.pop() if len(statuses) == 1 else "Mixed"
+        obj, lb, runtime = np.array([row[2:] for row in rows], dtype=float).T
+        aggregated.append(
+            (
+                name,
+                status,
+                obj.mean(),
+                lb.mean(),
+                round(runtime.mean(), 2),
+                round(runtime.std(ddof=1) if len(rows) > 1 else 0.0, 3),
+            )
+        )
+
+    return aggregated
+
+
+def _anytime_summary(
+    traces: list[tuple[str, list, float, float]], time_limit: float
+) -> tuple[float, float]:
+    """
+    Returns the average primal integral and the average time to the first
+    feasible solution (over the runs that found one) of the given runs. The
+    primal integrals are computed with respect to the best objective value
+    found for each instance, up to the time limit (or the longest run-time
+    if there is no time limit).
+    """
+    names, *columns = zip(*traces)
+    times, objs = pad_traces(*columns)
+
+    best = {}
+    for name, objective in zip(names, objs.min(axis=1)):
+        best[name] = min(best.get(name, np.inf), objective)
+
+    horizon = time_limit if time_limit < np.inf else times.max(initial=0)
+    integrals = primal_integrals(
+        times, objs, np.array([best[name] for name in names]), horizon
+    )
+
+    ttff = time_to_first_feasible(times, objs)
+    ttff = ttff[np.isfinite(ttff)]
+
+    return integrals.mean(), ttff.mean() if ttff.size else np.nan
+
+
 def _check_cpu_usage(
     num_parallel_instances: int, num_workers_per_instance: Optional[int]
 ):
@@ -233,28 +540,18 @@ def _check_cpu_usage(
         )
 
 
-def benchmark(instances: list[Path], num_parallel_instances: int, **kwargs):
+def print_summary(
+    results: list[tuple],
+    traces: list[tuple[str, list, float, float]],
+    time_limit: float,
+    num_repeats: int = 1,
+):
     """
-    Solves the list of instances and prints a table of the results.
+    Prints a table of the results, with one (instance, status, objective,
+    lower bound, run-time) row per run, and summary statistics. Repeated runs
+    of an instance are aggregated.
     """
-    _check_cpu_usage(num_parallel_instances, kwargs.get("num_workers_per_instance"))
-
-    args = sorted(instances)
-    func = partial(_solve, **kwargs)
-
-    if len(instances) == 1:
-        results = [func(args[0])]
-    else:
-        results = process_map(
-            func,
-            args,
-            max_workers=num_parallel_instances,
-            unit="instance",
-        )
-
-    # Filter out the None results (permutation instances that were skipped).
-    results = [res for res in results if res is not None]
-
+    results.sort()
     dtypes = [
         ("inst", "U37"),
         ("status", "U37"),
@@ -262,16 +559,24 @@ def benchmark(instances: list[Path], num_parallel_instances: int, **kwargs):
         ("lb", float),
         ("time", float),
     ]
-    data = np.asarray(results, dtype=dtypes)
     headers = ["Instance", "Status", "Obj.", "LB", "Time (s)"]
 
+    if num_repeats > 1:
+        results = _aggregate_repeats(results)
+        dtypes.append(("time_std", float))
+        headers.append("Time std (s)")
+
+    data = np.asarray(results, dtype=dtypes)
+
     avg_objective = data["obj"].mean()
     avg_runtime = data["time"].mean()
 
     num_instances = data["status"].size
     num_optimal = np.count_nonzero(data["status"] == "Optimal")
     num_feas = np.count_nonzero(data["status"] == "Feasible") + num_optimal
-    num_infeas = num_instances - num_feas
+    num_killed = np.count_nonzero(data["status"] == "Killed")
+    num_oom = np.count_nonzero(data["status"] == "Out-of-memory")
+    num_infeas = num_instances - num_feas - num_killed - num_oom
 
     print("\n", tabulate(headers, data), "\n", sep="")
     print(f"     Avg. objective: {avg_objective:.2f}")
@@ -279,6 +584,184 @@ def benchmark(instances: list[Path], num_parallel_instances: int, **kwargs):
     print(f"      Total optimal: {num_optimal}")
     print(f"       Total infeas: {num_infeas}")
 
+    if num_killed or num_oom:
+        print(f"       Total killed: {num_killed}")
+        print(f"          Total OOM: {num_oom}")
+
+    if traces:
+        integral, ttff = _anytime_summary(traces, time_limit)
+        print(f"   Avg. primal int.: {integral:.4f}")
+        print(f"          Avg. TTFF: {ttff:.2f}s")
+
+
+def benchmark(instances: list[Path], num_parallel_instances: int, **kwargs):
+    """
+    Solves the list of instances and prints a table of the results.
+    """
+    args = sorted(instances)
+    cpo_pool = kwargs.pop("cpo_pool", False)
+    results_db = kwargs.pop("results_db", None)
+    core_budget = kwargs.pop("core_budget", None)
+    pin_cpus = kwargs.pop("pin_cpus", False)
+    num_repeats = kwargs.pop("num_repeats", 1)
+    grace_time = kwargs.pop("grace_time", 60)
+    memory_limit = kwargs.pop("memory_limit", None)
+    max_workers = kwargs["num_workers_per_instance"] or cpu_count()
+
+    cpus = None
+    if pin_cpus and cpo_pool:
+        warnings.warn("CPU pinning is not supported with --cpo_pool.", stacklevel=2)
+    elif pin_cpus:
+        cpus = sorted(os.sched_getaffinity(0))
+
+    if core_budget is None:
+        _check_cpu_usage(num_parallel_instances, kwargs["num_workers_per_instance"])
+        num_cores = num_parallel_instances * max_workers
+        max_parallel = num_parallel_instances
+    else:
+        if core_budget > cpu_count():
+            warnings.warn(
+                f"Core budget ({core_budget}) is greater than the number of "
+                f"available CPU cores ({cpu_count()}).",
+                stacklevel=2,
+            )
+
+        num_cores = core_budget
+        max_parallel = num_parallel_instances if cpo_pool else core_budget
+
+    func = partial(_run, **kwargs)
+    items = [(loc, repeat) for loc in args for repeat in range(num_repeats)]
+    results = []
+    traces = []  # (instance, trace, objective, runtime) of each run
+
+    artifact_dir = kwargs.get("artifact_dir")
+    if artifact_dir is not None:
+        runs_dir = run_dir(
+            artifact_dir,
+            kwargs["solver"],
+            kwargs["num_workers_per_instance"],
+            kwargs["time_limit"],
+        )
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        runs_loc = runs_dir / RUNS_FILE
+
+    store = ResultsStore(results_db) if results_db is not None else None
+    if store is not None:
+        # Skip the instances that were already solved with this configuration
+        # in an earlier (possibly interrupted) run, and reuse their results.
+        configs = [
+            _config(repeat, core_budget=core_budget, pin_cpus=pin_cpus, **kwargs)
+            for repeat in range(num_repeats)
+        ]
+        hashes = {loc: instance_hash(loc) for loc in args if loc.is_file()}
+        current = set(hashes.values())
+        completed = [store.completed(config) & current for config in configs]
+        items = [
+            (loc, repeat)
+            for loc, repeat in items
+            if hashes.get(loc) not in completed[repeat]
+        ]
+        stored = [
+            res
+            for repeat, config in enumerate(configs)
+            for res in store.results(config)
+            if res["instance_hash"] in completed[repeat]
+        ]
+        results += [
+            (
+                res["instance"],
+                res["status"],
+                res["objective"],
+                res["lower_bound"],
+                round(res["runtime"], 2),
+            )
+            for res in stored
+        ]
+        traces += [
+            (res["instance"], res["trace"], res["objective"], res["runtime"])
+            for res in stored
+        ]
+
+    # Longest instances first, so that no large instance starts at the end of
+    # the run and dominates the total wall time.
+    read_kwargs = {
+        "problem_variant": kwargs["problem_variant"],
+        "and_or_hubs": kwargs.get("and_or_hubs", False),
+        "cache_dir": kwargs.get("cache_dir"),
+    }
+    locs = sorted({loc for loc, _ in items})
+    if len(items) > 1:
+        with ProcessPoolExecutor(max_parallel) as executor:
+            costs = executor.map(partial(_cost, **read_kwargs), locs)
+            loc2cost = dict(zip(locs, costs))
+    else:  # nothing to order
+        loc2cost = dict.fromkeys(locs, 0.0)
+
+    pool = None
+    if cpo_pool and kwargs["solver"] == "cpoptimizer":
+        from pyjobshop.solvers.cpoptimizer import SolverPool
+
+        # The pool's solver processes are shared between instances, so the
+        # instances cannot be solved in supervised subprocesses.
+        pool = SolverPool(num_parallel_instances)
+        func = partial(func, pool=pool)
+    else:
+        # The supervised subprocesses do the heavy lifting, so threads
+        # suffice to start and watch them.
+        time_limit = kwargs["time_limit"]
+        timeout = time_limit + grace_time if time_limit < float("inf") else None
+        func = partial(
+            _run_supervised,
+            timeout=timeout,
+            memory_limit=memory_limit,
+            **kwargs,
+        )
+
+    try:
+        with ThreadPoolExecutor(max_parallel) as executor:
+            done = schedule(
+                executor,
+                func,
+                items,
+                [loc2cost[loc] for loc, _ in items],
+                num_cores,
+                max_workers,
+                max_parallel,
+                dynamic=core_budget is not None,
+                cpus=cpus,
+            )
+
+            for item, future in tqdm(done, total=len(items), unit="run"):
+                (loc, repeat), output = item, future.result()
+
+                # None results are instances that were skipped.
+                if output is None:
+                    continue
+
+                result, record = output
+
+                if artifact_dir is not None:
+                    # Records are written by this process only, so that
+                    # concurrent runs cannot interleave their lines.
+                    append_record(runs_loc, record)
+
+                if store is not None:
+                    # Written immediately, so that the result survives if the
+                    # run is interrupted later on.
+                    store.add(loc.name, hashes[loc], configs[repeat], result)
+
+                results.append(_row(loc.name, result))
+                traces.append(
+                    (loc.name, result.trace, result.objective, result.runtime)
+                )
+    finally:
+        if pool is not None:
+            pool.close()
+        if store is not None:
+            store.close()
+
+    print_summary(results, traces, kwargs["time_limit"], num_repeats)
+
 
 def main():
     args = parse_args()
@@ -1,6 +1,6 @@
 from pyjobshop.read import read
 # from readAlt import read
-from pyjobshop.Model import Model
+from pyjobshop import solve
 from pyjobshop.plot import plot_machine_gantt
 import matplotlib.pyplot as plt
 import os
@@ -25,8 +25,7 @@ for file in files:
     # print(f"{file: <30} | ", end = '')
     d = read(file, setup=False)
     
-    m = Model().from_data(d)
-    r = m.solve(solver="cpoptimizer", display=False, num_workers=1, time_limit=10)
+    r = solve(d, solver="cpoptimizer", display=False, num_workers=1, time_limit=10)
     
     # print(f"{round(r.runtime, 2): >10}s | {int(r.objective): >6}")
     print(r)
@@ -35,5 +34,5 @@ for file in files:
     # sol = list(map(lambda t : (t.end - t.start, m.tasks[m.modes[t.mode].task].job, m.jobs[m.tasks[m.modes[t.mode].task].job].tasks.index(m.modes[t.mode].task), t.resources[0]), sol))
     # print(sol)
 
-    plot_machine_gantt(r.best, m.data(), plot_labels=True)
+    plot_machine_gantt(r.best, d, plot_labels=True)
     plt.show()
\ No newline at end of file
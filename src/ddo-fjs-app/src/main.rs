@@ -294,6 +294,7 @@ fn main() {
     // let dominance = EmptyDominanceChecker::default();
     let width = Box::new(FixedWidth(args[2].parse().expect("Invalid width")));//Box::new(FixedWidth(1000));
     let cutoff = TimeBudget::new(Duration::from_secs(args[3].parse().expect("Invalid timeout"))); //NoCutoff;
+    let threads = args.get(4).map_or(8, |arg| arg.parse().expect("Invalid number of threads"));
     let mut fringe = NoDupFringe::new(MaxUB::new(&ranking));
 
     let mut solver = ParNoCachingSolverPooled::custom(//SeqCachingSolverFc::new(
@@ -304,7 +305,7 @@ fn main() {
         &dominance,
         &cutoff,
         &mut fringe,
-        8
+        threads
     );
 
     let start = Instant::now();
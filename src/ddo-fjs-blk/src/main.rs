@@ -278,6 +278,7 @@ fn main() {
     let dominance  = SimpleDominanceChecker::new(FjsDom, problem.nb_variables());
     let width = Box::new(FixedWidth(args[2].parse().expect("Invalid width")));//Box::new(FixedWidth(1000));
     let cutoff = TimeBudget::new(Duration::from_secs(args[3].parse().expect("Invalid timeout"))); //NoCutoff;
+    let threads = args.get(4).map_or(8, |arg| arg.parse().expect("Invalid number of threads"));
     let mut fringe = NoDupFringe::new(MaxUB::new(&ranking));
 
     let mut solver = DefaultCachingSolver::custom(//SeqCachingSolverFc::new(
@@ -288,7 +289,7 @@ fn main() {
         &dominance,
         &cutoff,
         &mut fringe,
-        8
+        threads
     );
 
     // let sol: [(usize, usize, usize, usize); 100] = [(21, 1, 0, 0), (83, 7, 0, 4), (95, 10, 0, 2), (54, 15, 0, 1), (52, 1, 1, 3), (12, 2, 0, 0), (20, 15, 1, 0), (71, 1, 2, 1), (96, 9, 0, 0), (24, 7, 1, 3), (43, 15, 2, 4), (27, 13, 0, 2), (9, 14, 0, 4), (14, 15, 3, 3), (76, 10, 1, 3), (71, 15, 4, 2), (16, 1, 3, 4), (89, 17, 0, 1), (25, 8, 0, 4), (87, 14, 1, 0), (10, 11, 0, 4), (84, 18, 0, 4), (26, 1, 4, 2), (52, 13, 1, 1), (49, 8, 1, 2), (41, 14, 2, 3), (33, 17, 1, 0), (7, 10, 2, 1), (43, 13, 2, 4), (83, 4, 0, 0), (8, 17, 2, 2), (75, 9, 1, 1), (66, 3, 0, 2), (66, 17, 3, 3), (28, 10, 3, 4), (81, 19, 0, 4), (35, 10, 4, 2), (41, 7, 2, 1), (28, 13, 3, 0), (43, 9, 2, 2), (50, 13, 4, 3), (69, 18, 1, 0), (93, 6, 0, 1), (33, 16, 0, 4), (38, 7, 3, 2), (77, 9, 3, 3), (44, 8, 2, 0), (28, 16, 1, 4), (45, 19, 1, 2), (42, 2, 1, 1), (77, 6, 1, 4), (26, 16, 2, 3), (95, 11, 1, 2), (31, 2, 2, 0), (78, 19, 2, 1), (77, 3, 1, 3), (78, 16, 3, 0), (98, 2, 3, 4), (91, 12, 0, 1), (69, 19, 3, 3), (87, 6, 2, 2), (60, 7, 4, 0), (79, 3, 2, 4), (79, 9, 4, 3), (61, 11, 2, 0), (34, 0, 0, 2), (87, 6, 3, 1), (37, 4, 1, 2), (79, 5, 0, 4), (55, 3, 3, 0), (39, 2, 4, 3), (39, 14, 3, 2), (21, 0, 1, 1), (34, 4, 2, 3), (53, 0, 2, 0), (9, 11, 3, 1), (43, 5, 1, 2), (94, 18, 2, 4), (77, 3, 4, 1), (35, 11, 4, 3), (59, 12, 1, 2), (92, 5, 2, 0), (55, 0, 3, 3), (19, 4, 3, 1), (98, 8, 3, 2), (59, 12, 2, 4), (45, 14, 4, 1), (69, 6, 4, 3), (96, 19, 4, 0), (95, 0, 4, 4), (74, 18, 3, 1), (62, 5, 3, 3), (37, 16, 4, 2), (46, 12, 3, 0), (64, 4, 4, 2), (54, 5, 4, 1), (27, 18, 4, 3), (42, 17, 4, 4), (17, 8, 4, 3), (16, 12, 4, 3)];
@@ -0,0 +1,391 @@
+import argparse
+import glob
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+from pyjobshop import ProblemData
+from pyjobshop.ProblemData import Machine
+from read.read import ProblemVariant, read
+
+CHUNK_SIZE = 4096
+"""int: Number of lines that are joined and written at once."""
+
+UNSUPPORTED = [
+    "start_before_start",
+    "start_before_end",
+    "end_before_end",
+    "identical_resources",
+    "different_resources",
+    "consecutive",
+]
+"""list[str]: Constraint types that the DDO solvers do not support."""
+
+
+def _write_lines(fh, lines: Iterable[str]):
+    """
+    Writes the lines in chunks of :data:`CHUNK_SIZE`, so that large files
+    take few write calls without holding the whole file in memory.
+    """
+    chunk = []
+
+    for line in lines:
+        chunk.append(line)
+
+        if len(chunk) == CHUNK_SIZE:
+            fh.write("\n".join(chunk) + "\n")
+            chunk.clear()
+
+    if chunk:
+        fh.write("\n".join(chunk) + "\n")
+
+
+def _check(data: ProblemData, setup_times: bool = True):
+    """
+    Raises a ValueError when the instance has elements that the DDO input
+    formats cannot express.
+    """
+    for name in UNSUPPORTED:
+        if getattr(data.constraints, name):
+            raise ValueError(f"DDO solvers do not support {name} constraints.")
+
+    if not setup_times and data.constraints.setup_times:
+        raise ValueError("The APP format does not support setup times.")
+
+    if any(delay for *_, delay in data.constraints.end_before_start):
+        raise ValueError("DDO solvers do not support precedence delays.")
+
+    for mode in data.modes:
+        if len(mode.resources) != 1:
+            raise ValueError("DDO solvers only support single-machine modes.")
+
+        if not isinstance(data.resources[mode.resources[0]], Machine):
+            raise ValueError("DDO solvers only support machines.")
+
+
+def _alternatives(data: ProblemData) -> list[list[tuple[int, int]]]:
+    """
+    Returns the (machine, duration) alternatives of each task.
+    """
+    alts: list[list[tuple[int, int]]] = [[] for _ in range(data.num_tasks)]
+
+    for mode in data.modes:
+        alts[mode.task].append((mode.resources[0], mode.duration))
+
+    return alts
+
+
+def _job_line(
+    ops: list[list[tuple[int, int]]], machine_ids: dict[int, int]
+) -> list[str]:
+    """
+    Returns the tokens of the flexible job shop line of a job with the given
+    operations: the number of operations, followed by the number of
+    alternatives of each operation and their (1-indexed) machines and
+    durations.
+    """
+    tokens = [str(len(ops))]
+
+    for alts in ops:
+        tokens.append(str(len(alts)))
+        for machine, duration in alts:
+            tokens += [str(machine_ids[machine]), str(duration)]
+
+    return tokens
+
+
+def _check_routing(data: ProblemData, tasks: list[int]):
+    """
+    Raises a ValueError when a precedence constraint does not follow the
+    order of the given tasks of a job, which the DDO solvers impose.
+    """
+    position = {task: idx for idx, task in enumerate(tasks)}
+
+    for pred, succ, _ in data.constraints.end_before_start:
+        if pred in position and position.get(succ) != position[pred] + 1:
+            msg = f"Precedence {pred} -> {succ} does not follow job routing."
+            raise ValueError(msg)
+
+
+def write_fjsp(loc: Path, data: ProblemData):
+    """
+    Writes the instance in the flexible job shop format of the DDO solvers,
+    with a block of sequence-dependent setup times if the instance has any.
+
+    The tasks of each job are processed in the order of :attr:`Job.tasks`;
+    precedence constraints must follow that order. Machines keep their
+    indices (1-indexed in the file), so that DDO solutions of the file can
+    be converted with :func:`ddo_solution.to_solution`. The setup block has
+    a row per machine and task, and a column per task: the setup time on
+    the machine from the row's task to the column's task. Tasks are numbered
+    by job, in routing order. Missing setup times are zero.
+
+    Parameters
+    ----------
+    loc
+        Location of the file to write.
+    data
+        The problem instance.
+
+    Raises
+    ------
+    ValueError
+        When the instance cannot be expressed in the format, e.g., because
+        it has flow tasks or other constraints than precedence constraints
+        and setup times.
+    """
+    _check(data)
+
+    if data.flows:
+        raise ValueError("Use write_app to export instances with flows.")
+
+    if any(task.job is None for task in data.tasks):
+        raise ValueError("DDO solvers require every task to belong to a job.")
+
+    alts = _alternatives(data)
+    machine_ids = {idx: idx + 1 for idx in range(data.num_resources)}
+    order = [task for job in data.jobs for task in job.tasks]
+
+    for job in data.jobs:
+        _check_routing(data, job.tasks)
+
+    with open(loc, "w") as fh:
+        avg = len(data.modes) / max(data.num_tasks, 1)
+        fh.write(f"{data.num_jobs} {data.num_resources} {avg:g}\n")
+        _write_lines(
+            fh,
+            (
+                " ".join(_job_line([alts[t] for t in job.tasks], machine_ids))
+                for job in data.jobs
+            ),
+        )
+
+        if not data.constraints.setup_times:
+            return
+
+        # Setup times are indexed by the tasks' positions in the file.
+        num_tasks = len(order)
+        index = np.empty(data.num_tasks, dtype=np.int64)
+        index[order] = np.arange(num_tasks)
+
+        machines, frm, to, durations = np.array(
+            data.constraints.setup_times, dtype=np.int64
+        ).T
+        setups = np.zeros((data.num_resources, num_tasks, num_tasks), int)
+        setups[machines, index[frm], index[to]] = durations
+
+        rows = setups.reshape(-1, num_tasks).tolist()
+        _write_lines(fh, (" ".join(map(str, row)) for row in rows))
+
+
+def _plans(data: ProblemData, job_tasks: list[int]) -> list[list[int]]:
+    """
+    Returns the process plans of a job with flows: the tasks on the paths
+    of precedence constraints from the job's flow source to its flow sink.
+    """
+    flows = data.flows
+    roles = {task: flows[task] for task in job_tasks if task in flows}
+    sources = [task for task, role in roles.items() if role == "source"]
+    sinks = {task for task, role in roles.items() if role == "sink"}
+
+    if len(sources) != 1 or len(sinks) != 1:
+        raise ValueError("Jobs with flows need one flow source and sink.")
+
+    succs: dict[int, list[int]] = {}
+    for pred, succ, _ in data.constraints.end_before_start:
+        if pred in roles:
+            succs.setdefault(pred, []).append(succ)
+
+    plans = []
+    stack = [(sources[0], [])]
+
+    while stack:
+        task, path = stack.pop()
+
+        for succ in succs.get(task, []):
+            if succ in sinks:
+                plans.append(path)
+            elif succ in roles:
+                stack.append((succ, path + [succ]))
+
+    return plans[::-1]
+
+
+def process_plans(data: ProblemData) -> list[list[list[int]]]:
+    """
+    Returns the process plans of each job. Jobs without flow tasks have a
+    single plan with their tasks, in the order of :attr:`Job.tasks`. For
+    jobs with flow tasks, as read by ``read.read_app.read_app``, each path
+    of precedence constraints from the job's flow source to its flow sink
+    is a plan, without the source and sink tasks themselves.
+    """
+    plans = []
+
+    for job in data.jobs:
+        if any(task in data.flows for task in job.tasks):
+            plans.append(_plans(data, job.tasks))
+        else:
+            _check_routing(data, job.tasks)
+            plans.append([job.tasks])
+
+    return plans
+
+
+def _used_machines(data: ProblemData, tasks: Iterable[int]) -> list[int]:
+    """
+    Returns the machines that process the given tasks, in index order.
+    """
+    tasks = set(tasks)
+    machines = {mode.resources[0] for mode in data.modes if mode.task in tasks}
+    return sorted(machines)
+
+
+def _is_app(data: ProblemData, problem_variant: Optional[ProblemVariant]):
+    return problem_variant == ProblemVariant.APP or bool(data.flows)
+
+
+def layout(
+    data: ProblemData,
+    problem_variant: Optional[ProblemVariant] = None,
+    original: bool = False,
+) -> tuple[list[list[int]], list[int]]:
+    """
+    Returns how the DDO solvers number the jobs and machines of the file
+    written by :func:`export`: the tasks of each DDO job, in processing
+    order, and the resource of each DDO machine. The APP solver treats each
+    process plan as a separate job.
+
+    If ``original`` is set, the machines are numbered as in the APP file
+    that the instance was read from by ``read.read_app.read_app``, which
+    keeps machines without operations that :func:`write_app` leaves out.
+    """
+    if not _is_app(data, problem_variant):
+        jobs = [job.tasks for job in data.jobs]
+        return jobs, list(range(data.num_resources))
+
+    jobs = [plan for plans in process_plans(data) for plan in plans]
+
+    if original:
+        # Resource 0 is the dummy machine of the flow sources and sinks.
+        return jobs, list(range(1, data.num_resources))
+
+    return jobs, _used_machines(data, (task for job in jobs for task in job))
+
+
+def write_app(loc: Path, data: ProblemData):
+    """
+    Writes the instance in the alternative process plan (APP) format of the
+    DDO solvers, see ``read.read_app.parse_app``. The plans of each job are
+    given by :func:`process_plans`. Machines that only process flow source
+    and sink tasks are not written; the remaining machines keep their
+    relative order.
+
+    Parameters
+    ----------
+    loc
+        Location of the file to write.
+    data
+        The problem instance.
+
+    Raises
+    ------
+    ValueError
+        When the instance cannot be expressed in the format, e.g., because
+        it has setup times.
+    """
+    _check(data, setup_times=False)
+
+    alts = _alternatives(data)
+    jobs = []
+
+    for plans in process_plans(data):
+        ops = sorted({task for plan in plans for task in plan})
+        position = {task: idx for idx, task in enumerate(ops)}
+        jobs.append(([alts[task] for task in ops], plans, position))
+
+    used = _used_machines(data, (op for _, _, pos in jobs for op in pos))
+    machine_ids = {mach: idx + 1 for idx, mach in enumerate(used)}
+
+    def lines():
+        for ops, plans, position in jobs:
+            yield " ".join([str(len(plans)), *_job_line(ops, machine_ids)])
+
+            for plan in plans:
+                indices = [str(position[task]) for task in plan]
+                yield " ".join([str(len(plan)), *indices])
+
+    with open(loc, "w") as fh:
+        num_alts = sum(len(op) for ops, _, _ in jobs for op in ops)
+        num_ops = sum(len(ops) for ops, _, _ in jobs)
+        avg = num_alts / max(num_ops, 1)
+        fh.write(f"{data.num_jobs} {len(used)} {avg:g}\n")
+        _write_lines(fh, lines())
+
+
+def export(
+    loc: Path,
+    data: ProblemData,
+    problem_variant: Optional[ProblemVariant] = None,
+):
+    """
+    Writes the instance in the DDO format that fits the problem variant:
+    the APP format for APP instances, and the flexible job shop format with
+    optional setup times otherwise.
+    """
+    if _is_app(data, problem_variant):
+        write_app(loc, data)
+    else:
+        write_fjsp(loc, data)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Exports instances to the DDO solvers' input formats."
+    )
+
+    msg = "Location of the instance files (glob patterns are expanded)."
+    parser.add_argument("instances", nargs="+", type=Path, help=msg)
+
+    msg = "Scheduling problem variant of the instances."
+    parser.add_argument(
+        "--problem_variant",
+        type=ProblemVariant,
+        choices=[f.value for f in ProblemVariant],
+        required=True,
+        help=msg,
+    )
+
+    msg = "Directory to write the DDO instance files to."
+    parser.add_argument("--out_dir", type=Path, required=True, help=msg)
+
+    msg = "Directory of the parsed-instance cache."
+    parser.add_argument("--cache_dir", type=Path, help=msg)
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+
+    locs = []
+    for pattern in args.instances:
+        matches = sorted(glob.glob(str(pattern)))
+        locs.extend(map(Path, matches) if matches else [pattern])
+
+    for loc in locs:
+        data = read(loc, args.problem_variant, args.cache_dir)
+        out_loc = args.out_dir / f"{loc.stem}.fjs"
+
+        try:
+            export(out_loc, data, args.problem_variant)
+        except ValueError as exc:
+            print(f"Warning: cannot export {loc.name}: {exc}")
+            continue
+
+        print(f"Wrote {out_loc}.")
+
+
+if __name__ == "__main__":
+    main()
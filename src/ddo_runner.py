@@ -0,0 +1,627 @@
+import argparse
+import glob
+import resource
+import signal
+import subprocess
+import time
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from multiprocessing import cpu_count
+from pathlib import Path
+from time import perf_counter
+from typing import Optional
+
+import numpy as np
+from tqdm import tqdm
+
+from artifacts import RUNS_FILE, append_record, open_log, run_dir
+from benchmark import _read as _read_variant
+from benchmark import print_summary
+from ddo_export import layout
+from ddo_solution import parse_decisions, read_instance, to_solution
+from logparse import DDOParser, Run
+from pyjobshop import ProblemData, solve
+from pyjobshop.Result import Result, SolveStatus
+from pyjobshop.ResultsStore import ResultsStore, instance_hash
+from pyjobshop.Solution import Solution
+from pyjobshop.stats import instance_stats
+from read.read import ProblemVariant
+from scheduler import estimate_cost, schedule
+
+SOLVERS = ["app", "blk", "rel"]
+"""list[str]: The DDO solvers, in the ``ddo-fjs-<solver>`` crates."""
+
+SRC_DIR = Path(__file__).parent
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Solves instances with the DDO solvers, in parallel."
+    )
+
+    msg = "Location of the instance files (glob patterns are expanded)."
+    parser.add_argument("instances", nargs="+", type=Path, help=msg)
+
+    msg = "DDO solver (crate ddo-fjs-<solver>) to run."
+    parser.add_argument("--solver", choices=SOLVERS, default="rel", help=msg)
+
+    msg = """
+    Scheduling problem variant whose reader is used to read the instances,
+    to estimate their cost and to convert the DDO solutions, e.g., FJSP for
+    the matrix format. By default, instances are read like the DDO solver
+    does: FJSPLIB or matrix files with optional setup times for the rel and
+    blk solvers, and APP files for the app solver.
+    """
+    parser.add_argument(
+        "--problem_variant",
+        type=ProblemVariant,
+        choices=[f.value for f in ProblemVariant],
+        help=msg,
+    )
+
+    msg = "Maximum width of the decision diagrams. Default 1."
+    parser.add_argument("--width", type=int, default=1, help=msg)
+
+    msg = "Time limit per instance, in (whole) seconds. Default 60."
+    parser.add_argument("--time_limit", type=int, default=60, help=msg)
+
+    msg = "Maximum number of solver threads per instance. Default 8."
+    parser.add_argument(
+        "--num_workers_per_instance", type=int, default=8, help=msg
+    )
+
+    msg = """
+    Total number of threads that may be used at once. Instances get threads
+    in proportion to their estimated cost. Default all CPU cores.
+    """
+    parser.add_argument("--core_budget", type=int, help=msg)
+
+    msg = "Number of instances to solve in parallel. Default no limit."
+    parser.add_argument("--num_parallel_instances", type=int, help=msg)
+
+    msg = """
+    CP solver to continue with after the DDO run (hybrid mode). The DDO
+    solution is its initial solution, and the DDO bound is added as a lower
+    bound on the objective. Not available for the blk solver, which solves
+    the blocking FJSP. Default none.
+    """
+    parser.add_argument(
+        "--cp_solver", choices=["ortools", "cpoptimizer"], help=msg
+    )
+
+    msg = "Time limit of the CP solver in hybrid mode, in seconds. Default 60."
+    parser.add_argument("--cp_time_limit", type=float, default=60, help=msg)
+
+    msg = "Seconds after the time limit after which a run is killed."
+    parser.add_argument("--grace_time", type=float, default=60, help=msg)
+
+    msg = "Memory limit of each run, in megabytes. Default no limit."
+    parser.add_argument("--memory_limit", type=int, help=msg)
+
+    msg = """
+    SQLite database to store results in. Instances already solved with the
+    same configuration are skipped, as in the benchmark script.
+    """
+    parser.add_argument("--results_db", type=Path, help=msg)
+
+    msg = """
+    Directory to write the solver output and run records to, in a
+    ddo-<solver>_<threads>_<time_limit> subdirectory.
+    """
+    parser.add_argument("--artifact_dir", type=Path, help=msg)
+
+    msg = "Whether to gzip-compress the solver output."
+    parser.add_argument("--compress_logs", action="store_true", help=msg)
+
+    msg = "Skip building the solver; use the existing release binary."
+    parser.add_argument("--no_build", action="store_true", help=msg)
+
+    msg = "Directory of the parsed-instance cache."
+    parser.add_argument("--cache_dir", type=Path, help=msg)
+
+    args = parser.parse_args()
+
+    if args.cp_solver is not None and args.solver == "blk":
+        # The CP models do not have blocking constraints, so the blk bounds
+        # are not valid for them, and neither are its optimal solutions.
+        parser.error("hybrid mode is not available for the blk solver.")
+
+    return args
+
+
+def build(solver: str) -> Path:
+    """
+    Builds the release binary of the given DDO solver, and returns its
+    location.
+    """
+    crate = SRC_DIR / f"ddo-fjs-{solver}"
+    subprocess.run(["cargo", "build", "--release"], cwd=crate, check=True)
+    return binary(solver)
+
+
+def binary(solver: str) -> Path:
+    crate = SRC_DIR / f"ddo-fjs-{solver}"
+    return crate / "target" / "release" / crate.name
+
+
+def parse_output(name: str, output: str) -> Run:
+    """
+    Parses the output of a single DDO run.
+    """
+    parser = DDOParser()
+    parser.start(name)
+
+    for line in output.splitlines():
+        parser.feed(line)
+
+    return parser.runs()[0]
+
+
+def _read(
+    instance_loc: Path,
+    solver: str,
+    problem_variant: Optional[ProblemVariant] = None,
+    cache_dir: Optional[Path] = None,
+) -> ProblemData:
+    """
+    Reads the instance like the DDO solver does, see
+    :func:`read.read_ddo.read_ddo_fjsp`, or with the reader of the given
+    problem variant.
+    """
+    if problem_variant is not None:
+        return _read_variant(
+            instance_loc, problem_variant, cache_dir=cache_dir
+        )
+
+    variant = ProblemVariant.APP if solver == "app" else None
+    return read_instance(instance_loc, variant, cache_dir)
+
+
+def _cost(instance_loc: Path, **kwargs) -> float:
+    """
+    Estimates the cost of solving the instance, see ``benchmark._cost``.
+    """
+    if not instance_loc.is_file():
+        return 0.0
+
+    return estimate_cost(instance_stats(_read(instance_loc, **kwargs)))
+
+
+def to_result(run: Run, runtime: float, best: Solution) -> Result:
+    """
+    Converts a parsed DDO run into a result. The DDO solvers maximise the
+    negative makespan, so their "lower" values are the makespans of the
+    solutions found, and their "upper" values are the lower bounds.
+    """
+    # The trace's "bound" column holds the solutions' makespans and its
+    # "best" column the bounds, see above. Missing values are carried over
+    # from earlier entries.
+    cols = run.trace.arrays()
+    objs = np.fmin.accumulate(np.nan_to_num(cols["bound"], nan=np.inf))
+    bounds = np.fmax.accumulate(np.nan_to_num(cols["best"], nan=0))
+    trace = list(zip(cols["time"].tolist(), objs.tolist(), bounds.tolist()))
+
+    # Runs that are killed do not print their final values, so these are
+    # taken from the trace instead.
+    objective = run.lower if run.lower is not None else float("inf")
+    if run.lower is None and len(objs) > 0:
+        objective = objs[-1]
+
+    bound = run.upper if run.upper is not None else 0
+    if run.upper is None and len(bounds) > 0:
+        bound = bounds[-1]
+
+    if run.exact:
+        status = SolveStatus.OPTIMAL
+    elif objective < float("inf"):
+        status = SolveStatus.FEASIBLE
+    else:
+        status = SolveStatus.UNKNOWN
+
+    runtime = run.solve_time if run.solve_time is not None else runtime
+    return Result(objective, bound, status, runtime, best, trace)
+
+
+def _solve(
+    item: tuple[Path, int],
+    num_workers: int,
+    solver: str,
+    problem_variant: Optional[ProblemVariant],
+    width: int,
+    time_limit: int,
+    grace_time: float,
+    memory_limit: Optional[int] = None,
+    artifact_dir: Optional[Path] = None,
+    compress_logs: bool = False,
+    cache_dir: Optional[Path] = None,
+    cp_solver: Optional[str] = None,
+    cp_time_limit: float = 60,
+    **kwargs,
+) -> tuple[Result, dict]:
+    """
+    Solves a single instance with the DDO solver's binary, and returns the
+    result and the structured record of the run. In hybrid mode, i.e., when
+    a ``cp_solver`` is given, the run continues with that solver, see
+    :func:`hand_off`; the record then also has the results of each phase.
+    """
+    instance_loc, _ = item
+    args = [str(binary(solver)), str(instance_loc), str(width)]
+    args += [str(time_limit), str(num_workers)]
+
+    limit_memory = None
+    if memory_limit is not None:
+        # The limit is set in the child before the binary is executed, so
+        # that it also covers the binary's first allocations.
+        limit = memory_limit * 1024**2
+        limit_memory = partial(
+            resource.setrlimit, resource.RLIMIT_AS, (limit, limit)
+        )
+
+    start = perf_counter()
+    with subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        preexec_fn=limit_memory,
+    ) as proc:
+        try:
+            output, _ = proc.communicate(timeout=time_limit + grace_time)
+            code = proc.returncode
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            output, _ = proc.communicate()
+            code = None
+
+    runtime = perf_counter() - start
+    run = parse_output(instance_loc.name, output)
+
+    data = None
+    if run.solution or cp_solver is not None:
+        data = _read(instance_loc, solver, problem_variant, cache_dir)
+
+    best = Solution([])
+    conversion_error = None
+    decisions = parse_decisions(run.solution) if run.solution else []
+    if decisions:
+        try:
+            variant = ProblemVariant.APP if solver == "app" else None
+            jobs, machines = layout(data, variant, original=True)
+            best = to_solution(data, decisions, jobs=jobs, machines=machines)
+        except (IndexError, ValueError) as exc:  # formats do not match
+            conversion_error = str(exc) or type(exc).__name__
+            name = instance_loc.name
+            print(f"Warning: cannot convert solution of {name}: {exc}")
+
+    result = to_result(run, runtime, best)
+    reason = None
+
+    if code is None:
+        result.status = SolveStatus.KILLED
+        timeout = time_limit + grace_time
+        reason = f"Exceeded wall-clock limit of {timeout:.0f}s."
+    elif code != 0:
+        aborted = code in (-signal.SIGABRT, -signal.SIGKILL)
+        if memory_limit is not None and aborted:
+            result.status = SolveStatus.OUT_OF_MEMORY
+        else:
+            result.status = SolveStatus.KILLED
+
+        reason = f"Exited with code {code}."
+
+    label, budget = _run_name(solver, time_limit, cp_solver, cp_time_limit)
+
+    if artifact_dir is not None:
+        max_workers = kwargs["num_workers_per_instance"]
+        log_dir = run_dir(artifact_dir, label, max_workers, budget)
+        log_loc = log_dir / f"{instance_loc.stem}.log"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_file = open_log(log_loc, compress_logs)
+    else:
+        log_file = nullcontext()
+
+    phases = {}
+    with log_file as fh:
+        if fh is not None:
+            fh.write(output)
+
+        if cp_solver is not None and data is not None:
+            # The solver may report a slightly later end than measured here.
+            offset = max(runtime, result.runtime)
+            phases["ddo"] = _phase(result)
+            cp_result = hand_off(
+                data,
+                result,
+                cp_solver,
+                cp_time_limit,
+                num_workers,
+                log_file=fh,
+                offset=offset,
+            )
+            phases["cp"] = _phase(cp_result)
+            result = combine(result, cp_result, offset)
+
+    record = {
+        "instance": instance_loc.name,
+        "path": str(instance_loc),
+        "solver": label,
+        "time_limit": budget,
+        "num_workers": num_workers,
+        "params": {"width": width},
+        "problem_variant": problem_variant,
+        "status": result.status.value,
+        "exact": run.exact,
+        "objective": result.objective,
+        "lower_bound": result.lower_bound,
+        "runtime": result.runtime,
+        "profile": {"solve_wall_time": perf_counter() - start},
+        "trace": result.trace,
+        "solution": run.solution,
+        "finished": time.time(),
+    }
+    if phases:
+        record["phases"] = phases
+    if reason is not None:
+        record["reason"] = reason
+    if conversion_error is not None:
+        record["conversion_error"] = conversion_error
+
+    return result, record
+
+
+def _phase(result: Result) -> dict:
+    return {
+        "status": result.status.value,
+        "objective": result.objective,
+        "lower_bound": result.lower_bound,
+        "runtime": result.runtime,
+    }
+
+
+def _run_name(
+    solver: str,
+    time_limit: float,
+    cp_solver: Optional[str] = None,
+    cp_time_limit: float = 0,
+) -> tuple[str, float]:
+    """
+    Returns the solver label and the total time limit of a (hybrid) run.
+    """
+    if cp_solver is None:
+        return f"ddo-{solver}", time_limit
+
+    return f"ddo-{solver}+{cp_solver}", time_limit + cp_time_limit
+
+
+def hand_off(
+    data: ProblemData,
+    ddo: Result,
+    solver: str,
+    time_limit: float,
+    num_workers: int,
+    log_file=None,
+    offset: float = 0,
+) -> Result:
+    """
+    Continues from a DDO result with a CP solver: the DDO solution, if any,
+    is the initial solution, and the DDO bound is added as a lower bound on
+    the objective. The trace times of the CP result are shifted by the given
+    offset, e.g., the wall time of the DDO run, so that they continue the
+    DDO trace. Optimal DDO results are returned as is.
+    """
+    if ddo.status == SolveStatus.OPTIMAL:
+        return ddo
+
+    if log_file is not None:
+        log_file.write(f"\nContinuing with {solver}.\n")
+
+    result = solve(
+        data,
+        solver=solver,
+        time_limit=time_limit,
+        display=False,
+        log_file=log_file,
+        num_workers=num_workers,
+        initial_solution=ddo.best if ddo.best.tasks else None,
+        objective_bound=ddo.lower_bound if ddo.lower_bound > 0 else None,
+    )
+    trace = [(time_ + offset, obj, bnd) for time_, obj, bnd in result.trace]
+
+    return Result(
+        result.objective,
+        result.lower_bound,
+        result.status,
+        result.runtime,
+        result.best,
+        trace,
+    )
+
+
+def combine(ddo: Result, cp: Result, offset: float) -> Result:
+    """
+    Combines the results of the DDO and CP phases of a hybrid run into the
+    result of the whole run. The combined trace holds the best objective
+    value and bound of either phase at each time, so that it is comparable
+    with the traces of single solvers.
+    """
+    if cp is ddo:
+        return ddo
+
+    objective = min(ddo.objective, cp.objective)
+    bound = max(ddo.lower_bound, cp.lower_bound)
+    best = cp.best if cp.objective <= ddo.objective else ddo.best
+
+    trace = list(ddo.trace)
+    best_obj = trace[-1][1] if trace else float("inf")
+    best_bnd = trace[-1][2] if trace else -float("inf")
+
+    for time_, obj, bnd in cp.trace:
+        best_obj, best_bnd = min(best_obj, obj), max(best_bnd, bnd)
+        trace.append((time_, best_obj, best_bnd))
+
+    runtime = offset + cp.runtime
+    if (best_obj, best_bnd) != (objective, bound):
+        # E.g., the bound of a proof of optimality is not traced.
+        trace.append((runtime, objective, bound))
+
+    if cp.status == SolveStatus.OPTIMAL or objective <= bound:
+        status = SolveStatus.OPTIMAL
+    elif objective < float("inf"):
+        status = SolveStatus.FEASIBLE
+    else:
+        status = cp.status
+
+    return Result(objective, bound, status, runtime, best, trace)
+
+
+def _config(**kwargs) -> dict:
+    """
+    Returns the settings that determine the results of a DDO run, see the
+    benchmark script's configurations.
+    """
+    config = {
+        "solver": f"ddo-{kwargs['solver']}",
+        "time_limit": kwargs["time_limit"],
+        "num_workers_per_instance": kwargs["num_workers_per_instance"],
+        "params": {"width": kwargs["width"]},
+        "problem_variant": kwargs["problem_variant"],
+        "core_budget": kwargs["core_budget"],
+    }
+
+    if kwargs.get("cp_solver") is not None:
+        # Only set in hybrid mode, so that the configurations of plain DDO
+        # runs are unchanged.
+        config["cp_solver"] = kwargs["cp_solver"]
+        config["cp_time_limit"] = kwargs["cp_time_limit"]
+
+    return config
+
+
+def run_ddo(instances: list[Path], **kwargs):
+    """
+    Solves the instances with the DDO solver and prints a table of the
+    results.
+    """
+    locs = sorted(loc for loc in instances if loc.is_file())
+    results_db = kwargs.pop("results_db")
+    num_parallel = kwargs.pop("num_parallel_instances")
+    max_workers = kwargs["num_workers_per_instance"]
+    num_cores = kwargs["core_budget"] = kwargs["core_budget"] or cpu_count()
+
+    if not kwargs.pop("no_build"):
+        build(kwargs["solver"])
+
+    results, traces = [], []
+    store = ResultsStore(results_db) if results_db is not None else None
+    config = _config(**kwargs)
+
+    if store is not None:
+        hashes = {loc: instance_hash(loc) for loc in locs}
+        completed = store.completed(config) & set(hashes.values())
+
+        for res in store.results(config):
+            if res["instance_hash"] in completed:
+                results.append(
+                    (
+                        res["instance"],
+                        res["status"],
+                        res["objective"],
+                        res["lower_bound"],
+                        round(res["runtime"], 2),
+                    )
+                )
+                traces.append(
+                    (
+                        res["instance"],
+                        res["trace"],
+                        res["objective"],
+                        res["runtime"],
+                    )
+                )
+
+        locs = [loc for loc in locs if hashes[loc] not in completed]
+
+    cost_kwargs = {
+        "solver": kwargs["solver"],
+        "problem_variant": kwargs["problem_variant"],
+        "cache_dir": kwargs["cache_dir"],
+    }
+    if len(locs) > 1:
+        with ProcessPoolExecutor(min(num_cores, len(locs))) as executor:
+            costs = list(executor.map(partial(_cost, **cost_kwargs), locs))
+    else:
+        costs = [0.0] * len(locs)
+
+    label, budget = _run_name(
+        kwargs["solver"],
+        kwargs["time_limit"],
+        kwargs.get("cp_solver"),
+        kwargs.get("cp_time_limit", 0),
+    )
+
+    artifact_dir = kwargs["artifact_dir"]
+    if artifact_dir is not None:
+        runs_dir = run_dir(artifact_dir, label, max_workers, budget)
+        runs_dir.mkdir(parents=True, exist_ok=True)
+
+    # The solver processes do the work, so threads suffice to watch them.
+    max_parallel = num_parallel or num_cores
+    func = partial(_solve, **kwargs)
+    items = [(loc, 0) for loc in locs]
+
+    try:
+        with ThreadPoolExecutor(max_parallel) as executor:
+            done = schedule(
+                executor,
+                func,
+                items,
+                costs,
+                num_cores,
+                max_workers,
+                max_parallel,
+            )
+
+            for (loc, _), future in tqdm(done, total=len(items), unit="run"):
+                result, record = future.result()
+
+                if artifact_dir is not None:
+                    append_record(runs_dir / RUNS_FILE, record)
+
+                if store is not None:
+                    store.add(loc.name, hashes[loc], config, result)
+
+                results.append(
+                    (
+                        loc.name,
+                        result.status.value,
+                        result.objective,
+                        result.lower_bound,
+                        round(result.runtime, 2),
+                    )
+                )
+                traces.append(
+                    (loc.name, result.trace, result.objective, result.runtime)
+                )
+    finally:
+        if store is not None:
+            store.close()
+
+    if results:
+        print_summary(results, traces, budget)
+
+
+def main():
+    args = parse_args()
+
+    instances = []
+    for pattern in args.instances:
+        matches = sorted(glob.glob(str(pattern)))
+        instances.extend(map(Path, matches) if matches else [pattern])
+
+    args.instances = instances
+    run_ddo(**vars(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+import argparse
+import ast
+import glob
+import re
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+from ddo_export import layout
+from pyjobshop import ProblemData
+from pyjobshop.Solution import Solution, TaskData
+from pyjobshop.cache import cached_read
+from read.read import ProblemVariant, read
+from read.read_ddo import read_ddo_fjsp
+
+RUN_PATTERN = re.compile(r"Running cargo with argument:.*?([^/\s]+)\s*$")
+SOLUTION_PATTERN = re.compile(r"^\s*Solution:\s*(\[.*\])")
+
+
+class Decision(NamedTuple):
+    """
+    Decision of a DDO solution: the machine that processes the given task
+    of the given job, and its processing time.
+    """
+
+    job: int
+    task: int
+    machine: int
+    duration: int
+
+
+def parse_decisions(text: str) -> list[Decision]:
+    """
+    Parses the decisions of a DDO solution, as printed on the ``Solution:``
+    line of the DDO solvers. Decisions are either (variable, duration, job,
+    task, machine) tuples, which are ordered by their variable (the position
+    in the sequence), or (duration, job, task, machine) tuples, which are
+    already in sequence order.
+    """
+    decisions = ast.literal_eval(text.strip())
+
+    if decisions and len(decisions[0]) == 5:
+        decisions = [dec[1:] for dec in sorted(decisions)]
+
+    return [
+        Decision(job, task, machine, duration)
+        for duration, job, task, machine in decisions
+    ]
+
+
+def read_decisions(loc: Union[str, Path]) -> dict[str, list[Decision]]:
+    """
+    Reads DDO solutions from a DDO log, which may contain the runs of many
+    instances, or from a ``.sol`` file with a single solution (as written by
+    ``log_to_sol.py``). Returns the decisions per instance name (the stem of
+    the instance file name). Empty solutions are skipped.
+    """
+    loc = Path(loc)
+    solutions = {}
+
+    if loc.suffix == ".sol":
+        with open(loc) as fh:
+            decisions = parse_decisions(fh.readline())
+
+        return {loc.stem: decisions} if decisions else {}
+
+    name = None
+    with open(loc) as fh:
+        for line in fh:
+            if match := RUN_PATTERN.match(line):
+                name = Path(match.group(1)).stem
+            elif name and (match := SOLUTION_PATTERN.match(line)):
+                if decisions := parse_decisions(match.group(1)):
+                    solutions[name] = decisions
+
+                name = None
+
+    return solutions
+
+
+def mode_index(data: ProblemData) -> dict[tuple[int, int], list[int]]:
+    """
+    Returns the indices of the single-machine modes of each (task, machine)
+    pair.
+    """
+    index: dict[tuple[int, int], list[int]] = {}
+
+    for idx, mode in enumerate(data.modes):
+        if len(mode.resources) == 1:
+            key = (mode.task, mode.resources[0])
+            index.setdefault(key, []).append(idx)
+
+    return index
+
+
+def setup_index(data: ProblemData) -> dict[tuple[int, int, int], int]:
+    """
+    Returns the setup time of each (machine, task 1, task 2) triple that has
+    a setup time.
+    """
+    return {
+        (machine, task1, task2): duration
+        for machine, task1, task2, duration in data.constraints.setup_times
+    }
+
+
+def to_solution(
+    data: ProblemData,
+    decisions: list[Decision],
+    modes: Optional[dict[tuple[int, int], list[int]]] = None,
+    setups: Optional[dict[tuple[int, int, int], int]] = None,
+    jobs: Optional[list[list[int]]] = None,
+    machines: Optional[list[int]] = None,
+) -> Solution:
+    """
+    Converts the decisions of a DDO solution into a solution of the given
+    problem instance. Tasks are scheduled in the order of the decisions, as
+    in the DDO transition: each task starts once its machine is free and the
+    machine's setup time from the previous task has passed, and once the
+    previous task of its job is done.
+
+    For instances with flows, e.g., with alternative process plans, tasks
+    that the decisions do not schedule are absent, and each job's flow
+    source and sink are placed at the start and end of its scheduled tasks.
+
+    Parameters
+    ----------
+    data
+        The problem instance.
+    decisions
+        Decisions of the DDO solution, in sequence order.
+    modes
+        Mode index of the instance, see :func:`mode_index`. Computed if not
+        given.
+    setups
+        Setup-time index of the instance, see :func:`setup_index`. Computed
+        if not given.
+    jobs
+        Tasks of each job of the DDO solver, see ``ddo_export.layout``.
+        Default the tasks of the instance's jobs.
+    machines
+        Resource of each machine of the DDO solver, see
+        ``ddo_export.layout``. Default the instance's resources.
+
+    Returns
+    -------
+    Solution
+        The solution, e.g., for use as initial solution of ``solve``.
+
+    Raises
+    ------
+    ValueError
+        When a decision does not correspond to a mode of the instance, or
+        when the decisions do not schedule all tasks.
+    """
+    modes = mode_index(data) if modes is None else modes
+    setups = setup_index(data) if setups is None else setups
+    jobs = [job.tasks for job in data.jobs] if jobs is None else jobs
+
+    tasks: list[Optional[TaskData]] = [None] * data.num_tasks
+    machine_free = [0] * data.num_resources
+    machine_last: list[Optional[int]] = [None] * data.num_resources
+    job_free = [0] * len(jobs)
+
+    for job, task_idx, machine, duration in decisions:
+        task = jobs[job][task_idx]
+        machine = machines[machine] if machines is not None else machine
+        candidates = modes.get((task, machine), [])
+        # Prefer the mode with the decision's duration, if there are several.
+        matches = [i for i in candidates if data.modes[i].duration == duration]
+        mode = (matches or candidates or [None])[0]
+
+        if mode is None:
+            msg = f"No mode for task {job}-{task_idx} on machine {machine}."
+            raise ValueError(msg)
+
+        prev = machine_last[machine]
+        setup = setups.get((machine, prev, task), 0) if prev is not None else 0
+        start = max(
+            machine_free[machine] + setup,
+            job_free[job],
+            data.tasks[task].earliest_start,
+        )
+        end = start + data.modes[mode].duration
+
+        tasks[task] = TaskData(mode, [machine], start, end)
+        machine_free[machine] = job_free[job] = end
+        machine_last[machine] = task
+
+    if data.flows:
+        _complete_flows(data, tasks)
+
+    if (missing := tasks.count(None)) > 0:
+        raise ValueError(f"DDO solution does not schedule {missing} tasks.")
+
+    return Solution(tasks)  # type: ignore
+
+
+def _complete_flows(data: ProblemData, tasks: list[Optional[TaskData]]):
+    """
+    Completes a schedule of the tasks on the selected flow paths: the flow
+    source and sink of each job are placed at the start and end of the job's
+    scheduled tasks, and the other unscheduled flow tasks are absent.
+    """
+    starts: dict[int, int] = {}
+    ends: dict[int, int] = {}
+
+    for task, sched in zip(data.tasks, tasks):
+        if sched is not None and task.job is not None:
+            job = task.job
+            starts[job] = min(starts.get(job, sched.start), sched.start)
+            ends[job] = max(ends.get(job, 0), sched.end)
+
+    first_mode = {}
+    for idx, mode in enumerate(data.modes):
+        first_mode.setdefault(mode.task, idx)
+
+    for idx, role in data.flows.items():
+        if tasks[idx] is not None:
+            continue
+
+        mode = first_mode[idx]
+        resources = data.modes[mode].resources
+        job = data.tasks[idx].job
+
+        if role == "source":
+            time = starts.get(job, 0)
+            tasks[idx] = TaskData(mode, resources, time, time)
+        elif role == "sink":
+            time = ends.get(job, 0)
+            tasks[idx] = TaskData(mode, resources, time, time)
+        else:
+            tasks[idx] = TaskData(mode, [], 0, 0, present=False)
+
+
+def find_instance(instance_dir: Path, name: str) -> Optional[Path]:
+    """
+    Returns the instance file in the directory with the given stem, if any.
+    """
+    locs = sorted(instance_dir.glob(f"{name}.*"))
+    return next((loc for loc in locs if loc.is_file()), None)
+
+
+def read_instance(
+    loc: Path,
+    problem_variant: Optional[ProblemVariant] = None,
+    cache_dir: Optional[Path] = None,
+) -> ProblemData:
+    """
+    Reads the instance with the reader of the given problem variant, or, if
+    no variant is given, like the rel and blk DDO solvers do, see
+    :func:`read.read_ddo.read_ddo_fjsp`.
+    """
+    if problem_variant is not None:
+        return read(loc, problem_variant, cache_dir)
+
+    def parse() -> ProblemData:
+        return read_ddo_fjsp(loc).data()
+
+    return cached_read(loc, parse, "DDO-FJSP", cache_dir=cache_dir)
+
+
+def convert(
+    locs: list[Path],
+    instance_dir: Path,
+    problem_variant: Optional[ProblemVariant] = None,
+    cache_dir: Optional[Path] = None,
+) -> dict[str, Solution]:
+    """
+    Converts all DDO solutions in the given logs and ``.sol`` files into
+    solutions of the corresponding instances in ``instance_dir``, read with
+    :func:`read_instance`. Solutions whose instance cannot be found or that
+    cannot be converted are skipped with a warning.
+    """
+    decisions = {}
+    for loc in locs:
+        decisions.update(read_decisions(loc))
+
+    solutions = {}
+    for name, decs in sorted(decisions.items()):
+        instance_loc = find_instance(instance_dir, name)
+        if instance_loc is None:
+            print(f"Warning: no instance {name} in {instance_dir}.")
+            continue
+
+        data = read_instance(instance_loc, problem_variant, cache_dir)
+        jobs, machines = layout(data, problem_variant, original=True)
+
+        try:
+            solutions[name] = to_solution(
+                data, decs, jobs=jobs, machines=machines
+            )
+        except (IndexError, ValueError) as exc:  # formats do not match
+            print(f"Warning: cannot convert solution of {name}: {exc}")
+
+    return solutions
+
+
+def write_solution(loc: Path, solution: Solution):
+    """
+    Writes the solution as CSV with the mode, start and end of each task.
+    """
+    with open(loc, "w") as fh:
+        fh.write("task,mode,start,end\n")
+        for idx, task in enumerate(solution.tasks):
+            fh.write(f"{idx},{task.mode},{task.start},{task.end}\n")
+
+
+def read_solution(
+    loc: Path,
+    data: ProblemData,
+    problem_variant: Optional[ProblemVariant] = None,
+) -> Solution:
+    """
+    Reads a solution written by :func:`write_solution` or by the benchmark
+    script, or converts the DDO solution of a ``.sol`` file written by
+    ``log_to_sol.py``. The DDO jobs and machines are mapped to the instance
+    as read by the reader of the given problem variant, see
+    ``ddo_export.layout``.
+    """
+    with open(loc) as fh:
+        lines = fh.read().splitlines()
+
+    if lines and lines[0].lstrip().startswith("["):
+        jobs, machines = layout(data, problem_variant, original=True)
+        decisions = parse_decisions(lines[0])
+        return to_solution(data, decisions, jobs=jobs, machines=machines)
+
+    header = lines.index("task,mode,start,end")
+    tasks = []
+
+    for line in lines[header + 1 :]:
+        _, mode, start, end = map(int, line.split(","))
+        resources = data.modes[mode].resources if mode >= 0 else []
+        tasks.append(TaskData(mode, resources, start, end, mode >= 0))
+
+    return Solution(tasks)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Converts DDO solutions into PyJobShop solutions."
+    )
+
+    msg = "DDO logs or .sol files (glob patterns are expanded)."
+    parser.add_argument("locs", nargs="+", type=Path, help=msg)
+
+    msg = "Directory with the instances that the DDO solutions belong to."
+    parser.add_argument("--instance_dir", type=Path, required=True, help=msg)
+
+    msg = """
+    Scheduling problem variant of the instances. By default, the instances
+    are read like the rel and blk DDO solvers do.
+    """
+    parser.add_argument(
+        "--problem_variant",
+        type=ProblemVariant,
+        choices=[f.value for f in ProblemVariant],
+        help=msg,
+    )
+
+    msg = "Directory to write the solutions to (one CSV file per instance)."
+    parser.add_argument("--out_dir", type=Path, help=msg)
+
+    msg = "Directory of the parsed-instance cache."
+    parser.add_argument("--cache_dir", type=Path, help=msg)
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    locs = []
+    for pattern in args.locs:
+        matches = sorted(glob.glob(str(pattern)))
+        locs.extend(map(Path, matches) if matches else [pattern])
+
+    solutions = convert(
+        locs, args.instance_dir, args.problem_variant, args.cache_dir
+    )
+
+    if args.out_dir is not None:
+        args.out_dir.mkdir(parents=True, exist_ok=True)
+
+    for name, solution in solutions.items():
+        makespan = max(task.end for task in solution.tasks)
+        print(f"{name}: makespan {makespan}")
+
+        if args.out_dir is not None:
+            write_solution(args.out_dir / f"{name}.sol", solution)
+
+
+if __name__ == "__main__":
+    main()
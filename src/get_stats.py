@@ -1,43 +1,145 @@
-from pyjobshop.read import read
-import os
-
-# file = r"fjsp-sdst\fattahi\Fattahi_setup_15.fjs"
-
-folder = "Instances/FJSP/Naderi"
-files = []
-
-for root, _, filenames in os.walk(folder):
-    for f in filenames:
-        if f.endswith(".fjs"):
-            # if not 'kacem' in os.path.join(root, f):
-            #     continue
-            # if 'sdata' in os.path.join(root, f):
-            #     continue
-            files.append(os.path.join(root, f))
-            
-total_tasks = 0; total_jobs = 0; total_modes = 0
-min_jobs = 1000; max_jobs = 0
-min_machs = 1000; max_machs = 0
-min_ops = 1000; max_ops = 0
-flexibility = 0
-
-for file in files:
-    # print(f"{file: <25} | ", end = '')
-    
-    d = read(file, setup=False)
-    # print(d.num_tasks, d.num_jobs, d.num_modes, d.num_resources)
-    total_jobs += d.num_jobs
-    total_tasks += d.num_tasks
-    total_modes += d.num_modes
-    flexibility += (d.num_modes / d.num_tasks) / d.num_resources
-    
-    min_jobs = min(min_jobs, d.num_jobs)
-    max_jobs = max(max_jobs, d.num_jobs)
-    
-    min_machs = min(min_machs, d.num_resources)
-    max_machs = max(max_machs, d.num_resources)
-    
-    min_ops = min(min_ops, d.num_tasks)
-    max_ops = max(max_ops, d.num_tasks)
-    
-print(f"Instances: {len(files)}, Jobs: {min_jobs}-{max_jobs}, Machines: {min_machs}-{max_machs}, Operations: {round(total_tasks / total_jobs, 1)}, Machines/ops: {round(total_modes / total_tasks, 1)}, Flexibility: {round(flexibility / len(files), 2)}", )
\ No newline at end of file
+import argparse
+import csv
+import glob
+from dataclasses import asdict, fields
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from tqdm.contrib.concurrent import process_map
+
+import pyjobshop
+from pyjobshop import ProblemData
+from pyjobshop.read import InstanceFormat
+from pyjobshop.stats import InstanceStats, instance_stats
+from read.read import ProblemVariant, read
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Computes per-instance and aggregate statistics."
+    )
+
+    msg = "Location of the instance files (glob patterns are expanded)."
+    parser.add_argument("instances", nargs="+", type=Path, help=msg)
+
+    msg = """
+    Scheduling problem variant to read. If not given, the instances are read
+    with pyjobshop.read() using the given instance format.
+    """
+    parser.add_argument(
+        "--problem_variant",
+        type=ProblemVariant,
+        choices=[f.value for f in ProblemVariant],
+        help=msg,
+    )
+
+    msg = "File format of the instances, if no problem variant is given."
+    parser.add_argument(
+        "--instance_format",
+        type=InstanceFormat,
+        default=InstanceFormat.FJSPLIB,
+        choices=[f.value for f in InstanceFormat],
+        help=msg,
+    )
+
+    msg = "Directory of the parsed-instance cache."
+    parser.add_argument("--cache_dir", type=Path, help=msg)
+
+    msg = "Number of processes used to read the instances. Default 1."
+    parser.add_argument("--num_procs", type=int, default=1, help=msg)
+
+    msg = "CSV file to write the per-instance statistics to."
+    parser.add_argument("--out", type=Path, help=msg)
+
+    return parser.parse_args()
+
+
+def _stats(
+    instance_loc: Path,
+    problem_variant: Optional[ProblemVariant],
+    instance_format: InstanceFormat,
+    cache_dir: Optional[Path],
+) -> InstanceStats:
+    if instance_loc.suffix == ".pjs":
+        data = ProblemData.load(instance_loc)
+    elif problem_variant is not None:
+        data = read(instance_loc, problem_variant, cache_dir)
+    else:
+        data = pyjobshop.read(instance_loc, instance_format, cache_dir=cache_dir)
+
+    return instance_stats(data)
+
+
+def tabulate(headers: list[str], rows: list[list]) -> str:
+    """
+    Creates a simple table from the given header and row data.
+    """
+    lens = [len(header) for header in headers]
+
+    for row in rows:
+        for idx, cell in enumerate(row):
+            lens[idx] = max(lens[idx], len(str(cell)))
+
+    header = [
+        "  ".join(f"{hdr:<{ln}s}" for ln, hdr in zip(lens, headers)),
+        "  ".join("-" * ln for ln in lens),
+    ]
+
+    content = ["  ".join(f"{c!s:>{ln}s}" for ln, c in zip(lens, r)) for r in rows]
+
+    return "\n".join(header + content)
+
+
+def main():
+    args = parse_args()
+
+    instances = []
+    for pattern in args.instances:
+        matches = sorted(glob.glob(str(pattern)))
+        instances.extend(map(Path, matches) if matches else [pattern])
+
+    instances = [loc for loc in instances if loc.is_file()]
+
+    if not instances:
+        print("No instances found.")
+        return
+
+    func = partial(
+        _stats,
+        problem_variant=args.problem_variant,
+        instance_format=args.instance_format,
+        cache_dir=args.cache_dir,
+    )
+    stats = process_map(
+        func,
+        instances,
+        max_workers=args.num_procs,
+        chunksize=max(1, len(instances) // (16 * args.num_procs)),
+        unit="instance",
+    )
+
+    columns = [field.name for field in fields(InstanceStats)]
+
+    if args.out is not None:
+        with open(args.out, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, ["instance"] + columns)
+            writer.writeheader()
+            for loc, stat in zip(instances, stats):
+                writer.writerow({"instance": str(loc), **asdict(stat)})
+
+    values = np.array([[getattr(stat, col) for col in columns] for stat in stats])
+    rows = [
+        [col, f"{col_min:.6g}", f"{col_mean:.6g}", f"{col_max:.6g}"]
+        for col, col_min, col_mean, col_max in zip(
+            columns, values.min(axis=0), values.mean(axis=0), values.max(axis=0)
+        )
+    ]
+
+    print(f"\nInstances: {len(stats)}\n")
+    print(tabulate(["Statistic", "Min", "Mean", "Max"], rows))
+
+
+if __name__ == "__main__":
+    main()
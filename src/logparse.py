@@ -0,0 +1,637 @@
+import os
+import re
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import partial
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+from artifacts import NO_SOLUTION
+
+Number = Optional[float]
+
+
+@dataclass
+class Trace:
+    """
+    Columnar trace of a solver run: the time, lower bound, best objective
+    value and optimality gap (in percent) of each progress entry. Values that
+    the log does not report are ``None``.
+    """
+
+    time: list[Number] = field(default_factory=list)
+    bound: list[Number] = field(default_factory=list)
+    best: list[Number] = field(default_factory=list)
+    gap: list[Number] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def append(self, time: Number, bound: Number, best: Number, gap: Number):
+        self.time.append(time)
+        self.bound.append(bound)
+        self.best.append(best)
+        self.gap.append(gap)
+
+    def copy(self) -> "Trace":
+        return Trace(
+            list(self.time), list(self.bound), list(self.best), list(self.gap)
+        )
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        """
+        Returns the columns as float arrays, with NaN for missing values.
+        """
+        return {
+            name: np.array(
+                [np.nan if val is None else val for val in column],
+                dtype=float,
+            )
+            for name, column in self.columns().items()
+        }
+
+    @classmethod
+    def from_entries(cls, entries: list[dict[str, Number]]) -> "Trace":
+        """
+        Creates a trace from progress entries, see :meth:`entries`.
+        """
+        trace = cls()
+        for entry in entries:
+            trace.append(
+                entry["time"], entry["bound"], entry["best"], entry["gap"]
+            )
+
+        return trace
+
+    def at(self, cutoffs: Sequence[float]) -> dict[str, np.ndarray]:
+        """
+        Returns the state of the run at each of the given cutoff times: the
+        latest lower bound and best objective value reported up to the
+        cutoff, the resulting gap (in percent), and the time of the latest
+        entry. Values are NaN if nothing was reported up to the cutoff.
+        """
+        arrays = self.arrays()
+        times = arrays["time"]
+        cutoffs = np.asarray(cutoffs, dtype=float)
+
+        if np.any(times[1:] < times[:-1]):
+            order = np.argsort(times, kind="stable")
+            arrays = {name: column[order] for name, column in arrays.items()}
+            times = arrays["time"]
+
+        # Index of the last entry up to each cutoff, and of the last entry
+        # that reported a bound or best value up to each entry.
+        idcs = np.searchsorted(times, cutoffs, side="right") - 1
+        state = {"time": _take(times, idcs)}
+
+        for name in ["bound", "best"]:
+            column = arrays[name]
+            has_value = ~np.isnan(column)
+            last = np.where(has_value, np.arange(len(column)), -1)
+            last = np.maximum.accumulate(last)
+            state[name] = _take(column, _take(last, idcs, -1).astype(int))
+
+        # The DDO solvers maximise, so their bounds can be the other way
+        # around; the gap is relative to the larger value.
+        bound, best = state["bound"], state["best"]
+        scale = np.maximum(np.abs(bound), np.abs(best))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            gap = np.where(scale > 0, np.abs(best - bound) / scale * 100, 0.0)
+
+        state["gap"] = np.where(np.isnan(bound) | np.isnan(best), np.nan, gap)
+        return state
+
+    def columns(self) -> dict[str, list[Number]]:
+        return {
+            "time": self.time,
+            "bound": self.bound,
+            "best": self.best,
+            "gap": self.gap,
+        }
+
+    def entries(self) -> list[dict[str, Number]]:
+        """
+        Returns the progress entries as dictionaries, as used by the
+        log-analysis scripts.
+        """
+        return [
+            {"time": time, "bound": bound, "best": best, "gap": gap}
+            for time, bound, best, gap in zip(
+                self.time, self.bound, self.best, self.gap
+            )
+        ]
+
+
+def _take(values: np.ndarray, idcs: np.ndarray, fill=np.nan) -> np.ndarray:
+    """
+    Returns the values at the given indices, or ``fill`` for negative ones.
+    """
+    if not len(values):
+        return np.full(len(idcs), fill, dtype=float)
+
+    return np.where(idcs >= 0, values[np.maximum(idcs, 0)], fill)
+
+
+@dataclass
+class Run:
+    """
+    Parsed solver run. Values that the log does not (yet) report are
+    ``None``.
+    """
+
+    file: str
+    status: Optional[str] = None
+    solve_time: Number = None
+    time_limit: Optional[int] = None
+    workers: Optional[int] = None
+    variables: Optional[int] = None
+    constraints: Optional[int] = None
+    exact: Optional[bool] = None
+    lower: Number = None
+    upper: Number = None
+    gap: Number = None
+    solution: Optional[str] = None
+    trace: Trace = field(default_factory=Trace)
+
+    def stats(self) -> dict:
+        """
+        Returns the run in the statistics format of the log-analysis scripts,
+        with the trace as a list of progress entries.
+        """
+        return {
+            "file": self.file,
+            "variables": self.variables,
+            "constraints": self.constraints,
+            "time_limit": self.time_limit,
+            "workers": self.workers,
+            "status": self.status,
+            "solve_time": self.solve_time,
+            "exact": self.exact,
+            "progress": self.trace.entries(),
+        }
+
+
+class LogParser:
+    """
+    Base class of the line-streaming log parsers. Lines are fed one at a
+    time with :meth:`feed`, and :meth:`runs` returns the runs parsed so far,
+    so a parser can keep consuming a log that is still being written.
+    """
+
+    def __init__(self, file: str = ""):
+        self.file = file
+
+    def feed(self, line: str):
+        raise NotImplementedError
+
+    def runs(self) -> list[Run]:
+        raise NotImplementedError
+
+
+class CPSATParser(LogParser):
+    """
+    Parser of OR-Tools CP-SAT logs, one run per log.
+    """
+
+    MODEL = re.compile(r"var:\d+/(\d+)\s+constraints:\d+/(\d+)")
+    BOUND = re.compile(
+        r"#Bound\s+([0-9\.]+)s\s+best:([^\s]+)\s+next:\[([^,]+),([^\]]+)\]"
+    )
+    SOLUTION = re.compile(
+        r"#\d+\s+([0-9\.]+)s\s+best:([0-9\.]+)\s+next:\[([^,]+),"
+    )
+    ITERATION = re.compile(r"#\d+")
+
+    # Fields of which the first occurrence in the log is used.
+    FIELDS = {
+        "time_limit": (re.compile(r"max_time_in_seconds:\s*(\d+)"), int),
+        "workers": (re.compile(r"num_workers:\s*(\d+)"), int),
+        "status": (
+            re.compile(r"status:\s*(OPTIMAL|FEASIBLE)"),
+            str.capitalize,
+        ),
+        "solve_time": (re.compile(r"walltime:\s*([0-9\.]+)"), float),
+        "objective": (re.compile(r"objective:\s*([0-9\.e\+]+)"), float),
+        "best_bound": (re.compile(r"best_bound:\s*([0-9\.e\+]+)"), float),
+    }
+
+    def __init__(self, file: str = ""):
+        super().__init__(file)
+        self.run = Run(file)
+        self.values: dict = {}
+        self.first_bound = True
+
+    def feed(self, line: str):
+        # Progress records do not always start on a new line.
+        for segment in line.replace("#", "\n#").split("\n"):
+            if segment:
+                self._feed(segment)
+
+    def _feed(self, segment: str):
+        for name, (pattern, convert) in self.FIELDS.items():
+            if name not in self.values and (match := pattern.search(segment)):
+                self.values[name] = convert(match.group(1))
+
+        run = self.run
+        if run.variables is None and segment.startswith("#Model"):
+            if match := self.MODEL.search(segment):
+                run.variables = int(match.group(1))
+                run.constraints = int(match.group(2))
+
+        segment = segment.strip()
+        if segment.startswith("#Bound"):
+            if not (match := self.BOUND.search(segment)):
+                return
+
+            lb = float(match.group(3))
+            if self.first_bound or match.group(2) == "inf":
+                ub, gap = float(NO_SOLUTION), 100.0
+                self.first_bound = False
+            else:
+                ub = float(match.group(2))
+                gap = (1 - lb / ub) * 100
+
+            run.trace.append(float(match.group(1)), lb, ub, gap)
+        elif self.ITERATION.match(segment):
+            if not (match := self.SOLUTION.search(segment)):
+                return
+
+            try:
+                lb = float(match.group(3))
+            except ValueError:
+                return
+
+            ub = float(match.group(2))
+            gap = (1 - lb / ub) * 100
+            run.trace.append(float(match.group(1)), lb, ub, gap)
+
+    def runs(self) -> list[Run]:
+        values = self.values
+        run = replace(self.run, trace=self.run.trace.copy())
+        run.time_limit = values.get("time_limit")
+        run.workers = values.get("workers")
+        run.status = values.get("status")
+        run.solve_time = values.get("solve_time")
+        run.upper = obj = values.get("objective")
+        run.lower = bound = values.get("best_bound")
+
+        if None not in (obj, bound, run.solve_time):
+            gap = (1 - bound / obj) * 100 if obj != 0 else 0.0
+            run.trace.append(run.solve_time, bound, obj, gap)
+
+        return [run]
+
+
+class CPOParser(LogParser):
+    """
+    Parser of IBM CP Optimizer logs, one run per log.
+    """
+
+    MODEL = re.compile(
+        r"Minimization problem - (\d+) variables, (\d+) constraints"
+    )
+    TIME_LIMIT = re.compile(r"TimeLimit\s*=\s*(\d+)")
+    WORKERS = re.compile(r"Workers\s*=\s*(\d+)")
+    SOLVE_TIME = re.compile(r"Time spent in solve\s*:\s*([\d\.]+)s")
+    NEW_BOUND = re.compile(r"\+ New bound is (\d+)")
+    GAP = re.compile(r"gap is ([\d\.]+)%")
+
+    def __init__(self, file: str = ""):
+        super().__init__(file)
+        self.run = Run(file, status="Unknown")
+        self.current_lb: Optional[int] = None
+        self.latest_time: Number = None
+
+    def feed(self, line: str):
+        run = self.run
+
+        if run.variables is None and (match := self.MODEL.search(line)):
+            run.variables = int(match.group(1))
+            run.constraints = int(match.group(2))
+        if run.time_limit is None and (match := self.TIME_LIMIT.search(line)):
+            run.time_limit = int(match.group(1))
+        if run.workers is None and (match := self.WORKERS.search(line)):
+            run.workers = int(match.group(1))
+        if run.solve_time is None and (match := self.SOLVE_TIME.search(line)):
+            run.solve_time = float(match.group(1))
+
+        if "Search completed" in line:
+            run.status = "Optimal"
+        elif "Search terminated" in line and run.status != "Optimal":
+            run.status = "Feasible"
+
+        line = line.strip()
+        if line.startswith("+ New bound is"):
+            if not (match := self.NEW_BOUND.search(line)):
+                return
+
+            lb = int(match.group(1))
+            if self.current_lb is None:
+                # The first bound is found before any solution.
+                time, ub, gap = 0.01, NO_SOLUTION, 100.0
+            else:
+                time = self.latest_time if self.latest_time else 0.01
+                gap = self._gap(line)
+                ub = None
+                if gap is not None and gap < 100:
+                    ub = int(round(lb / (1 - gap / 100)))
+
+            self.current_lb = lb
+            run.trace.append(time, lb, ub, gap)
+        elif line.startswith("*"):
+            # For example: *  588   33   0.09s  1  (gap is 31.46%)
+            parts = line.split()
+            try:
+                best = float(parts[1])
+                time = float(parts[3].rstrip("s"))
+            except (IndexError, ValueError):
+                return
+
+            self.latest_time = time
+            run.trace.append(time, self.current_lb, best, self._gap(line))
+
+    def _gap(self, line: str) -> Number:
+        match = self.GAP.search(line)
+        return float(match.group(1)) if match else None
+
+    def runs(self) -> list[Run]:
+        run = replace(self.run, trace=self.run.trace.copy())
+        trace = run.trace
+
+        if trace:
+            run.lower, run.upper = trace.bound[-1], trace.best[-1]
+
+        if trace and run.solve_time is not None:
+            # The final state of the search holds until the end of the run.
+            trace.append(run.solve_time, run.lower, run.upper, trace.gap[-1])
+
+        return [run]
+
+
+class DDOParser(LogParser):
+    """
+    Parser of the (concatenated) logs of the DDO solvers' ``run_all.sh``
+    scripts, with one run per instance. Runs start with a "Running cargo
+    with argument: <instance>" line and end with a separator line.
+    """
+
+    START = re.compile(r"Running cargo with argument:.*?([^/\s]+)\s*$")
+    LB = re.compile(r"LB:\s*(\d+)\s*\(([0-9\.]+)\)")
+    UB = re.compile(r"UB:\s*(\d+)\s*\(([0-9\.]+)\)")
+    EXACT = re.compile(r"Exact:\s*(true|false)", re.IGNORECASE)
+    DURATION = re.compile(r"Duration:\s*([0-9\.]+) seconds")
+    LOWER = re.compile(r"Lower Bnd:\s*(-?\d+)")
+    UPPER = re.compile(r"Upper Bnd:\s*(-?\d+)")
+    GAP = re.compile(r"Gap:\s*([0-9\.]+)")
+    SOLUTION = re.compile(r"Solution:\s*(\[.*\])")
+
+    def __init__(self, file: str = ""):
+        super().__init__(file)
+        self.done: list[Run] = []
+        self.run: Optional[Run] = None
+        self.current_lb: Optional[int] = None
+
+    def start(self, file: str):
+        """
+        Starts the run of the given instance file, e.g., to parse the output
+        of a single run, which has no start line.
+        """
+        self._close()
+        self.run = Run(file)
+        self.current_lb = None
+
+    def feed(self, line: str):
+        if match := self.START.match(line):
+            self.start(match.group(1))
+            return
+
+        if line.strip().startswith("---"):
+            self._close()
+            return
+
+        if (run := self.run) is None:
+            return
+
+        line = line.rstrip()
+        if match := self.LB.match(line):
+            self.current_lb = int(match.group(1))
+            time = float(match.group(2))
+            run.trace.append(time, self.current_lb, None, None)
+        elif match := self.UB.match(line):
+            time = float(match.group(2))
+            run.trace.append(time, self.current_lb, int(match.group(1)), None)
+        elif match := self.EXACT.match(line):
+            run.exact = match.group(1).lower() == "true"
+        elif match := self.DURATION.match(line):
+            run.solve_time = float(match.group(1))
+        elif match := self.LOWER.match(line):
+            run.lower = int(match.group(1))
+        elif match := self.UPPER.match(line):
+            run.upper = int(match.group(1))
+        elif match := self.GAP.match(line):
+            run.gap = float(match.group(1))
+        elif match := self.SOLUTION.match(line):
+            run.solution = match.group(1)
+
+    def _close(self):
+        if self.run is not None:
+            self.done.append(self.run)
+
+        self.run = None
+
+    def _finish(self, run: Run) -> Run:
+        run = replace(run, trace=run.trace.copy())
+        trace = run.trace
+
+        # Fall back to the last traced bounds if there is no summary.
+        if run.lower is None:
+            bounds = [lb for lb in trace.bound if lb is not None]
+            run.lower = bounds[-1] if bounds else None
+        if run.upper is None:
+            bests = [ub for ub in trace.best if ub is not None]
+            run.upper = bests[-1] if bests else None
+
+        if run.solve_time is not None and None not in (run.lower, run.upper):
+            trace.append(run.solve_time, run.lower, run.upper, run.gap)
+
+        # The DDO solvers maximise the negated makespan, so the "Lower Bnd"
+        # is the makespan of the best solution and the "Upper Bnd" is a
+        # bound on it, which the solvers report even without a solution.
+        if run.exact:
+            run.status = "Optimal"
+        elif run.lower is not None or run.solution is not None:
+            run.status = "Feasible"
+
+        return run
+
+    def runs(self) -> list[Run]:
+        runs = self.done + ([self.run] if self.run is not None else [])
+        return [self._finish(run) for run in runs]
+
+
+def bounds_at(
+    traces: Sequence[Trace], cutoffs: Sequence[float]
+) -> dict[str, np.ndarray]:
+    """
+    Returns the state of each run at each cutoff time, see :meth:`Trace.at`,
+    as arrays of shape (number of traces, number of cutoffs).
+    """
+    shape = (len(traces), len(cutoffs))
+    states = [trace.at(cutoffs) for trace in traces]
+    names = ["time", "bound", "best", "gap"]
+
+    return {
+        name: np.array([state[name] for state in states]).reshape(shape)
+        for name in names
+    }
+
+
+def scalar(value: float) -> Union[int, float, None]:
+    """
+    Converts an array value to a Python number: ``None`` if it is NaN, and
+    an integer if it is integral.
+    """
+    value = float(value)
+
+    if np.isnan(value):
+        return None
+
+    return int(value) if value.is_integer() else value
+
+
+PARSERS: dict[str, type[LogParser]] = {
+    "cpsat": CPSATParser,
+    "cpo": CPOParser,
+    "ddo": DDOParser,
+}
+"""dict: Log parser of each log format."""
+
+
+_CHUNK_SIZE = 1 << 16
+_GZIP_WBITS = zlib.MAX_WBITS | 16
+
+
+class LogTail:
+    """
+    Incrementally parses a log file that may still be written to. Each call
+    to :meth:`poll` parses the complete lines added since the previous call.
+
+    Parameters
+    ----------
+    loc
+        Location of the log file. Gzip-compressed logs (``.gz``) are
+        supported.
+    fmt
+        Log format, one of ``PARSERS``.
+    offset
+        Byte offset to start parsing from, e.g., the ``offset`` of an earlier
+        tail of the same file. Default 0. For gzip-compressed logs, this is
+        an offset in the decompressed log.
+    """
+
+    def __init__(self, loc: Union[str, Path], fmt: str, offset: int = 0):
+        self.loc = Path(loc)
+        self.offset = offset
+        self.parser = PARSERS[fmt](self.loc.name.removesuffix(".gz"))
+
+        # Gzip logs cannot be seeked into without decompressing everything
+        # before the offset, so the decompressor is kept between polls. It
+        # continues from the compressed offset, and holds back the partially
+        # written last line that it already decompressed.
+        self._inflate = zlib.decompressobj(_GZIP_WBITS)
+        self._gzip_offset = 0
+        self._skip = offset
+        self._pending = b""
+
+    def poll(self, final: bool = False) -> list[Run]:
+        """
+        Parses the lines added since the last poll and returns the runs parsed
+        so far. A partially written last line is left for the next poll,
+        unless ``final`` is set.
+        """
+        gzipped = self.loc.suffix == ".gz"
+
+        for raw in self._read_gzip() if gzipped else self._read():
+            if not raw.endswith(b"\n") and not final:
+                break
+
+            for line in raw.decode(errors="replace").splitlines():
+                self.parser.feed(line)
+
+            self.offset += len(raw)
+
+        return self.parser.runs()
+
+    def _read(self) -> Iterator[bytes]:
+        with open(self.loc, "rb") as fh:
+            fh.seek(self.offset)
+            yield from fh
+
+    def _read_gzip(self) -> Iterator[bytes]:
+        with open(self.loc, "rb") as fh:
+            fh.seek(self._gzip_offset)
+
+            for chunk in iter(partial(fh.read, _CHUNK_SIZE), b""):
+                self._gzip_offset += len(chunk)
+                data = self._decompress(chunk)
+
+                if self._skip:
+                    skipped = min(self._skip, len(data))
+                    data, self._skip = data[skipped:], self._skip - skipped
+
+                *lines, self._pending = (self._pending + data).split(b"\n")
+                for line in lines:
+                    yield line + b"\n"
+
+        if self._pending:
+            yield self._pending
+            self._pending = b""
+
+    def _decompress(self, chunk: bytes) -> bytes:
+        data = b""
+        while chunk:
+            data += self._inflate.decompress(chunk)
+
+            # Appending to a gzip file starts a new member.
+            if not self._inflate.eof:
+                break
+
+            chunk = self._inflate.unused_data
+            self._inflate = zlib.decompressobj(_GZIP_WBITS)
+
+        return data
+
+
+def parse_file(loc: Union[str, Path], fmt: str) -> list[Run]:
+    """
+    Parses the runs of the given log file.
+    """
+    return LogTail(loc, fmt).poll(final=True)
+
+
+def parse_dir(
+    loc: Union[str, Path],
+    fmt: str,
+    pattern: str = "*.log",
+    max_workers: Optional[int] = None,
+) -> list[Run]:
+    """
+    Parses the log files in the given directory that match the glob pattern,
+    in parallel, and returns their runs in file-name order.
+    """
+    locs = sorted(Path(loc).glob(pattern))
+
+    if len(locs) <= 1 or max_workers == 1:
+        parsed = map(partial(parse_file, fmt=fmt), locs)
+        return [run for runs in parsed for run in runs]
+
+    num_workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(locs) // (4 * num_workers))
+
+    with ProcessPoolExecutor(num_workers) as executor:
+        func = partial(parse_file, fmt=fmt)
+        parsed = executor.map(func, locs, chunksize=chunksize)
+        return [run for runs in parsed for run in runs]
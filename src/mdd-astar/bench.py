@@ -0,0 +1,76 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# statistics printed by main.py
+PATTERNS = {
+    "generated": re.compile(r"States calculated: (\d+)"),
+    "expanded": re.compile(r"States expanded: (\d+)"),
+    "duplicates": re.compile(r"Duplicates pruned: (\d+)"),
+    "dominated": re.compile(r"Dominated states pruned: (\d+)"),
+    "runtime": re.compile(r"Run-time: ([\d.]+)s"),
+}
+
+HERE = Path(__file__).parent
+
+
+def run(instance, dominance=True):
+    # the instance is selected when the modules are imported, so every run
+    # gets a fresh interpreter
+    env = {**os.environ, "MDD_ASTAR_INSTANCE": instance}
+    out = subprocess.run(
+        [sys.executable, "main.py"] + ([] if dominance else ["--no-dominance"]),
+        cwd=HERE,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    return {
+        name: float(pattern.search(out).group(1))
+        for (name, pattern) in PATTERNS.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks node expansions and run-time of the A* search."
+    )
+    parser.add_argument("instances", nargs="*", default=["small", "large"])
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument(
+        "--compare", action="store_true",
+        help="also run without dominance pruning, and report the expansions saved",
+    )
+    args = parser.parse_args()
+
+    settings = [True, False] if args.compare else [True]
+
+    print(f"{'Instance':<10} {'Dominance':>10} {'Generated':>10} {'Expanded':>10} {'Pruned':>10} {'Dominated':>10} {'Time (s)':>10}")
+    for instance in args.instances:
+        expanded = {}
+
+        for dominance in settings:
+            runs = [run(instance, dominance) for _ in range(args.repeats)]
+            stats = runs[0]
+            runtime = statistics.median(r["runtime"] for r in runs)
+            expanded[dominance] = stats["expanded"]
+
+            print(
+                f"{instance:<10} {'yes' if dominance else 'no':>10} {stats['generated']:>10.0f} "
+                f"{stats['expanded']:>10.0f} {stats['duplicates']:>10.0f} "
+                f"{stats['dominated']:>10.0f} {runtime:>10.3f}"
+            )
+
+        if args.compare:
+            saved = expanded[False] - expanded[True]
+            print(f"{instance:<10} expansions saved by dominance: {saved:.0f} ({saved / expanded[False]:.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import bisect
+
+# u dominates v (weakly) if no machine finishes later in u than in v
+def dominates(u, v):
+    return all(a <= b for (a, b) in zip(u, v))
+
+class ParetoFront:
+    # finish time vectors of which none dominates another, sorted by their sum:
+    # a vector can only be dominated by vectors with a smaller or equal sum,
+    # and can only dominate vectors with a larger or equal sum. This is not an
+    # index: dominated() is a linear scan of the vectors up to the sum of v,
+    # and add() a linear scan of, and rewrite of, the vectors from it, so both
+    # take time linear in the size of the front in the worst case
+    def __init__(self):
+        self._sums = []
+        self._vectors = []
+
+    def __len__(self):
+        return len(self._vectors)
+
+    def __contains__(self, v):
+        s = sum(v)
+        i = bisect.bisect_left(self._sums, s)
+        j = bisect.bisect_right(self._sums, s)
+        return v in self._vectors[i:j]
+
+    def dominated(self, v):
+        end = bisect.bisect_right(self._sums, sum(v))
+        return any(dominates(self._vectors[i], v) for i in range(end))
+
+    # add v, which must not be dominated, and remove the vectors it dominates;
+    # returns the number of vectors removed
+    def add(self, v):
+        s = sum(v)
+        start = bisect.bisect_left(self._sums, s)
+
+        keep = [i for i in range(start, len(self._vectors)) if not dominates(v, self._vectors[i])]
+        removed = len(self._vectors) - start - len(keep)
+
+        if removed:
+            self._sums[start:] = [s] + [self._sums[i] for i in keep]
+            self._vectors[start:] = [v] + [self._vectors[i] for i in keep]
+        else:
+            self._sums.insert(start, s)
+            self._vectors.insert(start, v)
+
+        return removed
+
+class DominanceIndex:
+    # Pareto front of finish time vectors per covered job set and last actions
+    # per machine: a state whose vector is dominated by that of another state
+    # with the same jobs and last actions cannot lead to a shorter schedule,
+    # as adding a job never makes a machine finish earlier
+    def __init__(self):
+        self._fronts = {}
+        self.dominated = 0
+        self.superseded = 0
+
+    def _group(self, state):
+        return (frozenset(state.jobs), tuple(state._a))
+
+    # add the state to the index, unless it is dominated; returns whether
+    # the state was added
+    def add(self, state):
+        front = self._fronts.setdefault(self._group(state), ParetoFront())
+        vector = tuple(state.vector)
+
+        if front.dominated(vector):
+            self.dominated += 1
+            return False
+
+        self.superseded += front.add(vector)
+        return True
+
+    # whether the state is (still) on its front, i.e. it has not been
+    # dominated by a state that was added later
+    def active(self, state):
+        front = self._fronts.get(self._group(state))
+        return front is not None and tuple(state.vector) in front
@@ -0,0 +1,9 @@
+import importlib
+import os
+
+# instance to solve: the name of a directory with a jobs.py and machines.py,
+# e.g. small or large (default)
+NAME = os.environ.get("MDD_ASTAR_INSTANCE", "large")
+
+M = importlib.import_module(f"{NAME}.machines")
+J = importlib.import_module(f"{NAME}.jobs")
@@ -1,7 +1,10 @@
 import copy
+import heapq
+import sys
+import time
 
-import large.machines as M
-import large.jobs as J
+from dominance import DominanceIndex
+from instance import M, J
 from node import State
 from util import *
 
@@ -143,28 +146,44 @@ def h(state):
     
     return max(V) - state.makespan
 
-def aStar():
+def aStar(dominance=True):
     start = State(0)
     num = 1
 
-    openSet = dict()
-    gScore = dict()
-    fScore = dict()
+    # open set as a binary heap of (f, serial number, state) entries, so ties
+    # in f are broken in order of generation
+    openSet = [(h(start), start._val, start)]
 
-    openSet[start._val] = start
-    gScore[start._val] = 0
-    fScore[start._val] = gScore[start._val] + h(start)
+    # transposition table with the best g found for each canonical state, and
+    # closed set of the canonical states that have been expanded
+    gScore = {start.key: 0}
+    closed = set()
+
+    # Pareto fronts of the states per job set and last actions, if enabled
+    index = DominanceIndex() if dominance else None
+    if index is not None:
+        index.add(start)
+
+    stats = {"generated": 1, "expanded": 0, "duplicates": 0}
+
+    while openSet:
+        _, _, current = heapq.heappop(openSet)
+        key = current.key
+
+        # lazy deletion: skip entries of states that have been expanded, or
+        # that have been reached by a shorter path since they were pushed
+        if key in closed or current.makespan > gScore[key]:
+            continue
+
+        # skip states that have been dominated since they were pushed
+        if index is not None and not index.active(current):
+            continue
 
-    while openSet.keys():
-        minF = min(fScore, key = fScore.get)
-        current = openSet.pop(minF)
-        fScore.pop(minF)
-        gScore.pop(minF)
         if len(current.path) == len(J.jobs.keys()):
-            print(f"States calculated: {num}")
-            print(current.path)
-            print(current)
-            return
+            return current, _stats(stats, index)
+
+        closed.add(key)
+        stats["expanded"] += 1
 
         # check which jobs are still candidates, i.e. neighbours
         # by filtering those descriptors that are not covered by s.jobs
@@ -177,14 +196,46 @@ def aStar():
             neighbor._val = num
             num += 1
             neighbor.add(opt)
-            gScore[neighbor._val] = neighbor.makespan
-            fScore[neighbor._val] = neighbor.makespan + h(neighbor)
-            openSet[neighbor._val] = neighbor
+            stats["generated"] += 1
 
-    return
+            # skip states that have been seen before with a g at least as
+            # good, which saves computing their heuristic
+            nKey = neighbor.key
+            if nKey in closed or gScore.get(nKey, float("inf")) <= neighbor.makespan:
+                stats["duplicates"] += 1
+                continue
+
+            if index is not None and not index.add(neighbor):
+                continue
+
+            gScore[nKey] = neighbor.makespan
+            fScore = neighbor.makespan + h(neighbor)
+            heapq.heappush(openSet, (fScore, neighbor._val, neighbor))
+
+    return None, _stats(stats, index)
+
+def _stats(stats, index):
+    if index is not None:
+        stats["dominated"] = index.dominated
+        stats["superseded"] = index.superseded
+
+    return stats
 
 if __name__ == "__main__":
-    aStar()
+    begin = time.perf_counter()
+    best, stats = aStar(dominance="--no-dominance" not in sys.argv)
+    runtime = time.perf_counter() - begin
+
+    print(f"States calculated: {stats['generated']}")
+    print(f"States expanded: {stats['expanded']}")
+    print(f"Duplicates pruned: {stats['duplicates']}")
+    print(f"Dominated states pruned: {stats.get('dominated', 0)}")
+    print(f"Superseded states: {stats.get('superseded', 0)}")
+    print(f"Run-time: {runtime:.3f}s")
+
+    if best is not None:
+        print(best.path)
+        print(best)
 
     # # start with single empty state
     # inState = State()
@@ -236,5 +287,6 @@ if __name__ == "__main__":
 # - the same 'main' jobs are covered
 # - none of the machines finishes later than in the other state
 # - identical last actions per machine
+# (implemented as the Pareto fronts of dominance.py)
 
 # """
\ No newline at end of file
@@ -1,5 +1,4 @@
-import large.machines as M
-import large.jobs as J
+from instance import M, J
 from util import *
 
 class State:
@@ -90,6 +89,12 @@ class State:
     def path(self):
         return self._p
     
+    @property
+    def key(self):
+        # canonical state: states with the same jobs, finish time vector and
+        # last actions per machine have the same completions
+        return (frozenset(self._j), tuple(self.vector), tuple(self._a))
+
     @property
     def vector(self):
         self._v = [0 if self._v[i] == -1 else self._v[i] for i in range(len(self._v))]
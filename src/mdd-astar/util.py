@@ -1,4 +1,4 @@
-import large.machines as M
+from instance import M
 
 # number of machines
 N = len(M.machines.keys())
@@ -0,0 +1,189 @@
+from typing import Sequence
+
+import numpy as np
+
+Trace = Sequence[Sequence[float]]
+
+
+def primal_gap(objective: float, best: float) -> float:
+    """
+    Returns the primal gap of the objective value with respect to the best
+    known objective value: 0 if both are equal, 1 if there is no solution or
+    the values have different signs, and the relative difference otherwise.
+    """
+    if objective == best:
+        return 0.0
+
+    if objective == float("inf") or objective * best < 0:
+        return 1.0
+
+    return abs(objective - best) / max(abs(objective), abs(best))
+
+
+def final_gap(objective: float, lower_bound: float) -> float:
+    """
+    Returns the optimality gap between the final objective value and lower
+    bound of a run, between 0 and 1. Runs without a solution have gap 1.
+    """
+    if objective == float("inf"):
+        return 1.0
+
+    if objective == lower_bound:
+        return 0.0
+
+    return min(abs(objective - lower_bound) / max(abs(objective), 1e-9), 1.0)
+
+
+def pad_traces(
+    traces: Sequence[Trace],
+    objectives: Sequence[float],
+    runtimes: Sequence[float],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converts the traces of several runs into two arrays of shape (number of
+    runs, maximum trace length + 1), with the times and objective values of
+    each trace's entries. The final objective value of each run is appended
+    at its run-time, and shorter traces are padded by repeating that last
+    entry, so that the arrays can be processed in a vectorised manner.
+
+    Parameters
+    ----------
+    traces
+        Trace of each run, see ``Result.trace``.
+    objectives
+        Final objective value of each run.
+    runtimes
+        Run-time of each run.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The times and objective values.
+    """
+    length = max((len(trace) for trace in traces), default=0) + 1
+    times = np.empty((len(traces), length))
+    objs = np.empty((len(traces), length))
+
+    for idx, (trace, objective, runtime) in enumerate(
+        zip(traces, objectives, runtimes)
+    ):
+        num = len(trace)
+        if num:
+            entries = np.asarray(trace, dtype=float)
+            times[idx, :num] = entries[:, 0]
+            objs[idx, :num] = entries[:, 1]
+
+        times[idx, num:] = max(runtime, times[idx, num - 1] if num else 0)
+        objs[idx, num:] = objective
+
+    return times, objs
+
+
+def primal_gaps(objs: np.ndarray, best: np.ndarray) -> np.ndarray:
+    """
+    Vectorised version of :func:`primal_gap`. Each row of objective values
+    is compared with the corresponding best known value.
+    """
+    best = np.asarray(best, dtype=float)[..., None]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        gaps = np.abs(objs - best) / np.maximum(np.abs(objs), np.abs(best))
+        gaps = np.where(np.isinf(objs) | (objs * best < 0), 1.0, gaps)
+
+    return np.where(objs == best, 0.0, gaps)
+
+
+def primal_integrals(
+    times: np.ndarray, objs: np.ndarray, best: np.ndarray, horizon: float
+) -> np.ndarray:
+    """
+    Computes the primal integral of each run: the integral of the primal gap
+    over time, divided by the time horizon. Smaller values mean that good
+    solutions were found sooner; the values are between 0 and 1.
+
+    Parameters
+    ----------
+    times
+        Times of the padded traces, see :func:`pad_traces`.
+    objs
+        Objective values of the padded traces.
+    best
+        Best known objective value of each run's instance, e.g., the best
+        value found by any of the compared runs.
+    horizon
+        Time horizon of the integral, typically the time limit.
+
+    Returns
+    -------
+    np.ndarray
+        The normalised primal integral of each run.
+    """
+    if horizon <= 0:
+        return np.zeros(len(times))
+
+    times = np.minimum(times, horizon)
+    gaps = primal_gaps(objs, best)
+
+    # The gap is 1 until the first trace entry, and then each entry's gap
+    # holds until the next entry, or the horizon for the last one.
+    starts = np.concatenate([np.zeros((len(times), 1)), times], axis=1)
+    ends = np.concatenate([times, np.full((len(times), 1), horizon)], axis=1)
+    gaps = np.concatenate([np.ones((len(times), 1)), gaps], axis=1)
+
+    return (gaps * (ends - starts)).sum(axis=1) / horizon
+
+
+def time_to_within(
+    times: np.ndarray, objs: np.ndarray, best: np.ndarray, pct: float
+) -> np.ndarray:
+    """
+    Returns the first time at which each run's primal gap with respect to
+    the best known value was at most ``pct`` percent, or infinity if it never
+    was.
+    """
+    within = primal_gaps(objs, best) <= pct / 100
+    return np.where(within, times, np.inf).min(axis=1)
+
+
+def time_to_first_feasible(times: np.ndarray, objs: np.ndarray) -> np.ndarray:
+    """
+    Returns the time at which each run found its first feasible solution, or
+    infinity if it found none.
+    """
+    return np.where(np.isfinite(objs), times, np.inf).min(axis=1)
+
+
+def performance_profile(costs: np.ndarray, taus: np.ndarray) -> np.ndarray:
+    """
+    Computes the Dolan-Moré performance profiles of several solvers (or
+    configurations).
+
+    Parameters
+    ----------
+    costs
+        Array of shape (number of instances, number of solvers) with the cost
+        of each solver on each instance, e.g., the run-time to reach a target
+        or the primal integral. Smaller is better. Failures should have an
+        infinite cost.
+    taus
+        Performance ratios at which to evaluate the profiles.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (number of taus, number of solvers) with, for each
+        ratio tau, the fraction of instances on which the solver's cost is
+        within a factor tau of the best solver's cost.
+    """
+    costs = np.asarray(costs, dtype=float)
+    best = costs.min(axis=1, keepdims=True)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratios = costs / best
+
+    # If the best cost is zero, only the solvers with zero cost have ratio 1,
+    # and if all solvers failed, none of them solved the instance.
+    ratios = np.where(costs == best, 1.0, ratios)
+    ratios = np.where(np.isnan(ratios) | np.isinf(best), np.inf, ratios)
+
+    return (ratios[None, :, :] <= np.asarray(taus)[:, None, None]).mean(axis=1)
@@ -7,6 +7,7 @@ class ProblemVariant(str, Enum):
     FJSP = "FJSP"
     SDST_FJSP = "SDST-FJSP"
     AFJSP = "AFJSP"
+    APP = "APP"
     NPFSP = "NPFSP"
     NW_PFSP = "NW-PFSP"
     HFSP = "HFSP"
@@ -1,18 +1,90 @@
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
-from pyjobshop import Model, ProblemData
-from itertools import product
 
+import numpy as np
+from pyjobshop import ProblemData
+from pyjobshop.ProblemData import (
+    Constraints,
+    EndBeforeStart,
+    Job,
+    Machine,
+    Mode,
+    Objective,
+    SetupTime,
+    StartBeforeEnd,
+    Task,
+)
+
+
+class _Tokens:
+    """
+    Cursor over the integers of an instance file. The whole file is parsed
+    into a single integer array at once; the parsers then take consecutive
+    slices of it.
+    """
+
+    def __init__(self, loc: Path):
+        with open(loc) as fh:
+            self._values = np.fromstring(fh.read(), dtype=np.int64, sep=" ")
+
+        self._pos = 0
+
+    def next(self) -> int:
+        return int(self.take(1)[0])
+
+    def take(self, num: int) -> np.ndarray:
+        values = self._values[self._pos : self._pos + num]
+        if len(values) < num:
+            raise ValueError("Unexpected end of instance file.")
+
+        self._pos += num
+        return values
+
+    def rows(self, num_rows: int, num_cols: int) -> np.ndarray:
+        return self.take(num_rows * num_cols).reshape(num_rows, num_cols)
 
-def _read(loc: Path):
-    with open(loc) as fh:
-        data = [list(map(int, line.strip().split())) for line in fh]
 
-    return iter(data)
+def _read(loc: Path) -> _Tokens:
+    return _Tokens(loc)
 
 
-TaskData = list[tuple[int, int]]  # machine idx, duration
+def _offsets(counts: np.ndarray) -> np.ndarray:
+    """
+    Returns the CSR offsets for the given counts.
+    """
+    return np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+
+
+def _eligible_modes(num_tasks_per_job: np.ndarray, durations: np.ndarray):
+    """
+    Returns the CSR task and mode arrays for a (tasks x machines) duration
+    matrix, where a zero duration means that the machine is not eligible.
+    """
+    eligible = durations > 0
+    tasks, machines = np.nonzero(eligible)
+
+    return (
+        _offsets(num_tasks_per_job),
+        _offsets(eligible.sum(axis=1)),
+        machines,
+        durations[tasks, machines],
+    )
+
+
+def _single_modes(machines: np.ndarray, durations: np.ndarray):
+    """
+    Returns the CSR task and mode arrays for (jobs x tasks) machine and
+    duration matrices, where each task has a single mode.
+    """
+    num_jobs, num_tasks = durations.shape
+
+    return (
+        np.arange(0, num_jobs * num_tasks + 1, num_tasks),
+        np.arange(num_jobs * num_tasks + 1),
+        machines.ravel(),
+        durations.ravel(),
+    )
 
 
 @dataclass
@@ -20,190 +92,197 @@ class MachineInstance:
     """
     Helper class to parse machine scheduling instance data from
     Naderi et al. (2023).
+
+    Tasks and modes are stored in CSR format: the tasks of job ``j`` are
+    ``job_tasks[j]`` up to ``job_tasks[j + 1]`` (in routing order, which
+    also defines the precedence constraints), and the modes of task ``t``
+    are ``task_modes[t]`` up to ``task_modes[t + 1]``.
     """
 
     num_machines: int
-    jobs: list[list[TaskData]]  # also defines precedence constraints
+    job_tasks: np.ndarray
+    task_modes: np.ndarray
+    mode_machines: np.ndarray
+    mode_durations: np.ndarray
     permutation: bool = False
     no_wait: bool = False
-    setup_times: Optional[list[list[list[int]]]] = None
+    setup_times: Optional[np.ndarray] = None  # machine x task/job x task/job
     objective: str = "makespan"
-    due_dates: Optional[list[int]] = None
+    due_dates: Optional[np.ndarray] = None
     num_machines_per_stage: Optional[list[int]] = None
 
     @property
     def num_jobs(self) -> int:
-        return len(self.jobs)
+        return len(self.job_tasks) - 1
 
     @property
     def num_tasks(self) -> int:
-        return sum(len(tasks) for tasks in self.jobs)
+        return int(self.job_tasks[-1])
 
     def data(self) -> ProblemData:
         """
-        Transform MachineInstance to ProblemData object.
+        Transform MachineInstance to ProblemData object. The problem data is
+        constructed directly from the CSR arrays, rather than through the
+        per-element ``Model`` interface.
         """
-        model = Model()
-        machines = [model.add_machine() for _ in range(self.num_machines)]
-        #model.set_permutation(self.permutation)
-
-        job2tasks = [[] for _ in range(self.num_jobs)]
-        for job_idx in range(self.num_jobs):
-            due_date = self.due_dates[job_idx] if self.due_dates else None
-            job = model.add_job(due_date=due_date)
-
-            for task_data in self.jobs[job_idx]:
-                task = model.add_task(job=job)
-                job2tasks[job_idx].append(task)
-
-                for mach_idx, duration in task_data:
-                    model.add_mode(task, [machines[mach_idx]], duration)
-
-            tasks = job2tasks[job_idx]
-            for pred, succ in zip(tasks[:-1], tasks[1:]):
-                # Assume linear routing of tasks as presented in the job data.
-                if self.no_wait:
-                    model.add_end_before_start(pred, succ)  # e(pred) <= s(succ)
-                    model.add_start_before_end(succ, pred)  # s(succ) <= e(pred)
-                else:
-                    model.add_end_before_start(pred, succ)
-
-        if self.setup_times:
-            import itertools
-            for mach_idx, idx1, idx2 in product(range(self.num_machines), range(self.num_tasks), range(self.num_tasks)):
-                # For every two pair of jobs, we find the corresponding tasks which have
-                # the same machine index as the machine (because we have a flow shop).
-                task1 = list(itertools.chain.from_iterable(job2tasks))[idx1]
-                task2 = list(itertools.chain.from_iterable(job2tasks))[idx2]
-                setup_time = self.setup_times[mach_idx][idx1][idx2]
-                if setup_time != 1000000:
-                    model.add_setup_time(machines[mach_idx], task1, task2, setup_time)
+        job_tasks = self.job_tasks.tolist()
+        due_dates = (
+            self.due_dates.tolist() if self.due_dates is not None else None
+        )
+        jobs = [
+            Job(
+                due_date=due_dates[idx] if due_dates else None,
+                tasks=list(range(job_tasks[idx], job_tasks[idx + 1])),
+            )
+            for idx in range(self.num_jobs)
+        ]
+        machines = [Machine() for _ in range(self.num_machines)]
+        # Permutation constraints are not supported by ProblemData.
+
+        task2job = np.repeat(np.arange(self.num_jobs), np.diff(self.job_tasks))
+        tasks = [Task(job=job) for job in task2job.tolist()]
+
+        mode2task = np.repeat(np.arange(self.num_tasks), np.diff(self.task_modes))
+        modes = [
+            Mode(task, [machine], duration)
+            for task, machine, duration in zip(
+                mode2task.tolist(),
+                self.mode_machines.tolist(),
+                self.mode_durations.tolist(),
+            )
+        ]
+
+        # Assume linear routing of tasks as presented in the job data: each
+        # task except the last of its job precedes the next task.
+        is_last = np.zeros(self.num_tasks, dtype=bool)
+        is_last[self.job_tasks[1:][np.diff(self.job_tasks) > 0] - 1] = True
+        preds = np.flatnonzero(~is_last).tolist()
+
+        end_before_start = [EndBeforeStart(pred, pred + 1) for pred in preds]
+        start_before_end = (
+            [StartBeforeEnd(pred + 1, pred) for pred in preds]  # no-wait
+            if self.no_wait
+            else []
+        )
+
+        setup_times = []
+        if self.setup_times is not None:
+            setups = self.setup_times
+            mach_idcs, idcs1, idcs2 = np.nonzero(setups != 1000000)
+            durations = setups[mach_idcs, idcs1, idcs2]
+
+            if setups.shape[1] != self.num_tasks:
+                # Setup times are given between jobs. In a flow shop, we find
+                # the corresponding tasks as those processed on the machine.
+                idcs1 = self.job_tasks[idcs1] + mach_idcs
+                idcs2 = self.job_tasks[idcs2] + mach_idcs
+
+            setup_times = [
+                SetupTime(*args)
+                for args in zip(
+                    mach_idcs.tolist(),
+                    idcs1.tolist(),
+                    idcs2.tolist(),
+                    durations.tolist(),
+                )
+            ]
 
         if self.objective == "makespan":
-            model.set_objective(weight_makespan=1)
+            objective = Objective(weight_makespan=1)
         elif self.objective == "total_completion_time":
-            model.set_objective(weight_total_flow_time=1)
+            objective = Objective(weight_total_flow_time=1)
         elif self.objective == "total_tardiness":
-            model.set_objective(weight_total_tardiness=1)
+            objective = Objective(weight_total_tardiness=1)
         else:
             raise ValueError(f"Objective {self.objective} unknown.")
 
-        return model.data()
+        constraints = Constraints(
+            end_before_start=end_before_start,
+            start_before_end=start_before_end,
+            setup_times=setup_times,
+        )
+
+        return ProblemData(
+            jobs=jobs,
+            resources=machines,
+            tasks=tasks,
+            modes=modes,
+            constraints=constraints,
+            flows={},
+            objective=objective,
+        )
 
     @classmethod
     def parse_fjsp(cls, loc: Path):
-        lines = _read(loc)
+        tokens = _read(loc)
 
-        num_jobs = next(lines)[0]
-        num_machines = next(lines)[0]
-        num_tasks_per_job = next(lines)
-        processing_times = [
-            [next(lines) for _ in range(num_tasks)] for num_tasks in num_tasks_per_job
-        ]
+        num_jobs = tokens.next()
+        num_machines = tokens.next()
+        num_tasks_per_job = tokens.take(num_jobs)
+        durations = tokens.rows(num_tasks_per_job.sum(), num_machines)
 
-        jobs = [[] for _ in range(num_jobs)]
-        for job_idx, num_tasks in enumerate(num_tasks_per_job):
-            for task_idx in range(num_tasks):
-                durations = processing_times[job_idx][task_idx]
-                jobs[job_idx].append(
-                    [
-                        (mach_idx, duration)
-                        for mach_idx, duration in enumerate(durations)
-                        if duration > 0
-                    ]
-                )
-
-        return MachineInstance(num_machines, jobs)
+        return MachineInstance(
+            num_machines, *_eligible_modes(num_tasks_per_job, durations)
+        )
 
     @classmethod
     def parse_sdst_fjsp(cls, loc: Path):
-        lines = _read(loc)
+        tokens = _read(loc)
 
-        num_jobs = next(lines)[0]
-        num_machines = next(lines)[0]
-        num_tasks_per_job = next(lines)
-        processing_times = [
-            [next(lines) for _ in range(num_tasks)] for num_tasks in num_tasks_per_job
-        ]
-        setup_times = [
-            [next(lines) for _ in range(sum(num_tasks_per_job))] for _ in range(num_machines)
-        ]
-
-        jobs = [[] for _ in range(num_jobs)]
-        for job_idx, num_tasks in enumerate(num_tasks_per_job):
-            for task_idx in range(num_tasks):
-                durations = processing_times[job_idx][task_idx]
-                jobs[job_idx].append(
-                    [
-                        (mach_idx, duration)
-                        for mach_idx, duration in enumerate(durations)
-                        if duration > 0
-                    ]
-                )
+        num_jobs = tokens.next()
+        num_machines = tokens.next()
+        num_tasks_per_job = tokens.take(num_jobs)
+        num_tasks = num_tasks_per_job.sum()
+        durations = tokens.rows(num_tasks, num_machines)
+        setup_times = tokens.rows(num_machines * num_tasks, num_tasks)
 
         return MachineInstance(
-            num_machines, jobs, setup_times=setup_times
+            num_machines,
+            *_eligible_modes(num_tasks_per_job, durations),
+            setup_times=setup_times.reshape(num_machines, num_tasks, num_tasks),
         )
 
     @classmethod
     def parse_hfsp(cls, loc: Path):
-        lines = _read(loc)
-        num_jobs = next(lines)[0]
-        _ = next(lines)
-        num_machines_per_stage = next(lines)
-        processing_times = [next(lines) for _ in range(num_jobs)]  # duration per stage
-
-        stage2machines = []
-        start = 0
-        for stage, _num_machines in enumerate(num_machines_per_stage):
-            stage2machines.append([start + idx for idx in range(_num_machines)])
-            start += _num_machines
-
-        jobs = [[] for _ in range(num_jobs)]
-        for job_idx in range(num_jobs):
-            durations = processing_times[job_idx]
-
-            for stage, duration in enumerate(durations):
-                tasks = [(mach_idx, duration) for mach_idx in stage2machines[stage]]
-                jobs[job_idx].append(tasks)
+        tokens = _read(loc)
+        num_jobs = tokens.next()
+        num_stages = tokens.next()
+        num_machines_per_stage = tokens.take(num_stages)
+        durations = tokens.rows(num_jobs, num_stages)  # duration per stage
+
+        # Each task can be processed by all machines of its stage, and the
+        # machines are numbered consecutively per stage.
+        num_machines = int(num_machines_per_stage.sum())
+        num_modes = np.tile(num_machines_per_stage, num_jobs)
 
         return MachineInstance(
-            sum(num_machines_per_stage),
-            jobs,
-            num_machines_per_stage=num_machines_per_stage,
+            num_machines,
+            np.arange(0, num_jobs * num_stages + 1, num_stages),
+            _offsets(num_modes),
+            np.tile(np.arange(num_machines), num_jobs),
+            np.repeat(durations.ravel(), num_modes),
+            num_machines_per_stage=num_machines_per_stage.tolist(),
         )
 
     @classmethod
     def parse_jsp(cls, loc: Path):
-        lines = _read(loc)
-        num_jobs = next(lines)[0]
-        num_machines = next(lines)[0]
-        processing_times = [next(lines) for _ in range(num_jobs)]
-        machines_idcs = [next(lines) for _ in range(num_jobs)]
-
-        jobs = [[] for _ in range(num_jobs)]
-        for job_idx in range(num_jobs):
-            durations = processing_times[job_idx]
-            machines = machines_idcs[job_idx]
+        tokens = _read(loc)
+        num_jobs = tokens.next()
+        num_machines = tokens.next()
+        durations = tokens.rows(num_jobs, num_machines)
+        machines = tokens.rows(num_jobs, num_machines) - 1
 
-            for mach_idx, duration in zip(machines, durations):
-                jobs[job_idx].append([(mach_idx - 1, duration)])
-
-        return MachineInstance(num_machines, jobs)
+        return MachineInstance(num_machines, *_single_modes(machines, durations))
 
     @classmethod
     def parse_npfsp(cls, loc: Path):
-        lines = _read(loc)
-        num_jobs = next(lines)[0]
-        num_machines = next(lines)[0]
-        processing_times = [next(lines) for _ in range(num_jobs)]
-
-        jobs = [[] for _ in range(num_jobs)]
-        for job_idx in range(num_jobs):
-            for mach_idx, duration in enumerate(processing_times[job_idx]):
-                jobs[job_idx].append([(mach_idx, duration)])
+        tokens = _read(loc)
+        num_jobs = tokens.next()
+        num_machines = tokens.next()
+        durations = tokens.rows(num_jobs, num_machines)
+        machines = np.tile(np.arange(num_machines), (num_jobs, 1))
 
-        return MachineInstance(num_machines, jobs)
+        return MachineInstance(num_machines, *_single_modes(machines, durations))
 
     @classmethod
     def parse_nw_pfsp(cls, loc: Path):
@@ -213,15 +292,20 @@ class MachineInstance:
 
     @classmethod
     def parse_pmp(cls, loc: Path):
-        lines = _read(loc)
-        num_jobs = next(lines)[0]
-        num_machines = next(lines)[0]
-        processing_times = [next(lines) for _ in range(num_jobs)]
-        jobs = [
-            [list(enumerate(processing_times[job_idx]))] for job_idx in range(num_jobs)
-        ]
+        tokens = _read(loc)
+        num_jobs = tokens.next()
+        num_machines = tokens.next()
+        durations = tokens.rows(num_jobs, num_machines)
 
-        return MachineInstance(num_machines, jobs)
+        # Each job consists of a single task that can be processed on any
+        # machine.
+        return MachineInstance(
+            num_machines,
+            np.arange(num_jobs + 1),
+            np.arange(0, num_jobs * num_machines + 1, num_machines),
+            np.tile(np.arange(num_machines), num_jobs),
+            durations.ravel(),
+        )
 
     @classmethod
     def parse_pfsp(cls, loc: Path):
@@ -231,21 +315,18 @@ class MachineInstance:
 
     @classmethod
     def parse_sdst_pfsp(cls, loc: Path):
-        lines = _read(loc)
-        num_jobs = next(lines)[0]
-        num_machines = next(lines)[0]
-        processing_times = [next(lines) for _ in range(num_jobs)]
-        setup_times = [
-            [next(lines) for _ in range(num_jobs)] for _ in range(num_machines)
-        ]
-
-        jobs = [[] for _ in range(num_jobs)]
-        for job_idx in range(num_jobs):
-            for mach_idx, duration in enumerate(processing_times[job_idx]):
-                jobs[job_idx].append([(mach_idx, duration)])
+        tokens = _read(loc)
+        num_jobs = tokens.next()
+        num_machines = tokens.next()
+        durations = tokens.rows(num_jobs, num_machines)
+        setup_times = tokens.rows(num_machines * num_jobs, num_jobs)
+        machines = np.tile(np.arange(num_machines), (num_jobs, 1))
 
         return MachineInstance(
-            num_machines, jobs, permutation=True, setup_times=setup_times
+            num_machines,
+            *_single_modes(machines, durations),
+            permutation=True,
+            setup_times=setup_times.reshape(num_machines, num_jobs, num_jobs),
         )
 
     @classmethod
@@ -257,20 +338,16 @@ class MachineInstance:
 
     @classmethod
     def parse_tt_pfsp(cls, loc: Path):
-        lines = _read(loc)
-        num_jobs = next(lines)[0]
-        num_machines = next(lines)[0]
-        due_dates = next(lines)
-        processing_times = [next(lines) for _ in range(num_jobs)]
-
-        jobs = [[] for _ in range(num_jobs)]
-        for job_idx in range(num_jobs):
-            for mach_idx, duration in enumerate(processing_times[job_idx]):
-                jobs[job_idx].append([(mach_idx, duration)])
+        tokens = _read(loc)
+        num_jobs = tokens.next()
+        num_machines = tokens.next()
+        due_dates = tokens.take(num_jobs)
+        durations = tokens.rows(num_jobs, num_machines)
+        machines = np.tile(np.arange(num_machines), (num_jobs, 1))
 
         return MachineInstance(
             num_machines,
-            jobs,
+            *_single_modes(machines, durations),
             permutation=True,
             objective="total_tardiness",
             due_dates=due_dates,
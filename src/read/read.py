@@ -1,21 +1,37 @@
 from pathlib import Path
+from typing import Optional
 from .Problem import ProblemVariant
 from .machine import MachineInstance
 from .project import ProjectInstance
 from .read_afjsp import read_afjsp
+from .read_app import read_app
 
 from pyjobshop import ProblemData
+from pyjobshop.cache import cached_read
 
 
-def read(loc: Path, problem: ProblemVariant) -> ProblemData:
+def read(
+    loc: Path,
+    problem: ProblemVariant,
+    cache_dir: Optional[Path] = None,
+    **kwargs,
+) -> ProblemData:
     """
     Reads a problem instance from file and returns a ProblemData instance.
+    Additional keyword arguments are passed to the variant's parser, e.g.
+    ``hubs=True`` for And/Or instances.
+
+    Parsed instances are cached in ``cache_dir``, or in the directory set by
+    the ``PYJOBSHOP_CACHE_DIR`` environment variable. Cache entries are keyed
+    by the file, its modification time and size, the problem variant and the
+    parser arguments.
     """
     parse_methods = {
         ProblemVariant.JSP: MachineInstance.parse_jsp,
         ProblemVariant.FJSP: MachineInstance.parse_fjsp,
         ProblemVariant.SDST_FJSP: MachineInstance.parse_sdst_fjsp,
         ProblemVariant.AFJSP: read_afjsp,
+        ProblemVariant.APP: read_app,
         ProblemVariant.HFSP: MachineInstance.parse_hfsp,
         ProblemVariant.NPFSP: MachineInstance.parse_npfsp,
         ProblemVariant.NW_PFSP: MachineInstance.parse_nw_pfsp,
@@ -34,5 +50,9 @@ def read(loc: Path, problem: ProblemVariant) -> ProblemData:
     if parse_method is None:
         raise ValueError(f"Unsupported problem type: {problem}")
 
-    instance = parse_method(loc)
-    return instance.data()
+    def parse() -> ProblemData:
+        instance = parse_method(loc, **kwargs)
+        return instance.data()
+
+    key = (ProblemVariant(problem).value, sorted(kwargs.items()))
+    return cached_read(loc, parse, *key, cache_dir=cache_dir)
@@ -1,49 +1,109 @@
 from dataclasses import dataclass
-from pyjobshop import Model
 from pathlib import Path
 
-ProcessingData = list[tuple[int, int, bool]]
-Arc = tuple[int, int]
+import numpy as np
+from pyjobshop import Model
+
+# Flow roles of the tasks in an And/Or instance.
+SOURCE, SINK, INTERMEDIATE = 0, 1, 2
+
 
 @dataclass
 class Instance:
     """
-    The FJSPLIB instance data.
+    The And/Or FJSP instance data, stored as compact arrays. The tasks of all
+    jobs are numbered consecutively, and the modes of all tasks likewise.
+    Each job starts with a dummy source task and ends with a dummy sink task,
+    both processed on the dummy machine 0 in zero time.
 
     Parameters
     ----------
     num_jobs
         The number of jobs.
     num_machines
-        The number of machines.
-    num_operations
-        The number of operations.
-    jobs
-        A list of job data, each job consisting of a list of operation indices.
+        The number of machines, excluding the dummy machine 0.
+    job_tasks
+        Offsets of the tasks of each job: the tasks of job ``j`` are
+        ``job_tasks[j]`` up to ``job_tasks[j + 1]``.
+    optional
+        Whether each task is optional.
+    roles
+        The flow role of each task: ``SOURCE``, ``SINK`` or ``INTERMEDIATE``.
+    task_modes
+        Offsets of the modes of each task: the modes of task ``t`` are
+        ``task_modes[t]`` up to ``task_modes[t + 1]``.
+    machines
+        The machine of each mode.
+    durations
+        The processing time of each mode.
     precedences
-        A list of tuples consisting of two operation indices, representing the
-        precedence relationship of two operations.
-    setups
-        A list of tuples consisting of a machine index, two operation indices,
-        and the setup time between the two operations on that machine.
+        Array of shape (num_arcs, 2) of precedence-related task pairs.
     """
 
     num_jobs: int
     num_machines: int
-    num_operations: int
-    jobs: list[list[ProcessingData]]
-    precedences: list[Arc]
-    
-def parse_instance_file_to_tuple(filename):
+    job_tasks: np.ndarray
+    optional: np.ndarray
+    roles: np.ndarray
+    task_modes: np.ndarray
+    machines: np.ndarray
+    durations: np.ndarray
+    precedences: np.ndarray
+
+    @property
+    def num_tasks(self) -> int:
+        return len(self.optional)
+
+    def model(self) -> Model:
+        """
+        Transforms the instance into a Model, with flow roles marked so that
+        exactly one branch of each OR-subgraph is selected.
+        """
+        m = Model()
+
+        jobs = [m.add_job() for _ in range(self.num_jobs)]
+        resources = [m.add_machine() for _ in range(self.num_machines + 1)]
+        job_tasks = self.job_tasks.tolist()
+        task_modes = self.task_modes.tolist()
+        optional = self.optional.tolist()
+        roles = self.roles.tolist()
+        machines = self.machines.tolist()
+        durations = self.durations.tolist()
+
+        for job_idx, job in enumerate(jobs):
+            first, last = job_tasks[job_idx], job_tasks[job_idx + 1]
+
+            for idx in range(first, last):
+                name = f"{job_idx}_{idx - first}"
+                task = m.add_task(job=job, name=name, optional=optional[idx])
+
+                for mode in range(task_modes[idx], task_modes[idx + 1]):
+                    resource = resources[machines[mode]]
+                    m.add_mode(task, resource, durations[mode])
+
+                if roles[idx] == SOURCE:
+                    m.mark_flow_source(task)
+                elif roles[idx] == SINK:
+                    m.mark_flow_sink(task)
+                else:
+                    m.mark_flow_intermediate(task)
+
+        for frm, to in self.precedences.tolist():
+            m.add_end_before_start(m.tasks[frm], m.tasks[to])
+
+        return m
+
+
+def parse_afjsp(loc: Path, hubs: bool = False) -> Instance:
     """
-    Parses a flexible AJSP instance file (with machine flexibility) and returns a tuple:
-      (num_jobs, num_machines, total_operations, jobs_ops, precedences)
-    
+    Parses a flexible And/Or job shop instance file. The file is read line by
+    line, and the tasks, modes and precedences are stored in flat arrays.
+
     The file format is as follows:
       - First line: <num_jobs> <num_machines>
       - Then, for each job:
             Job <job_id> <num_or_subgraphs>
-        For each or‑subgraph:
+        For each or-subgraph:
             OR <branch_count>
           For each branch:
             If branch is SINGLE, one line of the form:
@@ -54,167 +114,123 @@ def parse_instance_file_to_tuple(filename):
               SPLIT
               SUB1 <count> <op1> ... <op_count>
               SUB2 <count> <op1> ... <op_count>
-            and the branch’s operations are the concatenation of SUB1’s and SUB2’s operations.
-    
-    Dummy nodes:
-      - A dummy start node (machine 0, time 0) is inserted at the beginning of each job.
-      - A dummy end node (machine 0, time 0) is inserted at the end of each job.
-    
-    In the returned data structure:
-      - Each operation is represented as (k, alternatives),
-        where k is the number of alternatives and alternatives is a list of (machine, processing_time).
-      - Precedences is a list of tuples (from_op_index, to_op_index, relation),
-        with relation either "and" (within a branch) or "or" (linking branches between or‑subgraphs or connecting dummy nodes).
-    """
-    global_ops = []    # Flat list of all operations (each is (k, alternatives))
-    prec_list = []     # List of (from_idx, to_idx, relation)
-    jobs_ops = []      # List of jobs; each job is a list of indices into global_ops
-
-    # Helper: parse operations from a list of tokens.
-    # tokens: list of tokens representing one or more operations.
-    # Returns a list of operations, where each operation is (k, alternatives)
-    def parse_ops_from_tokens(tokens):
-        ops = []
-        i = 0
-        while i < len(tokens):
-            k = int(tokens[i])
-            i += 1
-            alternatives = []
-            for _ in range(k):
-                m = int(tokens[i])
-                t = int(tokens[i+1])
-                alternatives.append((m, t))
-                i += 2
-            ops.append((k, alternatives))
-        return ops
-
-    with open(filename, "r") as f:
-        lines = [line.strip() for line in f if line.strip()]
-    
-    # Read header: first line is "num_jobs num_machines"
-    header = lines[0].split()
-    num_jobs, num_machines = int(header[0]), int(header[1])
-    line_idx = 1
-
-    # Process each job.
-    for j in range(num_jobs):
-        job_indices = []  # global operation indices for operations in this job
-
-        # Create dummy start node for this job.
-        dummy_start = (1, [(0, 0)], False)  # one alternative: machine 0, processing time 0.
-        start_idx = len(global_ops)
-        global_ops.append(dummy_start)
-        job_indices.append(start_idx)
-
-        # Expect job header: "Job <job_id> <num_or_subgraphs>"
-        parts = lines[line_idx].split()
-        num_or_subgraphs = int(parts[2])
-        line_idx += 1
-
-        # For storing branch info per or-subgraph for precedence connections.
-        # Each entry is a list of branch tuples: (first_op_idx, last_op_idx, [list of op indices])
-        job_or_info = []
-
-        # Process each or‑subgraph in the job.
-        for or_sub in range(num_or_subgraphs):
-            # Read OR subgraph header: "OR <branch_count>"
-            parts = lines[line_idx].split()
-            branch_count = int(parts[1])
-            line_idx += 1
-
-            branches_info = []  # branch info for current or‑subgraph
-
-            for _ in range(branch_count):
-                tokens = lines[line_idx].split()
-                if tokens[0] == "SINGLE":
-                    # Remove "SINGLE" token and parse the remaining tokens.
-                    op_tokens = tokens[1:]
-                    ops = parse_ops_from_tokens(op_tokens)
-                    line_idx += 1
-                elif tokens[0] == "SPLIT":
-                    line_idx += 1  # skip "SPLIT" line
-                    # Parse SUB1 line.
-                    tokens_sub1 = lines[line_idx].split()
-                    op_tokens1 = tokens_sub1[2:]  # ignore "SUB1" and count
-                    ops1 = parse_ops_from_tokens(op_tokens1)
-                    line_idx += 1
-                    # Parse SUB2 line.
-                    tokens_sub2 = lines[line_idx].split()
-                    op_tokens2 = tokens_sub2[2:]  # ignore "SUB2" and count
-                    ops2 = parse_ops_from_tokens(op_tokens2)
-                    line_idx += 1
-                    # The branch's operations are the concatenation of SUB1's and SUB2's operations.
-                    ops = ops1 + ops2
-                else:
-                    raise ValueError(f"Unexpected branch type in line: {lines[line_idx]}")
-                
-                branch_start = len(global_ops)
-                branch_indices = []
-                # Append each operation in this branch to the global list.
-                for k, alt in ops:
-                    global_ops.append((k, alt, True))
-                    branch_indices.append(len(global_ops) - 1)
-                    job_indices.append(len(global_ops) - 1)
-                branch_end = branch_indices[-1]
-                # Add internal "and" precedences within the branch.
-                for idx in range(len(branch_indices) - 1):
-                    prec_list.append((branch_indices[idx], branch_indices[idx+1], "and"))
-                branches_info.append((branch_indices[0], branch_indices[-1], branch_indices))
-            
-            # Add inter or‑subgraph precedence edges.
-            if not job_or_info:
-                # First or‑subgraph: add an "or" precedence from dummy start to each branch's first op.
-                for (_, _, branch_indices) in branches_info:
-                    prec_list.append((start_idx, branch_indices[0], "or"))
-            else:
-                # For every branch in previous or‑subgraph, add an "or" edge to every branch's first op in current.
-                prev_or = job_or_info[-1]
-                for (_, _, prev_branch) in prev_or:
-                    for (cur_first, _, cur_branch) in branches_info:
-                        prec_list.append((prev_branch[-1], cur_branch[0], "or"))
-            job_or_info.append(branches_info)
-        
-        # Create dummy end node for this job.
-        dummy_end = (1, [(0, 0)], True)  # machine 0, time 0.
-        end_idx = len(global_ops)
-        global_ops.append(dummy_end)
-        job_indices.append(end_idx)
-
-        # From every branch in the final or‑subgraph, add an "and" precedence edge to dummy end.
-        final_or = job_or_info[-1]
-        for (_, _, branch_indices) in final_or:
-            prec_list.append((branch_indices[-1], end_idx, "and"))
-        
-        jobs_ops.append([global_ops[i] for i in job_indices])
-    
-    total_ops = len(global_ops)
-    return Instance(num_jobs, num_machines, total_ops, jobs_ops, prec_list)
-
-def read_afjsp(loc: Path):
-    instance = parse_instance_file_to_tuple(loc.absolute())
-    m = Model()
-    
-    jobs = [m.add_job() for _ in range(instance.num_jobs)]
-    resources = [m.add_machine() for _ in range(instance.num_machines + 1)]
-
-    for job_idx, tasks in enumerate(instance.jobs):
-        for task_idx, (k, alts, opt) in enumerate(tasks):
-            task = m.add_task(job=jobs[job_idx], name=f"{job_idx}_{task_idx}", optional=opt)
-
-            idx = 0
-            for resource_idx, duration in alts:
-                m.add_mode(task, resources[resource_idx], duration)
-                idx += 1
-
-            if resource_idx == 0:
-                if not opt:
-                    m.mark_flow_source(task)
-                else:
-                    m.mark_flow_sink(task)
-            else:
-                    m.mark_flow_intermediate(task)
+            and the branch's operations are the concatenation of SUB1's and
+            SUB2's operations.
 
-    for frm, to, rel in instance.precedences:
-        m.add_end_before_start(m.tasks[frm], m.tasks[to])
-        
-    return m
\ No newline at end of file
+    The operations of a branch form a chain. The dummy source precedes the
+    first operation of each branch in the first or-subgraph, the last
+    operation of each branch precedes the first operation of each branch in
+    the next or-subgraph, and the last operation of each branch in the final
+    or-subgraph precedes the dummy sink.
+
+    Parameters
+    ----------
+    loc
+        Location of the instance file.
+    hubs
+        Whether to connect consecutive or-subgraphs through a zero-duration
+        hub task on the dummy machine, rather than linking every branch end
+        to every next branch start. This makes the number of precedence
+        constraints (and flow variables) linear instead of quadratic in the
+        number of branches. Hubs are only added where they reduce the number
+        of precedences. Default ``False``.
+
+    Returns
+    -------
+    Instance
+        The parsed instance data.
+    """
+    job_tasks = [0]
+    optional: list[bool] = []
+    roles: list[int] = []
+    task_modes = [0]
+    machines: list[int] = []
+    durations: list[int] = []
+    arcs: list[tuple[int, int]] = []
+
+    def add_dummy(is_optional: bool, role: int) -> int:
+        optional.append(is_optional)
+        roles.append(role)
+        machines.append(0)
+        durations.append(0)
+        task_modes.append(len(machines))
+        return len(optional) - 1
+
+    def add_chain(tokens: list[str]) -> tuple[int, int]:
+        first = len(optional)
+        pos = 0
+
+        while pos < len(tokens):
+            num_alts = int(tokens[pos])
+            alts = tokens[pos + 1 : pos + 1 + 2 * num_alts]
+            machines.extend(map(int, alts[::2]))
+            durations.extend(map(int, alts[1::2]))
+            optional.append(True)
+            roles.append(INTERMEDIATE)
+            task_modes.append(len(machines))
+            pos += 1 + 2 * num_alts
+
+        last = len(optional) - 1
+        arcs.extend((idx, idx + 1) for idx in range(first, last))
+        return first, last
+
+    with open(loc) as fh:
+        lines = (tokens for tokens in map(str.split, fh) if tokens)
+        header = next(lines)
+        num_jobs, num_machines = int(header[0]), int(header[1])
+
+        for _ in range(num_jobs):
+            num_or_subgraphs = int(next(lines)[2])  # Job <job_id> <num_or>
+            ends = [add_dummy(False, SOURCE)]
+
+            for _ in range(num_or_subgraphs):
+                num_branches = int(next(lines)[1])  # OR <branch_count>
+                firsts, lasts = [], []
+
+                for _ in range(num_branches):
+                    tokens = next(lines)
+
+                    if tokens[0] == "SINGLE":
+                        first, last = add_chain(tokens[1:])
+                    elif tokens[0] == "SPLIT":
+                        # Skip the "SUB<i> <count>" prefix of both lines.
+                        sub1, sub2 = next(lines), next(lines)
+                        first, last = add_chain(sub1[2:] + sub2[2:])
+                    else:
+                        line = " ".join(tokens)
+                        raise ValueError(f"Unexpected branch type: {line}")
+
+                    firsts.append(first)
+                    lasts.append(last)
+
+                if hubs and len(ends) * len(firsts) > len(ends) + len(firsts):
+                    hub = add_dummy(False, INTERMEDIATE)
+                    arcs.extend((end, hub) for end in ends)
+                    ends = [hub]
+
+                arcs.extend((end, first) for end in ends for first in firsts)
+                ends = lasts
+
+            sink = add_dummy(True, SINK)
+            arcs.extend((end, sink) for end in ends)
+            job_tasks.append(len(optional))
+
+    return Instance(
+        num_jobs=num_jobs,
+        num_machines=num_machines,
+        job_tasks=np.array(job_tasks, dtype=np.int32),
+        optional=np.array(optional, dtype=bool),
+        roles=np.array(roles, dtype=np.int8),
+        task_modes=np.array(task_modes, dtype=np.int32),
+        machines=np.array(machines, dtype=np.int32),
+        durations=np.array(durations, dtype=np.int32),
+        precedences=np.array(arcs, dtype=np.int32).reshape(-1, 2),
+    )
+
+
+def read_afjsp(loc: Path, hubs: bool = False) -> Model:
+    """
+    Reads a flexible And/Or job shop instance file and returns the model.
+    See ``parse_afjsp`` for the ``hubs`` option.
+    """
+    return parse_afjsp(loc, hubs).model()
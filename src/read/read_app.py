@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from pyjobshop import Model
+
+Alternatives = list[tuple[int, int]]
+
+
+@dataclass
+class AppInstance:
+    """
+    The FJSP instance data with alternative process plans (APPs).
+
+    Parameters
+    ----------
+    num_jobs
+        The number of jobs.
+    num_machines
+        The number of machines.
+    operations
+        For each job, the list of operations, each operation consisting of a
+        list of (machine, duration) alternatives. Machines are 1-indexed.
+    plans
+        For each job, the list of alternative process plans, each plan
+        consisting of the (0-indexed) operations of the job in processing
+        order.
+    """
+
+    num_jobs: int
+    num_machines: int
+    operations: list[list[Alternatives]]
+    plans: list[list[list[int]]]
+
+
+def parse_app(loc: Path) -> AppInstance:
+    """
+    Parses an APP instance file. The format extends the flexible job shop
+    format: each job line is prefixed by the number of APPs, and followed by
+    one line per APP listing its length and operation indices. See
+    ``instances/README.md`` for details.
+
+    Since every line is prefixed by its number of entries, the body of the
+    file is read as a single stream of integers rather than line by line.
+    """
+    with open(loc) as fh:
+        header = fh.readline().split()
+        tokens = list(map(int, fh.read().split()))
+
+    num_jobs, num_machines = int(header[0]), int(header[1])
+    operations: list[list[Alternatives]] = []
+    plans: list[list[list[int]]] = []
+    pos = 0
+
+    for _ in range(num_jobs):
+        num_plans, num_ops = tokens[pos], tokens[pos + 1]
+        pos += 2
+
+        job_ops = []
+        for _ in range(num_ops):
+            num_alts = tokens[pos]
+            alts = tokens[pos + 1 : pos + 1 + 2 * num_alts]
+            job_ops.append(list(zip(alts[::2], alts[1::2])))
+            pos += 1 + 2 * num_alts
+
+        job_plans = []
+        for _ in range(num_plans):
+            length = tokens[pos]
+            job_plans.append(tokens[pos + 1 : pos + 1 + length])
+            pos += 1 + length
+
+        operations.append(job_ops)
+        plans.append(job_plans)
+
+    return AppInstance(num_jobs, num_machines, operations, plans)
+
+
+def read_app(loc: Path) -> Model:
+    """
+    Reads an APP instance file and returns the corresponding model.
+
+    Jobs with a single process plan consist of mandatory tasks in plan order.
+    For jobs with multiple plans, each plan is a chain of optional tasks
+    between a dummy source and sink task on the dummy machine 0, like the
+    OR-branches of an And/Or instance. The flow constraints ensure that
+    exactly one plan is selected. Each plan gets its own tasks, since an
+    operation can have different predecessors and successors in different
+    plans; an operation that occurs in several plans thus has a task, with
+    the operation's modes, per plan.
+    """
+    instance = parse_app(loc)
+    m = Model()
+
+    jobs = [m.add_job() for _ in range(instance.num_jobs)]
+    resources = [m.add_machine() for _ in range(instance.num_machines + 1)]
+
+    for job_idx, (ops, plans) in enumerate(
+        zip(instance.operations, instance.plans)
+    ):
+        job = jobs[job_idx]
+
+        if len(plans) == 1:
+            tasks = []
+            for op in plans[0]:
+                task = m.add_task(job=job, name=f"{job_idx}_0_{op}")
+                for resource_idx, duration in ops[op]:
+                    m.add_mode(task, resources[resource_idx], duration)
+
+                tasks.append(task)
+
+            for frm, to in zip(tasks[:-1], tasks[1:]):
+                m.add_end_before_start(frm, to)
+
+            continue
+
+        source = m.add_task(job=job, name=f"{job_idx}_source")
+        m.add_mode(source, resources[0], 0)
+        m.mark_flow_source(source)
+
+        sink = m.add_task(job=job, name=f"{job_idx}_sink", optional=True)
+        m.add_mode(sink, resources[0], 0)
+        m.mark_flow_sink(sink)
+
+        for plan_idx, plan in enumerate(plans):
+            tasks = [source]
+            for op in plan:
+                name = f"{job_idx}_{plan_idx}_{op}"
+                task = m.add_task(job=job, name=name, optional=True)
+                for resource_idx, duration in ops[op]:
+                    m.add_mode(task, resources[resource_idx], duration)
+
+                m.mark_flow_intermediate(task)
+                tasks.append(task)
+
+            tasks.append(sink)
+
+            for frm, to in zip(tasks[:-1], tasks[1:]):
+                m.add_end_before_start(frm, to)
+
+    return m
@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from pyjobshop import Model
+
+Alternatives = list[tuple[int, int]]
+
+
+@dataclass
+class DdoInstance:
+    """
+    The (SDST-)FJSP instance data as read by the rel and blk DDO solvers.
+
+    Parameters
+    ----------
+    num_machines
+        The number of machines.
+    operations
+        For each job, the list of operations, each operation consisting of a
+        list of (machine, duration) alternatives. Machines are 0-indexed.
+    setup_times
+        Optional array of shape (num_machines, num_ops, num_ops) with the
+        setup time on each machine from one operation to the next. The
+        operations are numbered by job, in processing order.
+    """
+
+    num_machines: int
+    operations: list[list[Alternatives]]
+    setup_times: Optional[np.ndarray] = None
+
+
+def parse_ddo_fjsp(loc: Path) -> DdoInstance:
+    """
+    Parses an instance file the way ``read_fjsp`` of the rel and blk DDO
+    solvers does. A header with only the number of jobs marks the matrix
+    format: then come the number of machines, the number of operations per
+    job, and a row of durations per operation, with zero for machines that
+    cannot process it. Otherwise the file is in the FJSPLIB format, with one
+    line per job and 1-indexed machines. Either format may be followed by a
+    block of setup times, with a row per machine and operation and a column
+    per operation; the block is ignored if its shape does not fit.
+    """
+    with open(loc) as fh:
+        lines = [line.split() for line in fh if line.strip()]
+
+    header = lines[0]
+    operations: list[list[Alternatives]] = []
+
+    if len(header) == 1:
+        num_machines = int(lines[1][0])
+        ops_per_job = list(map(int, lines[2]))
+        rows = iter(lines[3 : 3 + sum(ops_per_job)])
+        pos = 3 + sum(ops_per_job)
+
+        for num_ops in ops_per_job:
+            job_ops = []
+            for row in (next(rows) for _ in range(num_ops)):
+                durations = list(map(int, row))
+                job_ops.append(
+                    [(mach, dur) for mach, dur in enumerate(durations) if dur]
+                )
+
+            operations.append(job_ops)
+    else:
+        num_jobs, num_machines = int(header[0]), int(header[1])
+        pos = 1 + num_jobs
+
+        for line in lines[1:pos]:
+            tokens = list(map(int, line))
+            idx, job_ops = 1, []
+
+            for _ in range(tokens[0]):
+                num_alts = tokens[idx]
+                alts = tokens[idx + 1 : idx + 1 + 2 * num_alts]
+                pairs = zip(alts[::2], alts[1::2])
+                job_ops.append([(mach - 1, dur) for mach, dur in pairs])
+                idx += 1 + 2 * num_alts
+
+            operations.append(job_ops)
+
+    num_ops = sum(len(ops) for ops in operations)
+    block = lines[pos : pos + num_machines * num_ops]
+    setup_times = None
+
+    if len(block) == num_machines * num_ops and all(
+        len(row) == num_ops for row in block
+    ):
+        setup_times = np.array(block, dtype=int).reshape(
+            num_machines, num_ops, num_ops
+        )
+
+    return DdoInstance(num_machines, operations, setup_times)
+
+
+def read_ddo_fjsp(loc: Path) -> Model:
+    """
+    Reads an instance file in the input format of the rel and blk DDO
+    solvers, see :func:`parse_ddo_fjsp`, and returns the corresponding
+    model. Machine ``k`` of the solvers is resource ``k``, and the tasks of
+    each job are in processing order, so that the solvers' decisions can be
+    converted with ``ddo_solution.to_solution``.
+    """
+    instance = parse_ddo_fjsp(loc)
+    m = Model()
+
+    machines = [m.add_machine() for _ in range(instance.num_machines)]
+    tasks = []
+
+    for job_idx, ops in enumerate(instance.operations):
+        job = m.add_job()
+        job_tasks = []
+
+        for op_idx, alts in enumerate(ops):
+            task = m.add_task(job=job, name=f"{job_idx}_{op_idx}")
+            for machine, duration in alts:
+                m.add_mode(task, machines[machine], duration)
+
+            job_tasks.append(task)
+
+        for frm, to in zip(job_tasks[:-1], job_tasks[1:]):
+            m.add_end_before_start(frm, to)
+
+        tasks += job_tasks
+
+    if instance.setup_times is not None:
+        for idx, frm, to in np.argwhere(instance.setup_times > 0):
+            duration = int(instance.setup_times[idx, frm, to])
+            m.add_setup_time(machines[idx], tasks[frm], tasks[to], duration)
+
+    return m
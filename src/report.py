@@ -0,0 +1,278 @@
+import argparse
+import csv
+from pathlib import Path
+
+import numpy as np
+
+from artifacts import read_records
+from benchmark import tabulate
+from performance import (
+    pad_traces,
+    performance_profile,
+    primal_integrals,
+    time_to_first_feasible,
+    time_to_within,
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="""
+        Reports anytime performance metrics of benchmark runs: the primal
+        integral, the time to the first feasible solution, the time to reach
+        within x% of the best known solution, and Dolan-Moré performance
+        profiles comparing the configurations.
+        """
+    )
+
+    msg = """
+    Run directories (or runs.jsonl files) written by the benchmark script with
+    --artifact_dir, one per configuration. Each is labelled by its name.
+    """
+    parser.add_argument("runs", nargs="+", type=Path, help=msg)
+
+    msg = """
+    Time horizon of the primal integral, in seconds. Default the largest time
+    limit of the runs, or their largest run-time if there is no time limit.
+    """
+    parser.add_argument("--time_limit", type=float, help=msg)
+
+    msg = "Gaps (in percent) to report the time to reach. Default 1 and 5."
+    parser.add_argument(
+        "--within", type=float, nargs="+", default=[1, 5], help=msg
+    )
+
+    msg = """
+    Metric of the performance profiles: the primal integral, the time to the
+    first feasible solution (ttff), or the time to within the first --within
+    gap of the best known solution (ttw).
+    """
+    parser.add_argument(
+        "--profile_metric",
+        choices=["primal_integral", "ttff", "ttw"],
+        default="primal_integral",
+        help=msg,
+    )
+
+    msg = "Largest performance ratio of the profiles. Default 10."
+    parser.add_argument("--max_tau", type=float, default=10, help=msg)
+
+    msg = """
+    Directory to write runs.csv (metrics per run), summary.csv (averages per
+    configuration) and profile.csv (performance profiles) to.
+    """
+    parser.add_argument("--out_dir", type=Path, help=msg)
+
+    msg = "File to save a plot of the performance profiles to."
+    parser.add_argument("--plot", type=Path, help=msg)
+
+    return parser.parse_args()
+
+
+def load_runs(locs: list[Path]) -> dict[str, list[dict]]:
+    """
+    Loads the run records of each configuration. Repeated runs of the same
+    instance are kept; only the last record of an interrupted and resumed
+    run is kept.
+    """
+    runs = {}
+
+    for loc in locs:
+        label = loc.name if loc.is_dir() else loc.parent.name
+        records = {}
+
+        for record in read_records(loc):
+            records[record["path"], record.get("repeat", 0)] = record
+
+        runs[label] = list(records.values())
+
+    return runs
+
+
+def compute_metrics(
+    runs: dict[str, list[dict]], horizon: float, within: list[float]
+) -> dict[str, dict[str, np.ndarray]]:
+    """
+    Computes the metrics of each run, per configuration. The best known
+    objective value of an instance is the best value found by any run.
+    Instances are identified by their path, since instances of different
+    problem variants may share a name.
+    """
+    best: dict[str, float] = {}
+    for records in runs.values():
+        for record in records:
+            objective = record["objective"]
+            best[record["path"]] = min(
+                best.get(record["path"], np.inf), objective
+            )
+
+    metrics = {}
+    for label, records in runs.items():
+        times, objs = pad_traces(
+            [record["trace"] for record in records],
+            [record["objective"] for record in records],
+            [record["runtime"] for record in records],
+        )
+        bests = np.array([best[record["path"]] for record in records])
+
+        metrics[label] = {
+            "primal_integral": primal_integrals(times, objs, bests, horizon),
+            "ttff": time_to_first_feasible(times, objs),
+            **{
+                f"ttw_{pct:g}": time_to_within(times, objs, bests, pct)
+                for pct in within
+            },
+        }
+
+    return metrics
+
+
+def profile_costs(
+    runs: dict[str, list[dict]], metrics: dict, name: str
+) -> tuple[list[str], np.ndarray]:
+    """
+    Returns the paths of the instances solved by all configurations, and
+    the array of shape (number of instances, number of configurations) with
+    the mean value of the given metric of each configuration on each
+    instance.
+    """
+    labels = list(runs)
+    per_label = []
+
+    for label in labels:
+        values: dict[str, list[float]] = {}
+        for record, value in zip(runs[label], metrics[label][name]):
+            values.setdefault(record["path"], []).append(value)
+
+        per_label.append({key: np.mean(val) for key, val in values.items()})
+
+    instances = sorted(set.intersection(*(set(vals) for vals in per_label)))
+    costs = np.array(
+        [[vals[inst] for vals in per_label] for inst in instances]
+    )
+
+    return instances, costs.reshape(len(instances), len(labels))
+
+
+def _finite_mean(values: np.ndarray) -> float:
+    finite = values[np.isfinite(values)]
+    return finite.mean() if finite.size else np.nan
+
+
+def write_csv(loc: Path, headers: list[str], rows: list):
+    with open(loc, "w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(headers)
+        writer.writerows(rows)
+
+
+def plot_profiles(loc: Path, taus: np.ndarray, profiles, labels, metric):
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(6, 4))
+
+    for idx, label in enumerate(labels):
+        ax.step(taus, profiles[:, idx], where="post", label=label)
+
+    ax.set_xscale("log")
+    ax.set_xlim(1, taus[-1])
+    ax.set_ylim(0, 1.02)
+    ax.set_xlabel("Performance ratio")
+    ax.set_ylabel("Fraction of instances")
+    ax.set_title(f"Performance profiles ({metric})")
+    ax.legend()
+
+    fig.tight_layout()
+    fig.savefig(loc)
+    plt.close(fig)
+
+
+def main():
+    args = parse_args()
+    runs = load_runs(args.runs)
+    records = [record for records in runs.values() for record in records]
+
+    if not records:
+        raise ValueError("No run records found.")
+
+    horizon = args.time_limit
+    if horizon is None:
+        horizon = max(record["time_limit"] for record in records)
+    if horizon == float("inf"):
+        horizon = max(record["runtime"] for record in records)
+
+    metrics = compute_metrics(runs, horizon, args.within)
+    ttw_names = [f"ttw_{pct:g}" for pct in args.within]
+
+    headers = ["Config", "Runs", "Primal int.", "TTFF (s)", "Feasible"]
+    headers += [f"TTW {pct:g}% (s)" for pct in args.within]
+    summary = []
+
+    for label, values in metrics.items():
+        row = [
+            label,
+            len(runs[label]),
+            round(values["primal_integral"].mean(), 4),
+            round(_finite_mean(values["ttff"]), 2),
+            int(np.isfinite(values["ttff"]).sum()),
+        ]
+        row += [round(_finite_mean(values[name]), 2) for name in ttw_names]
+        summary.append(row)
+
+    print(f"\nPrimal integrals with a time horizon of {horizon:.2f}s.")
+    print("Times to reach a gap are averaged over the runs that reached it.")
+    print("\n", tabulate(headers, summary), "\n", sep="")
+
+    metric = args.profile_metric
+    if metric == "ttw":
+        metric = ttw_names[0]
+
+    instances, costs = profile_costs(runs, metrics, metric)
+    taus = np.geomspace(1, args.max_tau, 100)
+    profiles = performance_profile(costs, taus)
+    labels = list(runs)
+
+    print(f"Performance profile ({metric}, {len(instances)} instances):")
+    for tau in [1, 2, 5, args.max_tau]:
+        values = performance_profile(costs, [tau])[0]
+        fractions = ", ".join(
+            f"{label} {value:.2f}" for label, value in zip(labels, values)
+        )
+        print(f"  tau = {tau:g}: {fractions}")
+
+    if args.out_dir is not None:
+        args.out_dir.mkdir(parents=True, exist_ok=True)
+
+        run_headers = ["config", "instance", "path", "status", "objective"]
+        run_headers += ["lower_bound", "runtime", "primal_integral", "ttff"]
+        run_headers += ttw_names
+        rows = [
+            [
+                label,
+                record["instance"],
+                record["path"],
+                record["status"],
+                record["objective"],
+                record["lower_bound"],
+                record["runtime"],
+                *(metrics[label][name][idx] for name in run_headers[7:]),
+            ]
+            for label, records in runs.items()
+            for idx, record in enumerate(records)
+        ]
+        write_csv(args.out_dir / "runs.csv", run_headers, rows)
+        write_csv(args.out_dir / "summary.csv", headers, summary)
+        write_csv(
+            args.out_dir / "profile.csv",
+            ["tau", *labels],
+            [[tau, *values] for tau, values in zip(taus, profiles)],
+        )
+        print(f"\nWrote metrics to {args.out_dir}.")
+
+    if args.plot is not None:
+        plot_profiles(args.plot, taus, profiles, labels, metric)
+        print(f"Saved performance profiles to {args.plot}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,111 +1,25 @@
-import re
 import os
 import json
 import numpy as np
 import pandas as pd
 
+from artifacts import RUNS_FILE, read_records, record_stats
+from logparse import parse_dir, parse_file
+
 def parse_log(file_path):
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-    text = ''.join(lines)
-
-    # a) Number of variables and constraints
-    vc_match = re.search(r'Minimization problem - (\d+) variables, (\d+) constraints', text)
-    if not vc_match:
-        raise ValueError("Could not find variables and constraints line")
-    variables = int(vc_match.group(1))
-    constraints = int(vc_match.group(2))
-
-    # b) TimeLimit value
-    tl_match = re.search(r'TimeLimit\s*=\s*(\d+)', text)
-    time_limit = int(tl_match.group(1)) if tl_match else None
-
-    # c) Workers value
-    w_match = re.search(r'Workers\s*=\s*(\d+)', text)
-    workers = int(w_match.group(1)) if w_match else None
-
-    # f) Complete solve time
-    st_match = re.search(r'Time spent in solve\s*:\s*([\d\.]+)s', text)
-    solve_time = float(st_match.group(1)) if st_match else None
-
-    # e) Final solve status
-    if "Search completed" in text:
-        status = "Optimal"
-    elif "Search terminated" in text:
-        status = "Feasible"
-    else:
-        status = "Unknown"
-
-    # d) Progress values
-    progress = []
-    current_lb = None
-    latest_time = None
-
-    for line in lines:
-        line = line.strip()
-        # New bound entries
-        if line.startswith('+ New bound is'):
-            lb_match = re.search(r'\+ New bound is (\d+)', line)
-            lb = int(lb_match.group(1))
-
-            # Check for gap in same line
-            gap_match = re.search(r'gap is ([\d\.]+)%', line)
-            if current_lb is None:
-                # first new bound: fixed values
-                time_point = 0.01
-                ub = 1_000_000
-                gap = 100.0
-            else:
-                # use latest_time for timestamp
-                time_point = latest_time
-                gap = float(gap_match.group(1)) if gap_match else None
-                # UB = LB / (1 - gap)
-                if gap is not None:
-                    ub = int(round(lb / (1 - gap/100)))
-                else:
-                    ub = None
-
-            current_lb = lb
-            progress.append({
-                'time': time_point,
-                'bound': lb,
-                'best': ub,
-                'gap': gap
-            })
-
-        # Star lines with best, gap, time
-        elif line.startswith('*'):
-            # e.g. *  588   33   0.09s  1  (gap is 31.46%)
-            parts = re.split(r'\s+', line)
-            # parts[1]: best, parts[3]: time, last part contains gap
-            try:
-                best = float(parts[1])
-                time_str = parts[3]
-                time_point = float(time_str.rstrip('s'))
-            except (IndexError, ValueError):
-                continue
-            gap_match = re.search(r'gap is ([\d\.]+)%', line)
-            gap = float(gap_match.group(1)) if gap_match else None
-
-            # Update latest time
-            latest_time = time_point
-
-            progress.append({
-                'time': time_point,
-                'bound': current_lb,
-                'best': best,
-                'gap': gap
-            })
-
-    return {
-        'variables': variables,
-        'constraints': constraints,
-        'time_limit': time_limit,
-        'workers': workers,
-        'status': status,
-        'solve_time': solve_time,
-        'progress': progress
-    }
+    return parse_file(file_path, "cpo")[0].stats()
+
+def load_stats(ds_path):
+    """
+    Returns the statistics of all runs in the given run directory. Uses the
+    structured run records if the directory has them, and otherwise parses
+    the raw solver logs.
+    """
+    runs_loc = os.path.join(ds_path, RUNS_FILE)
+    if os.path.exists(runs_loc):
+        return [record_stats(record) for record in read_records(runs_loc)]
+
+    return [run.stats() for run in parse_dir(ds_path, "cpo")]
 
 def summarize_benchmarks(root_dir):
     rows = []
@@ -125,12 +39,9 @@ def summarize_benchmarks(root_dir):
     count_opt = 0
     count_feas= 0
 
-    # iterate over each instance file
-    for fname in os.listdir(ds_path):
-        if not fname.endswith('.log'):
-            continue
+    # iterate over each instance run
+    for stats in load_stats(ds_path):
         total += 1
-        stats = parse_log(os.path.join(ds_path, fname))
 
         if stats['status'] == 'Optimal':
             count_opt += 1
@@ -1,105 +1,25 @@
-import re
 import os
 import json
 import numpy as np
 import pandas as pd
 
+from artifacts import RUNS_FILE, read_records, record_stats
+from logparse import parse_dir, parse_file
+
 def parse_log(file_path):
-    with open(file_path, 'r') as f:
-        text = f.read()
-
-    # Ensure each record starts on a new line
-    text = re.sub(r'(?<!\n)#', r'\n#', text)
-    lines = text.splitlines()
-
-    # a) Variables and constraints (from '#Model')
-    variables = constraints = None
-    for line in lines:
-        if line.startswith('#Model'):
-            m = re.search(r'var:\d+/(\d+)\s+constraints:\d+/(\d+)', line)
-            if m:
-                variables = int(m.group(1))
-                constraints = int(m.group(2))
-                break
-
-    # b) max_time_in_seconds
-    m = re.search(r'max_time_in_seconds:\s*(\d+)', text)
-    time_limit = int(m.group(1)) if m else None
-
-    # c) num_workers
-    m = re.search(r'num_workers:\s*(\d+)', text)
-    workers = int(m.group(1)) if m else None
-
-    # e) status
-    status = None
-    m = re.search(r'status:\s*(OPTIMAL|FEASIBLE)', text)
-    if m:
-        status = m.group(1).capitalize()
-
-    # f) walltime
-    m = re.search(r'walltime:\s*([0-9\.]+)', text)
-    walltime = float(m.group(1)) if m else None
-
-    # d) Progress values
-    progress = []
-    first_bound = True
-
-    for line in lines:
-        line = line.strip()
-        # LB updates ('#Bound')
-        if line.startswith('#Bound'):
-            m = re.search(r'#Bound\s+([0-9\.]+)s\s+best:([^\s]+)\s+next:\[([^,]+),([^\]]+)\]', line)
-            if not m:
-                continue
-            time_pt = float(m.group(1))
-            best_str = m.group(2)
-            lb = float(m.group(3))
-            if first_bound or best_str == 'inf':
-                ub = 1_000_000.0
-                gap = 100.0
-                first_bound = False
-            else:
-                ub = float(best_str)
-                gap = (1 - lb/ub) * 100
-
-            progress.append({'time': time_pt, 'bound': lb, 'best': ub, 'gap': gap})
-
-        # UB improvements ('#<iter>')
-        elif re.match(r'#\d+', line):
-            m = re.search(r'#\d+\s+([0-9\.]+)s\s+best:([0-9\.]+)\s+next:\[([^,]+),', line)
-            if not m:
-                continue
-            time_pt = float(m.group(1))
-            ub = float(m.group(2))
-            try:
-                lb = float(m.group(3))
-            except ValueError:
-                continue
-            gap = (1 - lb/ub) * 100
-            progress.append({'time': time_pt, 'bound': lb, 'best': ub, 'gap': gap})
-
-    # g) Final objective and best_bound as last progress entry
-    obj = None
-    bb = None
-    mo = re.search(r'objective:\s*([0-9\.e\+]+)', text)
-    mb = re.search(r'best_bound:\s*([0-9\.e\+]+)', text)
-    if mo:
-        obj = float(mo.group(1))
-    if mb:
-        bb = float(mb.group(1))
-    if obj is not None and bb is not None and walltime is not None:
-        final_gap = (1 - bb/obj) * 100 if obj != 0 else 0.0
-        progress.append({'time': walltime, 'bound': bb, 'best': obj, 'gap': final_gap})
-
-    return {
-        'variables': variables,
-        'constraints': constraints,
-        'time_limit': time_limit,
-        'workers': workers,
-        'status': status,
-        'solve_time': walltime,
-        'progress': progress
-    }
+    return parse_file(file_path, "cpsat")[0].stats()
+
+def load_stats(ds_path):
+    """
+    Returns the statistics of all runs in the given run directory. Uses the
+    structured run records if the directory has them, and otherwise parses
+    the raw solver logs.
+    """
+    runs_loc = os.path.join(ds_path, RUNS_FILE)
+    if os.path.exists(runs_loc):
+        return [record_stats(record) for record in read_records(runs_loc)]
+
+    return [run.stats() for run in parse_dir(ds_path, "cpsat")]
 
 def summarize_benchmarks(root_dir):
     rows = []
@@ -119,12 +39,9 @@ def summarize_benchmarks(root_dir):
     count_opt = 0
     count_feas= 0
 
-    # iterate over each instance file
-    for fname in os.listdir(ds_path):
-        if not fname.endswith('.log'):
-            continue
+    # iterate over each instance run
+    for stats in load_stats(ds_path):
         total += 1
-        stats = parse_log(os.path.join(ds_path, fname))
 
         if stats['status'] == 'Optimal':
             count_opt += 1
@@ -0,0 +1,148 @@
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Callable, Hashable, Iterator, Optional, TypeVar
+
+from pyjobshop.stats import InstanceStats
+
+Item = TypeVar("Item", bound=Hashable)
+
+
+def estimate_cost(stats: InstanceStats) -> float:
+    """
+    Estimates the relative cost of solving an instance from its statistics.
+    The size of the CP models grows with the number of modes (one optional
+    interval variable each), and the sequencing constraints of setup times
+    grow with the number of eligible task pairs per machine.
+    """
+    setups = stats.setup_density * stats.num_modes * stats.modes_per_task
+    return stats.num_modes + setups + stats.num_or_branches
+
+
+def allocate_workers(
+    costs: list[float], num_cores: int, max_workers: int
+) -> list[int]:
+    """
+    Allocates worker threads to instances in proportion to their costs, with
+    at least one and at most ``max_workers`` workers per instance. No single
+    instance gets more workers than the core budget.
+
+    Parameters
+    ----------
+    costs
+        Estimated cost of each instance.
+    num_cores
+        Total number of cores available to run instances in parallel.
+    max_workers
+        Maximum number of workers per instance.
+
+    Returns
+    -------
+    list[int]
+        The number of workers of each instance.
+    """
+    if not costs:
+        return []
+
+    max_cost = max(max(costs), 1e-9)
+    upper = min(max_workers, num_cores)
+    return [
+        min(upper, max(1, round(max_workers * cost / max_cost)))
+        for cost in costs
+    ]
+
+
+def schedule(
+    executor: Executor,
+    func: Callable[..., object],
+    items: list[Item],
+    costs: list[float],
+    num_cores: int,
+    max_workers: int,
+    max_parallel: Optional[int] = None,
+    dynamic: bool = True,
+    cpus: Optional[list[int]] = None,
+) -> Iterator[tuple[Item, Future]]:
+    """
+    Runs ``func(item, num_workers=...)`` for each item on the executor,
+    longest (most expensive) items first, without using more than ``num_cores``
+    worker threads at once. An item is submitted as soon as enough cores are
+    free. Yields each item and its future as soon as it completes.
+
+    Parameters
+    ----------
+    executor
+        Executor to run the items on. It should have at least as many
+        workers as items that can run in parallel.
+    func
+        Function to call with each item and, as keyword argument, its number
+        of workers.
+    items
+        Items to run.
+    costs
+        Estimated cost of each item, see :func:`estimate_cost`.
+    num_cores
+        Total number of cores (worker threads) that may be used at once.
+    max_workers
+        Maximum number of worker threads per item.
+    max_parallel
+        Maximum number of items that may run in parallel. Default is no
+        limit other than the core budget.
+    dynamic
+        Whether to allocate workers in proportion to the item costs, and to
+        give the remaining items the free cores once the queue runs dry. If
+        ``False``, each item gets ``max_workers`` workers. Default ``True``.
+    cpus
+        CPUs to pin the items to. If given, each item is assigned a set of
+        CPUs, disjoint from those of the other running items, that is passed
+        to ``func`` as the ``cpus`` keyword argument. The core budget is then
+        at most the number of CPUs. Default is no pinning.
+    """
+    idle: list[int] = []
+    if cpus is not None:
+        num_cores = min(num_cores, len(cpus))
+        idle = sorted(cpus)[:num_cores]
+
+    order = sorted(range(len(items)), key=lambda idx: -costs[idx])
+    if dynamic:
+        workers = allocate_workers(costs, num_cores, max_workers)
+    else:
+        workers = [min(max_workers, num_cores)] * len(items)
+
+    max_parallel = max_parallel or num_cores
+    running: dict[Future, tuple[Item, int, list[int]]] = {}
+    free = num_cores
+
+    while order or running:
+        while order and len(running) < max_parallel:
+            idx = order[0]
+            num_workers = workers[idx]
+
+            if dynamic:
+                # At the end of the sweep, fewer items than cores remain,
+                # so the remaining items may as well use the free cores.
+                share = free // min(len(order), max_parallel - len(running))
+                num_workers = min(max_workers, max(num_workers, share))
+
+            if num_workers > free:
+                if running:  # wait for cores to become free
+                    break
+
+                num_workers = free
+
+            order.pop(0)
+            kwargs: dict = {"num_workers": num_workers}
+            assigned: list[int] = []
+
+            if cpus is not None:
+                assigned, idle = idle[:num_workers], idle[num_workers:]
+                kwargs["cpus"] = assigned
+
+            future = executor.submit(func, items[idx], **kwargs)
+            running[future] = (items[idx], num_workers, assigned)
+            free -= num_workers
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            item, num_workers, assigned = running.pop(future)
+            free += num_workers
+            idle = sorted(idle + assigned)
+            yield item, future
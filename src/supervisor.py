@@ -0,0 +1,166 @@
+import multiprocessing
+import os
+import resource
+import signal
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from pyjobshop.Result import SolveStatus
+
+_CONTEXT = multiprocessing.get_context("forkserver")
+
+
+@dataclass
+class Failure:
+    """
+    Describes a supervised run that did not return a result.
+
+    Parameters
+    ----------
+    status
+        Either ``SolveStatus.KILLED`` if the run exceeded its wall-clock
+        limit or crashed, or ``SolveStatus.OUT_OF_MEMORY`` if it exceeded its
+        memory limit.
+    runtime
+        Wall-clock time until the run stopped, in seconds.
+    reason
+        Human-readable description of why the run stopped.
+    """
+
+    status: SolveStatus
+    runtime: float
+    reason: str
+
+
+def _target(conn, func, args, kwargs, memory_limit):
+    # Start a new session, so that the process and all processes it starts,
+    # e.g., the CP Optimizer solver, can be killed together as a group.
+    os.setsid()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+
+    if memory_limit is not None:
+        # RLIMIT_RSS is not enforced by Linux, so the address space is
+        # limited instead. Allocations beyond the limit fail. Only the soft
+        # limit is set, so that it can be lifted again to report the error.
+        limit = memory_limit * 1024**2
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+    try:
+        conn.send((True, func(*args, **kwargs)))
+    except MemoryError:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+        conn.send((False, None))
+    except BaseException as exc:
+        try:
+            conn.send((False, exc))
+        except Exception:  # exception cannot be pickled
+            conn.send((False, RuntimeError(repr(exc))))
+    finally:
+        conn.close()
+
+
+def _kill(process, sig: int):
+    """
+    Sends the signal to the process group of the given process, which must
+    not have been joined yet. Falls back to signalling the process itself if
+    it has not yet started its own session.
+    """
+    try:
+        os.killpg(process.pid, sig)
+    except ProcessLookupError:  # no such group
+        if process.exitcode is None:
+            os.kill(process.pid, sig)
+
+
+def run_supervised(
+    func: Callable,
+    *args,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+    **kwargs,
+) -> Any:
+    """
+    Calls ``func(*args, **kwargs)`` in a separate process, which is killed if
+    it runs longer than ``timeout`` seconds, together with all processes it
+    started. The process may allocate at most
+    ``memory_limit`` megabytes. Returns the function's return value, or a
+    :class:`Failure` if the process was killed, ran out of memory or crashed.
+    Other exceptions raised by ``func`` are re-raised.
+
+    Parameters
+    ----------
+    func
+        Function to call. It, its arguments and its return value must be
+        picklable.
+    args
+        Positional arguments passed to ``func``.
+    timeout
+        Wall-clock limit in seconds. Default is no limit.
+    memory_limit
+        Limit on the address space of the process, in megabytes. Default is
+        no limit.
+    kwargs
+        Keyword arguments passed to ``func``.
+    """
+    recv, send = _CONTEXT.Pipe(duplex=False)
+    process = _CONTEXT.Process(
+        target=_target,
+        args=(send, func, args, kwargs, memory_limit),
+        daemon=True,
+    )
+
+    start = perf_counter()
+    process.start()
+    send.close()
+
+    # Receive before joining: a large return value fills the pipe buffer,
+    # and the process only exits after it has been read.
+    finished = recv.poll(timeout)
+    message = None
+    if finished:
+        try:
+            message = recv.recv()
+        except EOFError:  # died without sending anything
+            pass
+
+    if not finished:
+        _kill(process, signal.SIGTERM)
+
+        # Wait on the sentinel rather than joining, so that the process is
+        # not reaped and its pid (the group id) cannot be reused before the
+        # rest of the group is killed, e.g., processes that ignored SIGTERM.
+        wait([process.sentinel], 5)
+        _kill(process, signal.SIGKILL)
+
+    process.join()
+    recv.close()
+    runtime = perf_counter() - start
+
+    if not finished:
+        reason = f"Exceeded wall-clock limit of {timeout:.0f}s."
+        return Failure(SolveStatus.KILLED, runtime, reason)
+
+    if message is not None:
+        success, value = message
+        if success:
+            return value
+
+        if value is not None:
+            raise value
+
+        reason = "Raised MemoryError."
+        return Failure(SolveStatus.OUT_OF_MEMORY, runtime, reason)
+
+    # The process died without sending a result. Failed allocations in the
+    # native solver code abort the process, and the kernel's OOM killer
+    # sends SIGKILL.
+    code = process.exitcode
+    signals = (-signal.SIGABRT, -signal.SIGSEGV, -signal.SIGKILL)
+    if (memory_limit is not None and code in signals) or code == -signal.SIGKILL:
+        reason = f"Exited with code {code}, likely out of memory."
+        return Failure(SolveStatus.OUT_OF_MEMORY, runtime, reason)
+
+    return Failure(SolveStatus.KILLED, runtime, f"Exited with code {code}.")
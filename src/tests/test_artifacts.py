@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import pytest
+from numpy.testing import assert_equal
+
+from artifacts import run_dir
+
+
+@pytest.mark.parametrize(
+    ("time_limit", "name"),
+    [(60, "ortools_8_60"), (60.0, "ortools_8_60"), (2.5, "ortools_8_2.5")],
+)
+def test_run_dir(time_limit: float, name: str):
+    """
+    Tests that the run directory is named after the solver, the number of
+    workers and the time limit.
+    """
+    assert_equal(run_dir(Path("out"), "ortools", 8, time_limit).name, name)
+
+
+def test_run_dir_no_time_limit():
+    """
+    Tests that the default time limit of the benchmark script, which is no
+    limit, gives a valid run directory.
+    """
+    loc = run_dir(Path("out"), "ortools", 8, float("inf"))
+    assert_equal(loc.name, "ortools_8_inf")
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from numpy.testing import assert_, assert_equal
+
+from ddo_export import layout, process_plans
+from ddo_solution import read_instance, read_solution
+from read.read import ProblemVariant
+
+INSTANCES = Path(__file__).parents[2] / "instances"
+
+
+def test_read_instance_default_reads_like_ddo():
+    """
+    Tests that, without a problem variant, FJSPLIB instances are read like
+    the DDO solvers do: Brandimarte's Mk01 has 55 operations.
+    """
+    data = read_instance(INSTANCES / "FJSP/Brandimarte/022.fjs")
+    assert_equal(data.num_tasks, 55)
+
+
+def test_read_solution_app(tmp_path: Path):
+    """
+    Tests that the machines of a DDO solution of an APP instance are mapped
+    to the resources of the instance, which start with a dummy machine.
+    """
+    data = read_instance(INSTANCES / "APP/003.fjs", ProblemVariant.APP)
+    jobs, machines = layout(data, ProblemVariant.APP, original=True)
+
+    # Schedules the first process plan of each job, on the first machine
+    # of each task.
+    first_modes = {}
+    for mode in data.modes:
+        first_modes.setdefault(mode.task, mode)
+
+    decisions = []
+    for plans in process_plans(data):
+        job = jobs.index(plans[0])
+        for idx, task in enumerate(plans[0]):
+            mode = first_modes[task]
+            machine = machines.index(mode.resources[0])
+            decisions.append((mode.duration, job, idx, machine))
+
+    loc = tmp_path / "003.sol"
+    loc.write_text(f"{decisions}\n")
+    solution = read_solution(loc, data, ProblemVariant.APP)
+
+    for plans in process_plans(data):
+        for task in plans[0]:
+            sched = solution.tasks[task]
+            assert_(sched.present)
+            assert_equal(sched.resources, first_modes[task].resources)
@@ -0,0 +1,59 @@
+import gzip
+
+from numpy.testing import assert_equal
+
+from logparse import LogTail
+
+LINES = [
+    b"#Bound 0.50s best:inf next:[10,20]\n",
+    b"#1 1.00s best:30 next:[12,30]\n",
+    b"#2 2.00s best:25 next:[14,25]\n",
+]
+
+
+def test_log_tail_leaves_partial_line(tmp_path):
+    """
+    Tests that a partially written last line is only parsed once it is
+    complete, or when the tail is final.
+    """
+    loc = tmp_path / "run.log"
+    loc.write_bytes(LINES[0] + LINES[1][:10])
+
+    tail = LogTail(loc, "cpsat")
+    assert_equal(len(tail.poll()[0].trace), 1)
+    assert_equal(tail.offset, len(LINES[0]))
+
+    with open(loc, "ab") as fh:
+        fh.write(LINES[1][10:] + LINES[2][:-1])
+
+    assert_equal(len(tail.poll()[0].trace), 2)
+    assert_equal(len(tail.poll(final=True)[0].trace), 3)
+    assert_equal(tail.offset, sum(map(len, LINES)) - 1)
+
+
+def test_log_tail_gzip(tmp_path):
+    """
+    Tests that a gzip-compressed log is tailed while it is being written or
+    appended to, and that a new tail can start from the offset of an earlier
+    one.
+    """
+    loc = tmp_path / "run.log.gz"
+
+    with gzip.open(loc, "wb") as fh:
+        fh.write(LINES[0] + LINES[1][:10])
+        fh.flush()
+
+        tail = LogTail(loc, "cpsat")
+        assert_equal(len(tail.poll()[0].trace), 1)
+
+        fh.write(LINES[1][10:])
+        fh.flush()
+        assert_equal(len(tail.poll()[0].trace), 2)
+
+    with gzip.open(loc, "ab") as fh:  # appends a new gzip member
+        fh.write(LINES[2])
+
+    assert_equal(len(tail.poll(final=True)[0].trace), 3)
+
+    tail = LogTail(loc, "cpsat", offset=len(LINES[0]))
+    assert_equal(len(tail.poll(final=True)[0].trace), 2)
@@ -0,0 +1,49 @@
+import subprocess
+import time
+from pathlib import Path
+
+from numpy.testing import assert_, assert_equal
+
+from pyjobshop.Result import SolveStatus
+from supervisor import Failure, run_supervised
+
+
+def _start_child_and_hang(pid_file: Path):
+    # Starts a child process that ignores SIGTERM and would outlive this one.
+    child = subprocess.Popen(["sh", "-c", "trap '' TERM; sleep 30"])
+    pid_file.write_text(str(child.pid))
+    time.sleep(30)
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat") as fh:
+            return fh.read().split(")")[-1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def test_returns_value():
+    """
+    Tests that the return value of the supervised function is returned.
+    """
+    assert_equal(run_supervised(divmod, 7, 2, timeout=30), (3, 1))
+
+
+def test_timeout_kills_child_processes(tmp_path):
+    """
+    Tests that the processes started by the supervised function are killed
+    with it when the wall-clock limit is exceeded.
+    """
+    pid_file = tmp_path / "pid"
+    result = run_supervised(_start_child_and_hang, pid_file, timeout=2)
+
+    assert_(isinstance(result, Failure))
+    assert_equal(result.status, SolveStatus.KILLED)
+
+    pid = int(pid_file.read_text())
+    deadline = time.perf_counter() + 5
+    while _is_running(pid) and time.perf_counter() < deadline:
+        time.sleep(0.1)
+
+    assert_(not _is_running(pid))
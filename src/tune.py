@@ -0,0 +1,393 @@
+import argparse
+import glob
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from multiprocessing import cpu_count
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import tomli
+from tqdm import tqdm
+
+from benchmark import _cost, _run_supervised, tabulate
+from performance import final_gap, pad_traces, primal_integrals
+from pyjobshop import Result
+from read.read import ProblemVariant
+from scheduler import schedule
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Tunes solver parameters on a set of instances."
+    )
+
+    msg = "Location of the instance files (glob patterns are expanded)."
+    parser.add_argument("instances", nargs="+", type=Path, help=msg)
+
+    msg = """
+    Parameter space file (in TOML format). Each key is a solver parameter,
+    with as value either a list of values to choose from, a table with low
+    and high bounds (and optionally log = true) to sample from uniformly, or
+    a fixed value. For example: search_branching = [0, 1, 2, 3] or
+    linearization_level = { low = 0, high = 2 }.
+    """
+    parser.add_argument("--space", type=Path, required=True, help=msg)
+
+    msg = "File to write the best parameter configuration to (TOML)."
+    parser.add_argument("--out", type=Path, required=True, help=msg)
+
+    msg = "Scheduling problem variant to read."
+    parser.add_argument(
+        "--problem_variant",
+        type=ProblemVariant,
+        choices=[f.value for f in ProblemVariant],
+        help=msg,
+    )
+
+    msg = "Solver to tune."
+    parser.add_argument(
+        "--solver",
+        type=str,
+        default="ortools",
+        choices=["ortools", "cpoptimizer"],
+        help=msg,
+    )
+
+    msg = """
+    Search method: random search evaluates all configurations with the full
+    time limit; successive halving evaluates them with increasing time
+    limits, keeping the best 1/eta of the configurations after each round.
+    """
+    parser.add_argument(
+        "--method", choices=["random", "halving"], default="halving", help=msg
+    )
+
+    msg = "Number of configurations to sample. Default 16."
+    parser.add_argument("--num_configs", type=int, default=16, help=msg)
+
+    msg = "Reduction factor of successive halving. Default 3."
+    parser.add_argument("--eta", type=int, default=3, help=msg)
+
+    msg = """
+    Time limit per instance, in seconds. This is the time limit of the last
+    round of successive halving.
+    """
+    parser.add_argument("--time_limit", type=float, default=60, help=msg)
+
+    msg = """
+    Score of a configuration, averaged over the instances: the primal
+    integral (normalised by the time limit), or the final optimality gap.
+    Smaller is better.
+    """
+    parser.add_argument(
+        "--score",
+        choices=["primal_integral", "gap"],
+        default="primal_integral",
+        help=msg,
+    )
+
+    msg = "Number of instances to sample from the given instances."
+    parser.add_argument("--num_instances", type=int, help=msg)
+
+    msg = "Seed for sampling configurations and instances. Default 1."
+    parser.add_argument("--seed", type=int, default=1, help=msg)
+
+    msg = "Number of worker threads per instance. Default all CPU cores."
+    parser.add_argument("--num_workers_per_instance", type=int, help=msg)
+
+    msg = "Number of instances to solve in parallel. Default 1."
+    parser.add_argument(
+        "--num_parallel_instances", type=int, default=1, help=msg
+    )
+
+    msg = "Whether to pin each instance to its own set of CPUs."
+    parser.add_argument("--pin_cpus", action="store_true", help=msg)
+
+    msg = """
+    Parameter configuration file (in TOML format) with fixed parameters that
+    are updated with the sampled parameters.
+    """
+    parser.add_argument("--config_loc", type=Path, help=msg)
+
+    msg = "Seconds after the time limit after which a run is killed."
+    parser.add_argument("--grace_time", type=float, default=60, help=msg)
+
+    msg = "Memory limit of each run, in megabytes. Default no limit."
+    parser.add_argument("--memory_limit", type=int, help=msg)
+
+    msg = "Directory of the parsed-instance cache."
+    parser.add_argument("--cache_dir", type=Path, help=msg)
+
+    return parser.parse_args()
+
+
+def sample_config(space: dict, rng: random.Random) -> dict:
+    """
+    Samples a parameter configuration from the given parameter space.
+    """
+    config = {}
+
+    for name, domain in space.items():
+        if isinstance(domain, list):
+            config[name] = rng.choice(domain)
+        elif isinstance(domain, dict):
+            low, high = domain["low"], domain["high"]
+
+            if domain.get("log", False):
+                value = math.exp(rng.uniform(math.log(low), math.log(high)))
+            else:
+                value = rng.uniform(low, high)
+
+            if isinstance(low, int) and isinstance(high, int):
+                value = round(value)
+
+            config[name] = value
+        else:
+            config[name] = domain
+
+    return config
+
+
+def sample_configs(space: dict, num_configs: int, rng: random.Random):
+    """
+    Samples up to ``num_configs`` distinct configurations. Fewer are returned
+    if the space is too small.
+    """
+    configs: list[dict] = []
+    seen = set()
+
+    for _ in range(100 * num_configs):
+        if len(configs) == num_configs:
+            break
+
+        config = sample_config(space, rng)
+        key = json.dumps(config, sort_keys=True)
+
+        if key not in seen:
+            seen.add(key)
+            configs.append(config)
+
+    return configs
+
+
+def _format_value(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    elif isinstance(value, str):
+        return json.dumps(value)
+    elif isinstance(value, float) and math.isinf(value):
+        return "inf" if value > 0 else "-inf"
+    elif isinstance(value, list):
+        return "[" + ", ".join(_format_value(val) for val in value) + "]"
+
+    return repr(value)
+
+
+def write_toml(loc: Path, config: dict, comments: list[str]):
+    """
+    Writes the (flat) parameter configuration to the given TOML file.
+    """
+    with open(loc, "w") as fh:
+        for comment in comments:
+            fh.write(f"# {comment}\n")
+
+        for name, value in config.items():
+            fh.write(f"{name} = {_format_value(value)}\n")
+
+
+def _evaluate(
+    item: tuple[int, Path],
+    configs: list[dict],
+    num_workers: int,
+    cpus: Optional[list[int]] = None,
+    **kwargs,
+) -> Optional[Result]:
+    idx, instance_loc = item
+    params = dict(configs[idx])
+
+    if "num_workers" in params:
+        # Tuned number of workers; the scheduler reserved the maximum.
+        num_workers = params.pop("num_workers")
+        cpus = cpus[:num_workers] if cpus is not None else None
+
+    output = _run_supervised(
+        (instance_loc, 0),
+        num_workers=num_workers,
+        cpus=cpus,
+        params=params,
+        **kwargs,
+    )
+
+    return output[0] if output is not None else None
+
+
+def evaluate(
+    configs: list[dict],
+    instances: list[Path],
+    costs: dict[Path, float],
+    time_limit: float,
+    args,
+) -> list[list[Optional[Result]]]:
+    """
+    Solves each instance with each configuration, in parallel, and returns
+    the results per configuration and instance.
+    """
+    max_workers = args.num_workers_per_instance or cpu_count()
+    num_workers = args.space_workers or max_workers
+    cpus = sorted(os.sched_getaffinity(0)) if args.pin_cpus else None
+
+    func = partial(
+        _evaluate,
+        configs=configs,
+        timeout=time_limit + args.grace_time,
+        memory_limit=args.memory_limit,
+        problem_variant=args.problem_variant,
+        solver=args.solver,
+        time_limit=time_limit,
+        display=False,
+        num_workers_per_instance=max_workers,
+        config_loc=args.config_loc,
+        sol_dir=None,
+        permutation_max_jobs=None,
+        cache_dir=args.cache_dir,
+    )
+    items = [
+        (idx, loc) for idx in range(len(configs)) for loc in instances
+    ]
+    results: list[list[Optional[Result]]] = [
+        [None] * len(instances) for _ in configs
+    ]
+
+    with ThreadPoolExecutor(args.num_parallel_instances) as executor:
+        done = schedule(
+            executor,
+            func,
+            items,
+            [costs[loc] for _, loc in items],
+            args.num_parallel_instances * num_workers,
+            num_workers,
+            args.num_parallel_instances,
+            dynamic=False,
+            cpus=cpus,
+        )
+
+        for (idx, loc), future in tqdm(done, total=len(items), unit="run"):
+            results[idx][instances.index(loc)] = future.result()
+
+    return results
+
+
+def score(
+    results: list[list[Optional[Result]]], metric: str, time_limit: float
+) -> np.ndarray:
+    """
+    Scores each configuration by its average primal integral or final gap
+    over the instances. The primal integral is computed with respect to the
+    best objective value found by any configuration.
+    """
+    scores = np.ones((len(results), len(results[0])))
+
+    for col in range(scores.shape[1]):
+        rows = [row for row in range(len(results)) if results[row][col]]
+        column = [results[row][col] for row in rows]
+
+        if metric == "primal_integral":
+            times, objs = pad_traces(
+                [res.trace for res in column],
+                [res.objective for res in column],
+                [res.runtime for res in column],
+            )
+            best = np.full(len(rows), objs.min(initial=np.inf))
+            scores[rows, col] = primal_integrals(times, objs, best, time_limit)
+        else:
+            scores[rows, col] = [
+                final_gap(res.objective, res.lower_bound) for res in column
+            ]
+
+    return scores.mean(axis=1)
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+
+    instances = []
+    for pattern in args.instances:
+        matches = sorted(glob.glob(str(pattern)))
+        instances.extend(map(Path, matches) if matches else [pattern])
+
+    instances = [loc for loc in instances if loc.is_file()]
+    if args.num_instances and args.num_instances < len(instances):
+        instances = sorted(rng.sample(instances, args.num_instances))
+
+    with open(args.space, "rb") as fh:
+        space = tomli.load(fh)
+
+    # Reserve enough workers per run for the largest tuned worker count.
+    domain = space.get("num_workers")
+    if isinstance(domain, dict):
+        args.space_workers = domain["high"]
+    elif isinstance(domain, list):
+        args.space_workers = max(domain)
+    else:
+        args.space_workers = domain
+
+    configs = sample_configs(space, args.num_configs, rng)
+    if args.method == "random":
+        num_rounds = 1
+    else:
+        # The last round compares the best eta (or more) configurations.
+        num_rounds = math.floor(math.log(len(configs), args.eta) + 1e-9)
+        num_rounds = max(num_rounds, 1)
+
+    with ProcessPoolExecutor(args.num_parallel_instances) as executor:
+        func = partial(
+            _cost,
+            problem_variant=args.problem_variant,
+            cache_dir=args.cache_dir,
+        )
+        costs = dict(zip(instances, executor.map(func, instances)))
+
+    candidates = list(range(len(configs)))
+    for round_idx in range(num_rounds):
+        time_limit = args.time_limit / args.eta ** (num_rounds - round_idx - 1)
+        print(
+            f"\nRound {round_idx + 1}/{num_rounds}: {len(candidates)} "
+            f"configurations, time limit {time_limit:.2f}s."
+        )
+
+        round_configs = [configs[idx] for idx in candidates]
+        results = evaluate(round_configs, instances, costs, time_limit, args)
+        scores = score(results, args.score, time_limit)
+
+        order = np.argsort(scores, kind="stable")
+        rows = [
+            [candidates[idx], f"{scores[idx]:.4f}", str(round_configs[idx])]
+            for idx in order
+        ]
+        print(tabulate(["Config", "Score", "Parameters"], rows))
+
+        num_keep = max(1, len(candidates) // args.eta)
+        if round_idx == num_rounds - 1:
+            num_keep = 1
+
+        best_score = scores[order[0]]
+        candidates = [candidates[idx] for idx in order[:num_keep]]
+
+    best = configs[candidates[0]]
+    comments = [
+        f"Tuned {args.solver} parameters ({args.method}, {args.score}).",
+        f"Score {best_score:.4f} on {len(instances)} instances with a time "
+        f"limit of {args.time_limit}s.",
+    ]
+    write_toml(args.out, best, comments)
+    print(f"\nBest configuration written to {args.out}.")
+
+
+if __name__ == "__main__":
+    main()